@@ -16,15 +16,19 @@ from .memory_client import (
     SessionState,
 )
 from .rag_client import (
+    RAG_EXECUTOR,
     RAGClient,
     RAGDocument,
     RAGOperationResult,
     RAGSearchResult,
 )
 from .retry import (
+    GOOGLE_API_RETRIES,
     RETRYABLE_EXCEPTIONS,
     RetryConfig,
     default_retry_config,
+    execute_write,
+    is_rate_limit_error,
     retry_on_network_error,
     with_retry,
 )
@@ -48,14 +52,18 @@ __all__ = [
     "MemoryOperationResult",
     "SessionState",
     # RAG
+    "RAG_EXECUTOR",
     "RAGClient",
     "RAGDocument",
     "RAGOperationResult",
     "RAGSearchResult",
     # Retry
+    "GOOGLE_API_RETRIES",
     "RETRYABLE_EXCEPTIONS",
     "RetryConfig",
     "default_retry_config",
+    "execute_write",
+    "is_rate_limit_error",
     "retry_on_network_error",
     "with_retry",
 ]
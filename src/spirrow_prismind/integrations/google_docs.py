@@ -8,6 +8,8 @@ from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from .retry import GOOGLE_API_RETRIES, execute_write
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +31,58 @@ class DocumentContent:
     url: str
 
 
+def _heading_and_text_requests(
+    text: str,
+    heading: Optional[str] = None,
+    index: int = 1,
+) -> list[dict]:
+    """Build batchUpdate requests that insert a HEADING_1 and text.
+
+    Args:
+        text: Text to insert after the heading
+        heading: Optional heading to insert first
+        index: Position to insert at
+
+    Returns:
+        List of Docs API requests (empty if there is nothing to insert)
+    """
+    requests = []
+
+    if heading:
+        heading_text = heading if heading.endswith("\n") else heading + "\n"
+        requests.extend([
+            {
+                "insertText": {
+                    "location": {"index": index},
+                    "text": heading_text,
+                }
+            },
+            {
+                "updateParagraphStyle": {
+                    "range": {
+                        "startIndex": index,
+                        "endIndex": index + len(heading_text),
+                    },
+                    "paragraphStyle": {
+                        "namedStyleType": "HEADING_1",
+                    },
+                    "fields": "namedStyleType",
+                }
+            },
+        ])
+        index += len(heading_text)
+
+    if text:
+        requests.append({
+            "insertText": {
+                "location": {"index": index},
+                "text": text,
+            }
+        })
+
+    return requests
+
+
 class GoogleDocsClient:
     """Client for Google Docs API operations."""
 
@@ -63,7 +117,9 @@ class GoogleDocsClient:
             HttpError: If the API request fails
         """
         try:
-            doc = self.service.documents().create(body={"title": title}).execute()
+            doc = execute_write(self.service.documents().create(
+                body={"title": title}
+            ))
             
             doc_id = doc.get("documentId", "")
             return DocumentInfo(
@@ -89,7 +145,9 @@ class GoogleDocsClient:
             HttpError: If the API request fails
         """
         try:
-            doc = self.service.documents().get(documentId=doc_id).execute()
+            doc = self.service.documents().get(
+                documentId=doc_id
+            ).execute(num_retries=GOOGLE_API_RETRIES)
             
             # Extract text from the document body
             body_text = self._extract_text(doc.get("body", {}))
@@ -163,10 +221,10 @@ class GoogleDocsClient:
                 }
             ]
             
-            self.service.documents().batchUpdate(
+            execute_write(self.service.documents().batchUpdate(
                 documentId=doc_id,
                 body={"requests": requests},
-            ).execute()
+            ))
             
             return True
         except HttpError as e:
@@ -188,7 +246,9 @@ class GoogleDocsClient:
         """
         try:
             # Get current document to find end index
-            doc = self.service.documents().get(documentId=doc_id).execute()
+            doc = self.service.documents().get(
+                documentId=doc_id
+            ).execute(num_retries=GOOGLE_API_RETRIES)
             body = doc.get("body", {})
             content = body.get("content", [])
             
@@ -218,7 +278,9 @@ class GoogleDocsClient:
         """
         try:
             # Get current document
-            doc = self.service.documents().get(documentId=doc_id).execute()
+            doc = self.service.documents().get(
+                documentId=doc_id
+            ).execute(num_retries=GOOGLE_API_RETRIES)
             body = doc.get("body", {})
             content = body.get("content", [])
             
@@ -249,10 +311,10 @@ class GoogleDocsClient:
             })
             
             if requests:
-                self.service.documents().batchUpdate(
+                execute_write(self.service.documents().batchUpdate(
                     documentId=doc_id,
                     body={"requests": requests},
-                ).execute()
+                ))
             
             return True
         except HttpError as e:
@@ -325,16 +387,49 @@ class GoogleDocsClient:
                 },
             ]
             
-            self.service.documents().batchUpdate(
+            execute_write(self.service.documents().batchUpdate(
                 documentId=doc_id,
                 body={"requests": requests},
-            ).execute()
+            ))
             
             return True
         except HttpError as e:
             logger.error(f"Failed to insert heading in document '{doc_id}': {e}")
             raise
 
+    def insert_heading_and_text(
+        self,
+        doc_id: str,
+        heading: str,
+        text: str,
+    ) -> bool:
+        """Insert a HEADING_1 followed by text at the start of the document.
+
+        Both are written with a single batchUpdate request.
+
+        Args:
+            doc_id: The document ID
+            heading: Heading text
+            text: Text to insert after the heading
+
+        Returns:
+            True if successful
+
+        Raises:
+            HttpError: If the API request fails
+        """
+        try:
+            requests = _heading_and_text_requests(text, heading)
+            if requests:
+                execute_write(self.service.documents().batchUpdate(
+                    documentId=doc_id,
+                    body={"requests": requests},
+                ))
+            return True
+        except HttpError as e:
+            logger.error(f"Failed to insert heading and text in document '{doc_id}': {e}")
+            raise
+
     def create_document_with_content(
         self,
         title: str,
@@ -358,48 +453,13 @@ class GoogleDocsClient:
         doc_info = self.create_document(title)
         
         try:
-            requests = []
-            current_index = 1
-            
-            # Add heading if provided
-            if heading:
-                heading_text = heading if heading.endswith("\n") else heading + "\n"
-                requests.extend([
-                    {
-                        "insertText": {
-                            "location": {"index": current_index},
-                            "text": heading_text,
-                        }
-                    },
-                    {
-                        "updateParagraphStyle": {
-                            "range": {
-                                "startIndex": current_index,
-                                "endIndex": current_index + len(heading_text),
-                            },
-                            "paragraphStyle": {
-                                "namedStyleType": "HEADING_1",
-                            },
-                            "fields": "namedStyleType",
-                        }
-                    },
-                ])
-                current_index += len(heading_text)
-            
-            # Add content
-            if content:
-                requests.append({
-                    "insertText": {
-                        "location": {"index": current_index},
-                        "text": content,
-                    }
-                })
+            requests = _heading_and_text_requests(content, heading)
             
             if requests:
-                self.service.documents().batchUpdate(
+                execute_write(self.service.documents().batchUpdate(
                     documentId=doc_info.doc_id,
                     body={"requests": requests},
-                ).execute()
+                ))
             
             return doc_info
         except HttpError as e:
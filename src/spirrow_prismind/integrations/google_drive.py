@@ -9,6 +9,8 @@ from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from .retry import GOOGLE_API_RETRIES, execute_write
+
 logger = logging.getLogger(__name__)
 
 
@@ -98,10 +100,10 @@ class GoogleDriveClient:
             if parent_id:
                 file_metadata["parents"] = [parent_id]
             
-            folder = self.service.files().create(
+            folder = execute_write(self.service.files().create(
                 body=file_metadata,
                 fields="id, name, mimeType, parents, webViewLink, createdTime, modifiedTime",
-            ).execute()
+            ))
             
             return FileInfo(
                 file_id=folder.get("id", ""),
@@ -132,7 +134,7 @@ class GoogleDriveClient:
             file = self.service.files().get(
                 fileId=file_id,
                 fields="id, name, mimeType, parents, webViewLink, createdTime, modifiedTime",
-            ).execute()
+            ).execute(num_retries=GOOGLE_API_RETRIES)
             
             return FileInfo(
                 file_id=file.get("id", ""),
@@ -171,7 +173,7 @@ class GoogleDriveClient:
             file = self.service.files().get(
                 fileId=file_id,
                 fields="parents",
-            ).execute()
+            ).execute(num_retries=GOOGLE_API_RETRIES)
             
             previous_parents = ",".join(file.get("parents", []))
             
@@ -185,7 +187,9 @@ class GoogleDriveClient:
             if remove_from_current and previous_parents:
                 update_params["removeParents"] = previous_parents
             
-            updated_file = self.service.files().update(**update_params).execute()
+            updated_file = self.service.files().update(
+                **update_params
+            ).execute(num_retries=GOOGLE_API_RETRIES)
             
             return FileInfo(
                 file_id=updated_file.get("id", ""),
@@ -218,7 +222,7 @@ class GoogleDriveClient:
                 fileId=file_id,
                 body={"name": new_name},
                 fields="id, name, mimeType, parents, webViewLink, createdTime, modifiedTime",
-            ).execute()
+            ).execute(num_retries=GOOGLE_API_RETRIES)
             
             return FileInfo(
                 file_id=updated_file.get("id", ""),
@@ -264,7 +268,7 @@ class GoogleDriveClient:
                 q=query,
                 fields="files(id, name, mimeType, parents, webViewLink, createdTime, modifiedTime)",
                 orderBy="folder, name",
-            ).execute()
+            ).execute(num_retries=GOOGLE_API_RETRIES)
             
             files = []
             subfolders = []
@@ -324,7 +328,7 @@ class GoogleDriveClient:
                 q=query,
                 fields="files(id, name, mimeType, parents, webViewLink, createdTime, modifiedTime)",
                 orderBy="createdTime",  # Oldest first
-            ).execute()
+            ).execute(num_retries=GOOGLE_API_RETRIES)
 
             folders = []
             for item in results.get("files", []):
@@ -481,12 +485,12 @@ class GoogleDriveClient:
         """
         try:
             if permanent:
-                self.service.files().delete(fileId=file_id).execute()
+                execute_write(self.service.files().delete(fileId=file_id))
             else:
                 self.service.files().update(
                     fileId=file_id,
                     body={"trashed": True},
-                ).execute()
+                ).execute(num_retries=GOOGLE_API_RETRIES)
             
             return True
         except HttpError as e:
@@ -531,7 +535,7 @@ class GoogleDriveClient:
                 fields="files(id, name, mimeType, parents, webViewLink, createdTime, modifiedTime)",
                 pageSize=max_results,
                 orderBy="modifiedTime desc",
-            ).execute()
+            ).execute(num_retries=GOOGLE_API_RETRIES)
             
             return [
                 FileInfo(
@@ -600,10 +604,10 @@ class GoogleDriveClient:
             if parent_id:
                 file_metadata["parents"] = [parent_id]
 
-            spreadsheet = self.service.files().create(
+            spreadsheet = execute_write(self.service.files().create(
                 body=file_metadata,
                 fields="id, name, mimeType, parents, webViewLink, createdTime, modifiedTime",
-            ).execute()
+            ))
 
             logger.info(f"Created spreadsheet '{name}' with ID: {spreadsheet.get('id')}")
 
@@ -646,10 +650,10 @@ class GoogleDriveClient:
             if parent_id:
                 file_metadata["parents"] = [parent_id]
 
-            document = self.service.files().create(
+            document = execute_write(self.service.files().create(
                 body=file_metadata,
                 fields="id, name, mimeType, parents, webViewLink, createdTime, modifiedTime",
-            ).execute()
+            ))
 
             logger.info(f"Created document '{name}' with ID: {document.get('id')}")
 
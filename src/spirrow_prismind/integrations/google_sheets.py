@@ -1,21 +1,26 @@
 """Google Sheets API integration."""
 
 import os
+import time
 from pathlib import Path
 from typing import Any, Optional
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from .retry import GOOGLE_API_RETRIES, execute_write
+
 # If modifying these scopes, delete the token.json file.
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/drive.readonly",
 ]
 
+# How long sheet names seen in a spreadsheet are trusted by sheet_exists (seconds)
+SHEET_NAMES_CACHE_TTL = 300.0
+
 
 class GoogleSheetsClient:
     """Client for Google Sheets API operations."""
@@ -39,6 +44,9 @@ class GoogleSheetsClient:
         )
         self.token_path = token_path or os.getenv("GOOGLE_TOKEN_PATH", "token.json")
         self._service = None
+        # spreadsheet_id -> (fetched_at, sheet names). Only used to answer
+        # sheet_exists positively; a missing name is always re-checked.
+        self._sheet_names: dict[str, tuple[float, frozenset[str]]] = {}
 
     def _get_credentials(self) -> Credentials:
         """Get or refresh Google API credentials."""
@@ -65,6 +73,8 @@ class GoogleSheetsClient:
                         f"Credentials file not found: {self.credentials_path}. "
                         "Please download from Google Cloud Console."
                     )
+                from google_auth_oauthlib.flow import InstalledAppFlow
+
                 flow = InstalledAppFlow.from_client_secrets_file(
                     self.credentials_path, SCOPES
                 )
@@ -103,7 +113,7 @@ class GoogleSheetsClient:
                 self.service.spreadsheets()
                 .values()
                 .get(spreadsheetId=spreadsheet_id, range=range_name)
-                .execute()
+                .execute(num_retries=GOOGLE_API_RETRIES)
             )
             return result.get("values", [])
         except HttpError as e:
@@ -138,12 +148,46 @@ class GoogleSheetsClient:
                     valueInputOption=value_input_option,
                     body=body,
                 )
-                .execute()
+                .execute(num_retries=GOOGLE_API_RETRIES)
             )
             return result
         except HttpError as e:
             raise RuntimeError(f"Failed to update sheet values: {e}")
 
+    def batch_update_sheet_values(
+        self,
+        spreadsheet_id: str,
+        data: dict[str, list[list[Any]]],
+        value_input_option: str = "USER_ENTERED",
+    ) -> dict:
+        """Update several spreadsheet ranges in a single request.
+
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            data: Mapping of A1 range to the 2D list of values to write there
+            value_input_option: How to interpret input (USER_ENTERED or RAW)
+
+        Returns:
+            API response
+        """
+        try:
+            body = {
+                "valueInputOption": value_input_option,
+                "data": [
+                    {"range": range_name, "values": values}
+                    for range_name, values in data.items()
+                ],
+            }
+            result = (
+                self.service.spreadsheets()
+                .values()
+                .batchUpdate(spreadsheetId=spreadsheet_id, body=body)
+                .execute(num_retries=GOOGLE_API_RETRIES)
+            )
+            return result
+        except HttpError as e:
+            raise RuntimeError(f"Failed to batch update sheet values: {e}")
+
     def append_sheet_values(
         self,
         spreadsheet_id: str,
@@ -164,7 +208,7 @@ class GoogleSheetsClient:
         """
         try:
             body = {"values": values}
-            result = (
+            result = execute_write(
                 self.service.spreadsheets()
                 .values()
                 .append(
@@ -174,7 +218,6 @@ class GoogleSheetsClient:
                     insertDataOption="INSERT_ROWS",
                     body=body,
                 )
-                .execute()
             )
             return result
         except HttpError as e:
@@ -199,7 +242,7 @@ class GoogleSheetsClient:
                 self.service.spreadsheets()
                 .values()
                 .clear(spreadsheetId=spreadsheet_id, range=range_name)
-                .execute()
+                .execute(num_retries=GOOGLE_API_RETRIES)
             )
             return result
         except HttpError as e:
@@ -218,7 +261,7 @@ class GoogleSheetsClient:
             result = (
                 self.service.spreadsheets()
                 .get(spreadsheetId=spreadsheet_id)
-                .execute()
+                .execute(num_retries=GOOGLE_API_RETRIES)
             )
             return result
         except HttpError as e:
@@ -246,11 +289,20 @@ class GoogleSheetsClient:
         Returns:
             True if the sheet exists, False otherwise
         """
+        cached = self._sheet_names.get(spreadsheet_id)
+        if (
+            cached is not None
+            and sheet_name in cached[1]
+            and time.monotonic() - cached[0] < SHEET_NAMES_CACHE_TTL
+        ):
+            return True
+
         try:
-            sheet_names = self.get_sheet_names(spreadsheet_id)
-            return sheet_name in sheet_names
+            sheet_names = frozenset(self.get_sheet_names(spreadsheet_id))
         except Exception:
             return False
+        self._sheet_names[spreadsheet_id] = (time.monotonic(), sheet_names)
+        return sheet_name in sheet_names
 
     def find_row_by_value(
         self,
@@ -328,10 +380,9 @@ class GoogleSheetsClient:
                     }
                 ]
             }
-            result = (
+            result = execute_write(
                 self.service.spreadsheets()
                 .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-                .execute()
             )
             return result
         except HttpError as e:
@@ -373,8 +424,10 @@ class GoogleSheetsClient:
             result = (
                 self.service.spreadsheets()
                 .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
-                .execute()
+                .execute(num_retries=GOOGLE_API_RETRIES)
             )
+            # The old name is gone; forget the cached names
+            self._sheet_names.pop(spreadsheet_id, None)
             return result
         except HttpError as e:
             raise RuntimeError(f"Failed to rename sheet to '{new_name}': {e}")
@@ -411,6 +464,7 @@ class GoogleSheetsClient:
 
         This handles the case where a new spreadsheet has a default "Sheet1"
         that needs to be renamed to "Summary", and other sheets need to be created.
+        The rename and both creations are sent as one batchUpdate request.
 
         Args:
             spreadsheet_id: The spreadsheet ID
@@ -424,23 +478,31 @@ class GoogleSheetsClient:
         Raises:
             RuntimeError: If initialization fails
         """
-        created_sheets = []
-
         try:
-            # Get the first sheet ID and rename it to Summary
+            # Rename the first sheet to Summary and create Progress/Catalog
             first_sheet_id = self.get_first_sheet_id(spreadsheet_id)
-            self.rename_sheet(spreadsheet_id, first_sheet_id, summary_name)
-            created_sheets.append(summary_name)
-
-            # Create Progress sheet
-            self.create_sheet(spreadsheet_id, progress_name)
-            created_sheets.append(progress_name)
-
-            # Create Catalog sheet
-            self.create_sheet(spreadsheet_id, catalog_name)
-            created_sheets.append(catalog_name)
+            request_body = {
+                "requests": [
+                    {
+                        "updateSheetProperties": {
+                            "properties": {
+                                "sheetId": first_sheet_id,
+                                "title": summary_name,
+                            },
+                            "fields": "title",
+                        }
+                    },
+                    {"addSheet": {"properties": {"title": progress_name}}},
+                    {"addSheet": {"properties": {"title": catalog_name}}},
+                ]
+            }
+            execute_write(
+                self.service.spreadsheets()
+                .batchUpdate(spreadsheetId=spreadsheet_id, body=request_body)
+            )
+            self._sheet_names.pop(spreadsheet_id, None)
 
-            return created_sheets
+            return [summary_name, progress_name, catalog_name]
         except Exception as e:
             raise RuntimeError(f"Failed to initialize project sheets: {e}")
 
@@ -463,7 +525,7 @@ class GoogleSheetsClient:
                 self.service.spreadsheets()
                 .values()
                 .get(spreadsheetId=spreadsheet_id, range=range_name)
-                .execute()
+                .execute(num_retries=GOOGLE_API_RETRIES)
             )
             return result
         except HttpError as e:
@@ -581,10 +643,10 @@ class GoogleSheetsClient:
                 ]
             }
 
-            self.service.spreadsheets().batchUpdate(
+            execute_write(self.service.spreadsheets().batchUpdate(
                 spreadsheetId=spreadsheet_id,
                 body=request_body,
-            ).execute()
+            ))
 
             return True
         except HttpError as e:
@@ -1,6 +1,7 @@
 """RAG (Retrieval-Augmented Generation) server client for knowledge management."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
@@ -11,6 +12,12 @@ from .retry import RETRYABLE_EXCEPTIONS, with_retry
 
 logger = logging.getLogger(__name__)
 
+# Runs RAG requests that overlap with Google API calls. The Google clients share
+# one httplib2 connection that is not thread-safe, so they stay on the caller's
+# thread. Having a single worker also runs RAG tasks in submission order. The
+# server shuts it down when it stops.
+RAG_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prismind-rag")
+
 # Collection name for document types (separate from main knowledge collection)
 DOCUMENT_TYPES_COLLECTION = "document_types"
 
@@ -18,8 +25,11 @@ DOCUMENT_TYPES_COLLECTION = "document_types"
 # BGE-M3 embeddings typically return scores in 0.5-0.7 range for semantic matches
 DEFAULT_SIMILARITY_THRESHOLD = 0.45
 
+# Number of catalog entries read per /get request when paging
+CATALOG_PAGE_SIZE = 500
+
 
-@dataclass
+@dataclass(slots=True)
 class RAGDocument:
     """A document stored in RAG."""
     doc_id: str
@@ -28,7 +38,7 @@ class RAGDocument:
     score: float = 0.0  # Relevance score from search
 
 
-@dataclass
+@dataclass(slots=True)
 class RAGSearchResult:
     """Result of a RAG search."""
     success: bool
@@ -37,7 +47,7 @@ class RAGSearchResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RAGOperationResult:
     """Result of a RAG operation (add/update/delete)."""
     success: bool
@@ -45,6 +55,35 @@ class RAGOperationResult:
     message: str = ""
 
 
+def _catalog_entry_id(project: str, doc_id: str) -> str:
+    """Get the RAG document ID of a catalog entry."""
+    return f"catalog:{project}:{doc_id}"
+
+
+def _catalog_record(
+    doc_id: str,
+    name: str,
+    doc_type: str,
+    project: str,
+    phase_task: str,
+    metadata: dict[str, Any],
+) -> tuple[str, str, dict[str, Any]]:
+    """Build the RAG document ID, content and metadata of a catalog entry."""
+    catalog_id = _catalog_entry_id(project, doc_id)
+    content = f"{name} {doc_type} {phase_task}"
+    full_metadata = {
+        "type": "catalog",
+        "doc_id": doc_id,
+        "name": name,
+        "doc_type": doc_type,
+        "project": project,
+        "phase_task": phase_task,
+        "updated_at": datetime.now().isoformat(),
+        **metadata,
+    }
+    return catalog_id, content, full_metadata
+
+
 class RAGClient:
     """Client for RAG server operations.
 
@@ -246,6 +285,69 @@ class RAGClient:
                 message=str(e),
             )
 
+    def upsert_documents(
+        self,
+        doc_ids: list[str],
+        contents: list[str],
+        metadatas: list[dict[str, Any]],
+        collection: Optional[str] = None,
+    ) -> RAGOperationResult:
+        """Add or replace several documents with batched requests.
+
+        Like upsert_document, the existing IDs are looked up first, but with
+        one /get for the whole batch. Existing documents are then written with
+        one /update and new ones with one /add, so the server embeds each group
+        at once instead of document by document.
+
+        Args:
+            doc_ids: Unique document IDs
+            contents: Document contents (used for embedding)
+            metadatas: Metadata for each document
+            collection: Collection name (uses default if None)
+
+        Returns:
+            RAGOperationResult
+        """
+        if not doc_ids:
+            return RAGOperationResult(success=True, message="No documents to upsert")
+
+        try:
+            collection_name = collection or self.collection_name
+            logger.debug(f"Upserting {len(doc_ids)} documents to RAG: collection={collection_name}")
+            result = self._make_request(
+                "POST",
+                f"/api/v1/collections/{collection_name}/get",
+                json_data={"ids": doc_ids, "include": ["metadatas"]},
+            )
+            existing = set(result.get("ids", []))
+
+            updates: dict[str, list] = {"ids": [], "documents": [], "metadatas": []}
+            additions: dict[str, list] = {"ids": [], "documents": [], "metadatas": []}
+            for doc_id, content, metadata in zip(doc_ids, contents, metadatas):
+                batch = updates if doc_id in existing else additions
+                batch["ids"].append(doc_id)
+                batch["documents"].append(content)
+                batch["metadatas"].append(metadata)
+
+            for endpoint, batch in (("update", updates), ("add", additions)):
+                if batch["ids"]:
+                    self._make_request(
+                        "POST",
+                        f"/api/v1/collections/{collection_name}/{endpoint}",
+                        json_data=batch,
+                    )
+
+            return RAGOperationResult(
+                success=True,
+                message=f"{len(doc_ids)} documents upserted successfully",
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to upsert {len(doc_ids)} documents: {e}")
+            return RAGOperationResult(
+                success=False,
+                message=str(e),
+            )
+
     def update_document(
         self,
         doc_id: str,
@@ -360,6 +462,42 @@ class RAGClient:
                 message=str(e),
             )
 
+    def delete_documents(
+        self,
+        doc_ids: list[str],
+        collection: Optional[str] = None,
+    ) -> RAGOperationResult:
+        """Delete several documents from the RAG store in a single request.
+
+        Args:
+            doc_ids: Document IDs to delete
+            collection: Collection name (uses default if None)
+
+        Returns:
+            RAGOperationResult
+        """
+        if not doc_ids:
+            return RAGOperationResult(success=True, message="No documents to delete")
+
+        try:
+            collection_name = collection or self.collection_name
+            self._make_request(
+                "POST",
+                f"/api/v1/collections/{collection_name}/delete",
+                json_data={"ids": doc_ids},
+            )
+
+            return RAGOperationResult(
+                success=True,
+                message=f"{len(doc_ids)} documents deleted successfully",
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to delete {len(doc_ids)} documents: {e}")
+            return RAGOperationResult(
+                success=False,
+                message=str(e),
+            )
+
     def get_document(
         self,
         doc_id: str,
@@ -775,28 +913,39 @@ class RAGClient:
         Returns:
             RAGOperationResult
         """
-        catalog_id = f"catalog:{project}:{doc_id}"
-        content = f"{name} {doc_type} {phase_task}"
-        
-        full_metadata = {
-            "type": "catalog",
-            "doc_id": doc_id,
-            "name": name,
-            "doc_type": doc_type,
-            "project": project,
-            "phase_task": phase_task,
-            "updated_at": datetime.now().isoformat(),
-            **metadata,
-        }
-        
+        catalog_id, content, full_metadata = _catalog_record(
+            doc_id, name, doc_type, project, phase_task, metadata
+        )
         return self.add_document(catalog_id, content, full_metadata)
 
+    def upsert_catalog_entries(self, entries: list[dict[str, Any]]) -> RAGOperationResult:
+        """Add or replace several catalog entries in a single request.
+
+        Args:
+            entries: Catalog entries, each a dict with the keyword arguments
+                of add_catalog_entry (doc_id, name, doc_type, project,
+                phase_task, metadata)
+
+        Returns:
+            RAGOperationResult
+        """
+        records = [_catalog_record(**entry) for entry in entries]
+        return self.upsert_documents(
+            doc_ids=[record[0] for record in records],
+            contents=[record[1] for record in records],
+            metadatas=[record[2] for record in records],
+        )
+
     def search_catalog(
         self,
         query: str,
         project: Optional[str] = None,
         doc_type: Optional[str] = None,
         phase_task: Optional[str] = None,
+        phase_tasks: Optional[list[str]] = None,
+        feature: Optional[str] = None,
+        reference_timing: Optional[str] = None,
+        status: Optional[str] = None,
         n_results: int = 10,
     ) -> RAGSearchResult:
         """Search the catalog.
@@ -806,6 +955,10 @@ class RAGClient:
             project: Filter by project
             doc_type: Filter by document type
             phase_task: Filter by phase-task
+            phase_tasks: Filter by any of several phase-tasks (if phase_task is not set)
+            feature: Filter by feature
+            reference_timing: Filter by reference timing
+            status: Filter by status
             n_results: Maximum results
             
         Returns:
@@ -821,6 +974,17 @@ class RAGClient:
         
         if phase_task:
             where["phase_task"] = {"$eq": phase_task}
+        elif phase_tasks:
+            where["phase_task"] = {"$in": list(phase_tasks)}
+
+        if feature:
+            where["feature"] = {"$eq": feature}
+
+        if reference_timing:
+            where["reference_timing"] = {"$eq": reference_timing}
+
+        if status:
+            where["status"] = {"$eq": status}
         
         return self.search(
             query=query,
@@ -828,6 +992,55 @@ class RAGClient:
             where=where,
         )
 
+    def get_catalog_hashes(self, project: str) -> dict[str, str]:
+        """Get the sync hashes of a project's catalog entries.
+
+        Entries are read CATALOG_PAGE_SIZE at a time, metadata only.
+
+        Args:
+            project: Project ID
+
+        Returns:
+            Dict of document ID -> row hash ("" for entries without one)
+
+        Raises:
+            httpx.HTTPError: If a request fails
+        """
+        hashes: dict[str, str] = {}
+        offset = 0
+        while True:
+            result = self._make_request(
+                "POST",
+                f"/api/v1/collections/{self.collection_name}/get",
+                json_data={
+                    "where": {
+                        "type": {"$eq": "catalog"},
+                        "project": {"$eq": project},
+                    },
+                    "include": ["metadatas"],
+                    "limit": CATALOG_PAGE_SIZE,
+                    "offset": offset,
+                },
+            )
+            metadatas = result.get("metadatas", [])
+            for meta in metadatas:
+                hashes[meta.get("doc_id", "")] = meta.get("row_hash", "")
+            if len(metadatas) < CATALOG_PAGE_SIZE:
+                return hashes
+            offset += CATALOG_PAGE_SIZE
+
+    def delete_catalog_entries(self, project: str, doc_ids: list[str]) -> RAGOperationResult:
+        """Delete several catalog entries of a project in a single request.
+
+        Args:
+            project: Project ID
+            doc_ids: Document IDs of the entries to delete
+
+        Returns:
+            RAGOperationResult
+        """
+        return self.delete_documents([_catalog_entry_id(project, doc_id) for doc_id in doc_ids])
+
     def delete_catalog_entries_by_project(self, project: str) -> int:
         """Delete all catalog entries for a project.
 
@@ -866,7 +1079,7 @@ class RAGClient:
         Returns:
             RAGDocument if found, None otherwise
         """
-        catalog_id = f"catalog:{project}:{doc_id}"
+        catalog_id = _catalog_entry_id(project, doc_id)
         return self.get_document(catalog_id)
 
     def delete_catalog_entry(
@@ -883,7 +1096,7 @@ class RAGClient:
         Returns:
             RAGOperationResult
         """
-        catalog_id = f"catalog:{project}:{doc_id}"
+        catalog_id = _catalog_entry_id(project, doc_id)
         return self.delete_document(catalog_id)
 
     def delete_knowledge_by_doc_id(
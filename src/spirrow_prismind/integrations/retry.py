@@ -1,12 +1,14 @@
 """Retry utilities with exponential backoff for Spirrow-Prismind."""
 
+import json
 import logging
 import random
 import time
 from functools import wraps
-from typing import Callable, TypeVar
+from typing import Any, Callable, TypeVar
 
 import httpx
+from googleapiclient.errors import HttpError
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,19 @@ RETRYABLE_EXCEPTIONS = (
     httpx.ConnectError,
 )
 
+# Retry count for Google API requests. Reads and idempotent updates pass it
+# to googleapiclient's ``execute(num_retries=...)``, which backs off
+# exponentially (with jitter) on 429, 5xx and 403 rate-limit responses.
+# Non-idempotent writes use execute_write() instead.
+GOOGLE_API_RETRIES = 5
+
+# 403 error reasons that mean the request was rejected for rate limiting
+_RATE_LIMIT_REASONS = frozenset({
+    "rateLimitExceeded",
+    "userRateLimitExceeded",
+    "RATE_LIMIT_EXCEEDED",
+})
+
 
 def with_retry(
     max_retries: int = 3,
@@ -26,6 +41,7 @@ def with_retry(
     max_delay: float = 10.0,
     retryable_exceptions: tuple = RETRYABLE_EXCEPTIONS,
     on_retry: Callable[[Exception, int], None] | None = None,
+    retry_if: Callable[[Exception], bool] | None = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Decorator for retry with exponential backoff and jitter.
 
@@ -35,6 +51,8 @@ def with_retry(
         max_delay: Maximum delay in seconds (default: 10.0)
         retryable_exceptions: Tuple of exceptions to retry on
         on_retry: Optional callback called on each retry (exception, attempt)
+        retry_if: Optional check a retryable exception must also pass to be
+            retried; others are re-raised immediately
 
     Returns:
         Decorated function with retry logic
@@ -54,6 +72,8 @@ def with_retry(
                 try:
                     return func(*args, **kwargs)
                 except retryable_exceptions as e:
+                    if retry_if is not None and not retry_if(e):
+                        raise
                     last_exception = e
 
                     if attempt < max_retries:
@@ -156,3 +176,56 @@ class RetryConfig:
 
 # Global default retry config
 default_retry_config = RetryConfig()
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check whether a Google API error is a rate-limit rejection.
+
+    429 responses and 403 responses whose reason is a rate limit mean the
+    request was refused before it was processed, so it is safe to resend.
+
+    Args:
+        error: Exception raised by a Google API request
+
+    Returns:
+        True if the request was rejected for rate limiting
+    """
+    if not isinstance(error, HttpError):
+        return False
+    if error.resp.status == 429:
+        return True
+    if error.resp.status != 403:
+        return False
+
+    try:
+        detail = json.loads(error.content.decode("utf-8"))["error"]
+        items = [*detail.get("errors", []), *detail.get("details", [])]
+    except (UnicodeDecodeError, ValueError, KeyError, TypeError, AttributeError):
+        return False
+    return any(
+        isinstance(item, dict) and item.get("reason") in _RATE_LIMIT_REASONS
+        for item in items
+    )
+
+
+@with_retry(
+    max_retries=GOOGLE_API_RETRIES,
+    base_delay=1.0,
+    max_delay=32.0,
+    retryable_exceptions=(HttpError,),
+    retry_if=is_rate_limit_error,
+)
+def execute_write(request: Any) -> Any:
+    """Execute a non-idempotent Google API request (create, append, insert, delete).
+
+    ``execute(num_retries=...)`` also retries 5xx responses, which can follow
+    a write the server already committed, so resending could duplicate it.
+    Only rate-limit rejections are retried here.
+
+    Args:
+        request: googleapiclient HttpRequest
+
+    Returns:
+        API response
+    """
+    return request.execute()
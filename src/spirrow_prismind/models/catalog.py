@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class CatalogEntry:
     """Entry in the document catalog."""
 
@@ -78,6 +78,17 @@ class CatalogEntry:
             status=get(12, "active"),
         )
 
+    def to_summary_dict(self) -> dict:
+        """Convert to a tool response dictionary (search result summary)."""
+        return {
+            "doc_id": self.doc_id,
+            "name": self.name,
+            "doc_type": self.doc_type,
+            "phase_task": self.phase_task,
+            "feature": self.feature,
+            "source": self.source,
+        }
+
     def to_rag_document(self) -> dict:
         """Convert to RAG document format for indexing."""
         return {
@@ -98,7 +109,7 @@ class CatalogEntry:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchCatalogResult:
     """Result of searching the catalog."""
 
@@ -107,8 +118,17 @@ class SearchCatalogResult:
     documents: list[CatalogEntry] = field(default_factory=list)
     message: str = ""
 
+    def to_dict(self) -> dict:
+        """Convert to a tool response dictionary."""
+        return {
+            "success": self.success,
+            "total_count": self.total_count,
+            "documents": list(map(CatalogEntry.to_summary_dict, self.documents)),
+            "message": self.message,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class SyncCatalogResult:
     """Result of syncing the catalog."""
 
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentType:
     """Custom document type definition."""
 
@@ -51,6 +51,18 @@ class DocumentType:
             "is_global": self.is_global,
         }
 
+    def to_summary_dict(self) -> dict:
+        """Convert to a tool response dictionary (without folder IDs)."""
+        return {
+            "type_id": self.type_id,
+            "name": self.name,
+            "folder_name": self.folder_name,
+            "template_doc_id": self.template_doc_id,
+            "description": self.description,
+            "fields": self.fields,
+            "is_global": self.is_global,
+        }
+
     @classmethod
     def from_dict(cls, data: dict) -> "DocumentType":
         """Create from dictionary."""
@@ -68,7 +80,7 @@ class DocumentType:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ListDocumentTypesResult:
     """Result of listing document types."""
 
@@ -76,8 +88,16 @@ class ListDocumentTypesResult:
     document_types: list[DocumentType] = field(default_factory=list)
     message: str = ""
 
+    def to_dict(self) -> dict:
+        """Convert to a tool response dictionary."""
+        return {
+            "success": self.success,
+            "document_types": list(map(DocumentType.to_summary_dict, self.document_types)),
+            "message": self.message,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class RegisterDocumentTypeResult:
     """Result of registering a document type."""
 
@@ -88,7 +108,7 @@ class RegisterDocumentTypeResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteDocumentTypeResult:
     """Result of deleting a document type."""
 
@@ -97,7 +117,7 @@ class DeleteDocumentTypeResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DocReference:
     """Reference to a document in the catalog."""
 
@@ -106,7 +126,7 @@ class DocReference:
     reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """Full document content."""
 
@@ -118,7 +138,7 @@ class Document:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentResult:
     """Result of getting a document."""
 
@@ -128,7 +148,7 @@ class DocumentResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateDocumentResult:
     """Result of creating a document."""
 
@@ -143,7 +163,7 @@ class CreateDocumentResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateDocumentResult:
     """Result of updating a document."""
 
@@ -153,7 +173,7 @@ class UpdateDocumentResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteDocumentResult:
     """Result of deleting a document."""
 
@@ -167,7 +187,7 @@ class DeleteDocumentResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentSummary:
     """Summary of a document for listing."""
 
@@ -181,7 +201,7 @@ class DocumentSummary:
     updated_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ListDocumentsResult:
     """Result of listing documents."""
 
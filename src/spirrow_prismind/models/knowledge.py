@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeEntry:
     """A knowledge entry in RAG."""
 
@@ -33,7 +33,7 @@ class KnowledgeEntry:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AddKnowledgeResult:
     """Result of adding knowledge."""
 
@@ -43,7 +43,7 @@ class AddKnowledgeResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchKnowledgeResult:
     """Result of searching knowledge."""
 
@@ -53,7 +53,7 @@ class SearchKnowledgeResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateKnowledgeResult:
     """Result of updating knowledge."""
 
@@ -63,7 +63,7 @@ class UpdateKnowledgeResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteKnowledgeResult:
     """Result of deleting a knowledge entry."""
 
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskProgress:
     """Progress of a single task."""
 
@@ -20,8 +20,31 @@ class TaskProgress:
     category: str = ""  # bug / feature / refactor / design / test etc.
     blocked_by: list[str] = field(default_factory=list)  # e.g., ["T01", "T02"]
 
-
-@dataclass
+    def to_dict(self, extended: bool = False) -> dict:
+        """Convert to a tool response dictionary.
+
+        Args:
+            extended: Include the v2 fields (priority, category, blocked_by)
+
+        Returns:
+            Task dictionary
+        """
+        data = {
+            "task_id": self.task_id,
+            "name": self.name,
+            "status": self.status,
+            "blockers": self.blockers,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "notes": self.notes,
+        }
+        if extended:
+            data["priority"] = self.priority
+            data["category"] = self.category
+            data["blocked_by"] = self.blocked_by
+        return data
+
+
+@dataclass(slots=True)
 class PhaseProgress:
     """Progress of a phase."""
 
@@ -29,8 +52,16 @@ class PhaseProgress:
     status: str  # not_started / in_progress / completed
     tasks: list[TaskProgress] = field(default_factory=list)
 
+    def to_dict(self) -> dict:
+        """Convert to a tool response dictionary."""
+        return {
+            "phase": self.phase,
+            "status": self.status,
+            "tasks": list(map(TaskProgress.to_dict, self.tasks)),
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class GetProgressResult:
     """Result of getting progress."""
 
@@ -40,8 +71,18 @@ class GetProgressResult:
     phases: list[PhaseProgress] = field(default_factory=list)
     message: str = ""
 
+    def to_dict(self) -> dict:
+        """Convert to a tool response dictionary."""
+        return {
+            "success": self.success,
+            "project": self.project,
+            "current_phase": self.current_phase,
+            "phases": list(map(PhaseProgress.to_dict, self.phases)),
+            "message": self.message,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class TaskDefinition:
     """Definition for creating a new task."""
 
@@ -51,7 +92,7 @@ class TaskDefinition:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateProgressResult:
     """Result of updating progress."""
 
@@ -62,7 +103,7 @@ class UpdateProgressResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class GetTaskResult:
     """Result of getting a single task."""
 
@@ -72,8 +113,18 @@ class GetTaskResult:
     project: str = ""
     message: str = ""
 
+    def to_dict(self) -> dict:
+        """Convert to a tool response dictionary."""
+        return {
+            "success": self.success,
+            "task": self.task.to_dict(extended=True) if self.task else None,
+            "phase": self.phase,
+            "project": self.project,
+            "message": self.message,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class DeleteTaskResult:
     """Result of deleting a task."""
 
@@ -85,7 +136,7 @@ class DeleteTaskResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateTaskResult:
     """Result of updating a task (extended)."""
 
@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from .document import DocumentType
 
 
-@dataclass
+@dataclass(slots=True)
 class SheetsConfig:
     """Google Sheets configuration for a project."""
     summary: str = "サマリ"
@@ -21,7 +21,7 @@ class SheetsConfig:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveConfig:
     """Google Drive folder configuration for a project."""
     design_folder: str = ""  # No default folder - created on-demand when registering types
@@ -32,7 +32,7 @@ class DriveConfig:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsConfig:
     """Google Docs configuration for a project."""
     template_folder_id: str = ""
@@ -43,7 +43,7 @@ class DocsConfig:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectOptions:
     """Project options."""
     auto_sync_catalog: bool = True
@@ -54,7 +54,7 @@ class ProjectOptions:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     """Project configuration stored in RAG."""
 
@@ -185,7 +185,7 @@ class ProjectConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectSummary:
     """Summary of a project for listing."""
     project_id: str
@@ -194,8 +194,18 @@ class ProjectSummary:
     updated_at: datetime
     status: str = "active"  # active, archived, etc.
 
+    def to_dict(self) -> dict:
+        """Convert to a tool response dictionary."""
+        return {
+            "project_id": self.project_id,
+            "name": self.name,
+            "description": self.description,
+            "updated_at": self.updated_at.isoformat(),
+            "status": self.status,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class SimilarProject:
     """Similar project found during setup."""
     project_id: str
@@ -209,7 +219,7 @@ class SimilarProject:
         return int(self.similarity * 100)
 
 
-@dataclass
+@dataclass(slots=True)
 class SetupProjectResult:
     """Result of setting up a project."""
     success: bool
@@ -248,7 +258,7 @@ class SetupProjectResult:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class SwitchProjectResult:
     """Result of switching projects."""
     success: bool
@@ -257,7 +267,7 @@ class SwitchProjectResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ListProjectsResult:
     """Result of listing projects."""
     success: bool
@@ -265,8 +275,17 @@ class ListProjectsResult:
     current_project: str = ""
     message: str = ""
 
+    def to_dict(self) -> dict:
+        """Convert to a tool response dictionary."""
+        return {
+            "success": self.success,
+            "projects": list(map(ProjectSummary.to_dict, self.projects)),
+            "current_project": self.current_project,
+            "message": self.message,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class UpdateProjectResult:
     """Result of updating a project."""
     success: bool
@@ -275,7 +294,7 @@ class UpdateProjectResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteProjectResult:
     """Result of deleting a project."""
     success: bool
@@ -284,7 +303,7 @@ class DeleteProjectResult:
     drive_folder_deleted: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncProjectsResult:
     """Result of syncing projects from Google Drive."""
     success: bool
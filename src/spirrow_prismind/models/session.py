@@ -7,7 +7,7 @@ from typing import Optional
 from .document import DocReference
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionContext:
     """Context returned when starting a session."""
 
@@ -34,7 +34,7 @@ class SessionContext:
     next_action: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     """State saved to MCP Memory Server."""
 
@@ -87,7 +87,7 @@ class SessionState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EndSessionResult:
     """Result of ending a session."""
 
@@ -97,7 +97,7 @@ class EndSessionResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SaveSessionResult:
     """Result of saving a session."""
 
@@ -106,7 +106,7 @@ class SaveSessionResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Summary information about a session."""
 
@@ -121,7 +121,7 @@ class SessionInfo:
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ListSessionsResult:
     """Result of listing sessions."""
 
@@ -131,7 +131,7 @@ class ListSessionsResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteSessionResult:
     """Result of deleting a session."""
 
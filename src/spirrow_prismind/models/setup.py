@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SettingStatus:
     """Status of a single setting."""
 
@@ -16,8 +16,20 @@ class SettingStatus:
     description: str
     benefit: Optional[str]  # None for required settings
 
+    def to_dict(self) -> dict:
+        """Convert to a tool response dictionary."""
+        return {
+            "name": self.name,
+            "required": self.required,
+            "configured": self.configured,
+            "current_value": self.current_value,
+            "default_value": self.default_value,
+            "description": self.description,
+            "benefit": self.benefit,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class GetSetupStatusResult:
     """Result of get_setup_status tool."""
 
@@ -29,8 +41,20 @@ class GetSetupStatusResult:
     config_file_exists: bool = False
     message: str = ""
 
+    def to_dict(self) -> dict:
+        """Convert to a tool response dictionary."""
+        return {
+            "success": self.success,
+            "ready": self.ready,
+            "required_settings": list(map(SettingStatus.to_dict, self.required_settings)),
+            "optional_settings": list(map(SettingStatus.to_dict, self.optional_settings)),
+            "config_file_path": self.config_file_path,
+            "config_file_exists": self.config_file_exists,
+            "message": self.message,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class ConfigureResult:
     """Result of configure tool."""
 
@@ -42,7 +66,7 @@ class ConfigureResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceConnectionInfo:
     """Connection info for a single service."""
 
@@ -55,8 +79,38 @@ class ServiceConnectionInfo:
     collection: str = ""  # For RAG
     last_checked: str = ""
 
-
-@dataclass
+    def to_dict(self, include_collection: bool = False) -> dict:
+        """Convert to a tool response dictionary.
+
+        Args:
+            include_collection: Include the RAG collection name
+
+        Returns:
+            Connection info dictionary
+        """
+        if include_collection:
+            return {
+                "name": self.name,
+                "url": self.url,
+                "protocol": self.protocol,
+                "status": self.status,
+                "latency_ms": self.latency_ms,
+                "version": self.version,
+                "collection": self.collection,
+                "last_checked": self.last_checked,
+            }
+        return {
+            "name": self.name,
+            "url": self.url,
+            "protocol": self.protocol,
+            "status": self.status,
+            "latency_ms": self.latency_ms,
+            "version": self.version,
+            "last_checked": self.last_checked,
+        }
+
+
+@dataclass(slots=True)
 class GoogleConnectionInfo:
     """Connection info for Google services."""
 
@@ -64,8 +118,16 @@ class GoogleConnectionInfo:
     user: str = ""
     scopes: list[str] = field(default_factory=list)
 
+    def to_dict(self) -> dict:
+        """Convert to a tool response dictionary."""
+        return {
+            "authenticated": self.authenticated,
+            "user": self.user,
+            "scopes": self.scopes,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class GetConnectionInfoResult:
     """Result of get_connection_info tool."""
 
@@ -75,8 +137,22 @@ class GetConnectionInfoResult:
     google: Optional[GoogleConnectionInfo] = None
     message: str = ""
 
-
-@dataclass
+    def to_dict(self) -> dict:
+        """Convert to a tool response dictionary (unavailable sections omitted)."""
+        response = {
+            "success": self.success,
+            "message": self.message,
+        }
+        if self.memory_server:
+            response["memory_server"] = self.memory_server.to_dict()
+        if self.rag_server:
+            response["rag_server"] = self.rag_server.to_dict(include_collection=True)
+        if self.google:
+            response["google"] = self.google.to_dict()
+        return response
+
+
+@dataclass(slots=True)
 class ExportServerConfigResult:
     """Result of export_server_config tool."""
 
@@ -85,7 +161,7 @@ class ExportServerConfigResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportServerConfigResult:
     """Result of import_server_config tool."""
 
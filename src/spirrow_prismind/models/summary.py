@@ -89,7 +89,7 @@ def create_catalog_template() -> list[list[str]]:
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceStatus:
     """Status of a single service."""
     name: str
@@ -102,8 +102,35 @@ class ServiceStatus:
     version: str = ""
     last_checked: str = ""
 
-
-@dataclass
+    def to_dict(self, detailed: bool = False) -> dict:
+        """Convert to a tool response dictionary.
+
+        Args:
+            detailed: Include protocol, latency, version and last check time
+
+        Returns:
+            Service status dictionary
+        """
+        if detailed:
+            return {
+                "name": self.name,
+                "available": self.available,
+                "url": self.url,
+                "message": self.message,
+                "protocol": self.protocol,
+                "latency_ms": self.latency_ms,
+                "version": self.version,
+                "last_checked": self.last_checked,
+            }
+        return {
+            "name": self.name,
+            "available": self.available,
+            "url": self.url,
+            "message": self.message,
+        }
+
+
+@dataclass(slots=True)
 class CheckServicesResult:
     """Result of checking all services status."""
     success: bool
@@ -111,8 +138,24 @@ class CheckServicesResult:
     all_required_available: bool = False
     message: str = ""
 
+    def to_dict(self, detailed: bool = False) -> dict:
+        """Convert to a tool response dictionary.
+
+        Args:
+            detailed: Include detailed fields for each service
+
+        Returns:
+            Response dictionary
+        """
+        return {
+            "success": self.success,
+            "services": [s.to_dict(detailed) for s in self.services],
+            "all_available": self.all_required_available,
+            "message": self.message,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class UpdateSummaryResult:
     """Result of updating summary sheet."""
     success: bool
@@ -1,13 +1,20 @@
 """Spirrow-Prismind MCP Server."""
 
 import asyncio
+import dataclasses
+import functools
 import json
 import logging
 import os
-from datetime import datetime, timedelta
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
@@ -19,12 +26,14 @@ from mcp.types import (
 
 from .config import load_config
 from .integrations import (
+    RAG_EXECUTOR,
     GoogleDocsClient,
     GoogleDriveClient,
     GoogleSheetsClient,
     MemoryClient,
     RAGClient,
 )
+from .models import CreateDocumentResult
 from .tools import (
     CatalogTools,
     DocumentTools,
@@ -35,10 +44,118 @@ from .tools import (
     SetupTools,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 logger = logging.getLogger(__name__)
 
+# Config file path, resolved once at import
+_CONFIG_PATH = os.environ.get("PRISMIND_CONFIG", "config.toml")
+
+# OAuth scopes required by the Google clients
+_GOOGLE_SCOPES = (
+    "https://www.googleapis.com/auth/documents",
+    "https://www.googleapis.com/auth/drive",
+    "https://www.googleapis.com/auth/spreadsheets",
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_token_credentials(token_path: str, mtime_ns: int):
+    """Parse a saved OAuth token file.
+
+    The result is cached per file modification time, so the token is only
+    re-parsed after it has been rewritten.
+
+    Args:
+        token_path: Path to token.json
+        mtime_ns: Modification time of the token file (cache key)
+
+    Returns:
+        Google OAuth credentials
+    """
+    return Credentials.from_authorized_user_file(token_path, list(_GOOGLE_SCOPES))
+
+
+def _save_token(creds, token_path: str) -> None:
+    """Write OAuth credentials to the token file.
+
+    The file is replaced atomically, so a crash mid-write never leaves a
+    truncated token behind.
+
+    Args:
+        creds: Google OAuth credentials
+        token_path: Path to token.json
+    """
+    os.makedirs(os.path.dirname(token_path), exist_ok=True)
+    tmp_token_path = f"{token_path}.tmp"
+    with open(tmp_token_path, "w") as token:
+        token.write(creds.to_json())
+    os.replace(tmp_token_path, token_path)
+
+
+def _config_fingerprint() -> list:
+    """Identify the config file by absolute path and modification time.
+
+    Returns:
+        ``[path, mtime_ns]``; mtime_ns is None if the file does not exist
+    """
+    config_path = os.path.abspath(_CONFIG_PATH)
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return [config_path, mtime_ns]
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert non-JSON-native objects found in tool results.
+
+    Dataclasses are encoded field by field with ``dataclasses.asdict``, which
+    matches orjson's native dataclass output, so the wire format does not
+    depend on whether orjson is installed. Handlers that need a different
+    shape must return a dict instead.
+    """
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def _encode_result(result: Any) -> str:
+        """Serialize a tool result to JSON text in a single pass."""
+        return orjson.dumps(result, default=_json_default, option=_ORJSON_OPTIONS).decode()
+else:
+    def _encode_result(result: Any) -> str:
+        """Serialize a tool result to JSON text in a single pass."""
+        return json.dumps(result, ensure_ascii=False, default=_json_default)
+
+
+_ERROR_TEMPLATE = '{"success":false,"error":%s}'
+
+
+def _encode_error(message: str) -> str:
+    """Serialize a ``{"success": False, "error": message}`` response.
+
+    Only the message is encoded; the rest comes from a pre-serialized
+    template.
+    """
+    return _ERROR_TEMPLATE % _encode_result(message)
+
+
 # Tool definitions
-TOOLS = [
+TOOLS: tuple[Tool, ...] = (
     # Setup Wizard
     Tool(
         name="get_setup_status",
@@ -414,7 +531,10 @@ TOOLS = [
     # Document Operations
     Tool(
         name="get_document",
-        description="Search and retrieve a document.",
+        description=(
+            "Search and retrieve a document. "
+            "Very large document content is returned as a second text block."
+        ),
         inputSchema={
             "type": "object",
             "properties": {
@@ -438,6 +558,11 @@ TOOLS = [
                     "type": "string",
                     "description": "Project ID (uses current project if omitted)",
                 },
+                "include_content": {
+                    "type": "boolean",
+                    "description": "If false, return only the catalog reference without the document body",
+                    "default": True,
+                },
             },
         },
     ),
@@ -480,6 +605,40 @@ TOOLS = [
             "required": ["name", "doc_type", "content", "phase_task"],
         },
     ),
+    Tool(
+        name="create_documents",
+        description="Create several documents and register them in the catalog with one batched write.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "documents": {
+                    "type": "array",
+                    "description": "Documents to create",
+                    "minItems": 1,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "doc_type": {"type": "string"},
+                            "content": {"type": "string"},
+                            "phase_task": {"type": "string"},
+                            "feature": {"type": "string"},
+                            "keywords": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                            },
+                        },
+                        "required": ["name", "doc_type", "content", "phase_task"],
+                    },
+                },
+                "project": {
+                    "type": "string",
+                    "description": "Project ID (uses current project if omitted)",
+                },
+            },
+            "required": ["documents"],
+        },
+    ),
     Tool(
         name="update_document",
         description="Update a document.",
@@ -705,6 +864,11 @@ TOOLS = [
                     "type": "string",
                     "description": "Phase-task filter",
                 },
+                "phase_tasks": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Match any of these phase-tasks in one search (ignored if phase_task is set)",
+                },
                 "feature": {
                     "type": "string",
                     "description": "Feature filter",
@@ -1153,7 +1317,117 @@ TOOLS = [
             },
         },
     ),
-]
+)
+
+# Shared list handed to the SDK on every list_tools request (the Tool models are
+# already validated, so the SDK only wraps this list)
+_TOOLS_LIST: list[Tool] = list(TOOLS)
+
+_TOOL_SCHEMAS: dict[str, dict] = {tool.name: tool.inputSchema for tool in TOOLS}
+
+
+@functools.cache
+def _get_tool_validator(name: str) -> Callable[[Any], Any]:
+    """Compile the argument validator for a tool on first use.
+
+    When fastjsonschema is available these validators replace the SDK's
+    per-call jsonschema validation. Compiling all schemas up front would
+    add tens of milliseconds to every server start, so each one is built
+    the first time its tool is called. Defaults are not injected so
+    handlers keep seeing the arguments exactly as sent.
+
+    Args:
+        name: Tool name (must be a key of ``_TOOL_SCHEMAS``)
+
+    Returns:
+        Validator that raises ``fastjsonschema.JsonSchemaException``
+    """
+    return fastjsonschema.compile(_TOOL_SCHEMAS[name], use_default=False)
+
+
+# Tools that need Google-backed project tools to be initialized
+_GOOGLE_REQUIRED_TOOLS: frozenset[str] = frozenset((
+    "start_session", "end_session", "save_session", "update_session_progress",
+    "list_sessions", "delete_session", "update_summary",
+    "setup_project", "switch_project", "list_projects",
+    "update_project", "delete_project", "sync_projects_from_drive",
+    "get_document", "create_document", "create_documents", "update_document",
+    "delete_document", "list_documents",
+    "list_document_types", "register_document_type", "delete_document_type",
+    "find_similar_document_type",
+    "search_catalog", "sync_catalog",
+    "get_progress", "update_task_status", "add_task",
+    "get_task", "delete_task", "update_task",
+))
+
+# Shared response for Google-required tools when Google auth is missing (never mutated)
+_GOOGLE_AUTH_ERROR: dict = {
+    "success": False,
+    "error": "Google認証が完了していません。token.jsonが存在するか確認し、サーバーを再起動してください。",
+}
+_GOOGLE_AUTH_ERROR_TEXT = _encode_result(_GOOGLE_AUTH_ERROR)
+
+# Read-only tools whose identical concurrent calls share a single backend round-trip
+_COALESCED_TOOLS: frozenset[str] = frozenset((
+    "list_projects", "list_sessions", "get_document", "list_documents",
+    "list_document_types", "search_catalog", "search_knowledge",
+    "get_progress", "get_task",
+))
+
+# Tools that never modify state; any other tool invalidates the read cache
+_READ_ONLY_TOOLS: frozenset[str] = _COALESCED_TOOLS | frozenset((
+    "get_setup_status", "check_services_status", "get_connection_info",
+    "export_server_config", "find_similar_document_type",
+))
+
+# Repeat-read tools whose successful responses are cached for a short time
+_CACHED_TOOLS: frozenset[str] = frozenset(("list_projects", "search_catalog", "search_knowledge"))
+_READ_CACHE_TTL = 30.0  # seconds
+_READ_CACHE_MAX_ENTRIES = 256
+
+# Cached list_projects responses are persisted here when the server stops,
+# so a stdio subprocess relaunched shortly afterwards starts with a warm cache
+_INIT_SNAPSHOT_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "prismind"
+    / "init.snapshot"
+)
+
+# Refresh the Google token this many seconds before it expires, and retry
+# after this many seconds when a refresh fails
+_TOKEN_REFRESH_MARGIN = 300.0
+_TOKEN_REFRESH_RETRY = 60.0
+
+# Document content longer than this (in characters) is sent as its own
+# text block instead of being embedded in the JSON response
+_LARGE_CONTENT_THRESHOLD = 64 * 1024
+
+
+@dataclasses.dataclass(slots=True)
+class _SplitResult:
+    """Tool response whose large text body is sent as a separate block."""
+    response: dict
+    body: str
+
+
+def _create_document_response(result: CreateDocumentResult) -> dict:
+    """Build the response dict for one created document."""
+    return {
+        "success": result.success,
+        "doc_id": result.doc_id,
+        "name": result.name,
+        "doc_type": result.doc_type,
+        "doc_url": result.doc_url,
+        "source": result.source,
+        "catalog_registered": result.catalog_registered,
+        "unknown_doc_type": result.unknown_doc_type,
+        "message": result.message,
+    }
+
+
+def _google_auth_error(server: "PrismindServer", args: dict) -> dict:
+    """Handler used for Google-required tools when Google auth is missing."""
+    return _GOOGLE_AUTH_ERROR
 
 
 class PrismindServer:
@@ -1164,6 +1438,8 @@ class PrismindServer:
         self.server = Server("spirrow-prismind")
         self.config = None
         self._initialized = False
+        # Serializes first-call initialization across concurrent tool calls
+        self._init_lock = asyncio.Lock()
         
         # Clients (initialized lazily)
         self._rag_client: Optional[RAGClient] = None
@@ -1171,9 +1447,17 @@ class PrismindServer:
         self._sheets_client: Optional[GoogleSheetsClient] = None
         self._docs_client: Optional[GoogleDocsClient] = None
         self._drive_client: Optional[GoogleDriveClient] = None
+
+        # Google OAuth credentials and the background task that refreshes
+        # them before they expire
+        self._credentials = None
+        self._token_path: Optional[str] = None
+        self._refresh_task: Optional[asyncio.Task] = None
         
+        # Setup tools work before full initialization, so create them up front
+        self._setup_tools = SetupTools(_CONFIG_PATH)
+
         # Tools (initialized lazily)
-        self._setup_tools: Optional[SetupTools] = None
         self._project_tools: Optional[ProjectTools] = None
         self._session_tools: Optional[SessionTools] = None
         self._document_tools: Optional[DocumentTools] = None
@@ -1181,6 +1465,24 @@ class PrismindServer:
         self._knowledge_tools: Optional[KnowledgeTools] = None
         self._progress_tools: Optional[ProgressTools] = None
 
+        # Tool handlers, specialized for the available tools
+        self._handlers = self._build_handlers()
+
+        # Tool handlers block on Google/RAG HTTP calls, so they run off the event
+        # loop. A single worker keeps the (non-thread-safe) httplib2-based Google
+        # clients on one thread while list_tools, pings and other requests stay
+        # responsive.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prismind-tools")
+
+        # In-flight read-only calls, keyed by (tool name, canonical arguments)
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+
+        # Short-lived response cache for _CACHED_TOOLS: key -> (stored_at, response).
+        # The generation is bumped by every write tool so that reads started
+        # before a write never repopulate the cache with stale data.
+        self._read_cache: dict[tuple[str, str], tuple[float, Any]] = {}
+        self._read_cache_generation = 0
+
         # Register handlers
         self._register_handlers()
 
@@ -1189,9 +1491,18 @@ class PrismindServer:
         
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
-            return TOOLS
+            return _TOOLS_LIST
         
-        @self.server.call_tool()
+        if fastjsonschema is not None:
+            try:
+                register_call_tool = self.server.call_tool(validate_input=False)
+            except TypeError:
+                # Older SDKs take no arguments and do not validate input
+                register_call_tool = self.server.call_tool()
+        else:
+            register_call_tool = self.server.call_tool()
+        
+        @register_call_tool
         async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             return await self._handle_tool_call(name, arguments)
 
@@ -1204,32 +1515,44 @@ class PrismindServer:
         if self._initialized:
             return
 
-        import asyncio
-        try:
-            await asyncio.wait_for(self._do_initialization(), timeout=timeout)
-        except asyncio.TimeoutError:
-            logger.error(f"Server initialization timed out after {timeout} seconds")
-            self._initialized = True  # Mark as initialized to prevent retry loops
-            raise RuntimeError(f"Initialization timeout after {timeout}s. Check credentials and server connections.")
+        async with self._init_lock:
+            if self._initialized:
+                return
+
+            try:
+                await asyncio.wait_for(self._do_initialization(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Server initialization timed out after {timeout} seconds")
+                self._initialized = True  # Mark as initialized to prevent retry loops
+                raise RuntimeError(f"Initialization timeout after {timeout}s. Check credentials and server connections.")
+
+            if self._credentials is not None and self._credentials.refresh_token:
+                self._refresh_task = asyncio.create_task(self._keep_token_fresh())
 
     async def _do_initialization(self):
         """Perform actual initialization."""
         
         # Load config
-        config_path = os.environ.get("PRISMIND_CONFIG", "config.toml")
-        self.config = load_config(Path(config_path))
+        self.config = load_config(Path(_CONFIG_PATH))
+        self._load_init_snapshot()
         
-        # Initialize clients (they will check connectivity and mark themselves as unavailable if needed)
-        self._rag_client = RAGClient(
-            base_url=self.config.rag_url,
-            collection_name=self.config.rag_collection,
-            connect_timeout=3.0,
-        )
-
-        self._memory_client = MemoryClient(
-            base_url=self.config.memory_url,
-            connect_timeout=3.0,
-            protocol=self.config.memory_type,
+        # Initialize clients (they will check connectivity and mark themselves as unavailable if needed).
+        # The connectivity checks and Google credential loading block on I/O,
+        # so they run concurrently in worker threads.
+        self._rag_client, self._memory_client, credentials = await asyncio.gather(
+            asyncio.to_thread(
+                RAGClient,
+                base_url=self.config.rag_url,
+                collection_name=self.config.rag_collection,
+                connect_timeout=3.0,
+            ),
+            asyncio.to_thread(
+                MemoryClient,
+                base_url=self.config.memory_url,
+                connect_timeout=3.0,
+                protocol=self.config.memory_type,
+            ),
+            asyncio.to_thread(self._load_google_credentials),
         )
 
         # Log service availability (RAG/Memory are optional)
@@ -1246,10 +1569,7 @@ class PrismindServer:
             )
         
         # Google clients require OAuth credentials
-        # For now, we'll use a placeholder - actual implementation
-        # would load credentials from file or environment
-        credentials = self._load_google_credentials()
-        
+        self._credentials = credentials
         if credentials:
             self._sheets_client = GoogleSheetsClient(credentials)
             self._docs_client = GoogleDocsClient(credentials)
@@ -1303,13 +1623,110 @@ class PrismindServer:
             memory_client=self._memory_client,
             user_name=self.config.user_name,
         )
-        
+
+        self._handlers = self._build_handlers()
         self._initialized = True
 
+    def _build_handlers(self) -> dict[str, Callable[["PrismindServer", dict], Any]]:
+        """Build the tool handler table for the currently available tools.
+
+        Google-required tools are mapped to the auth error handler when the
+        Google-backed project tools are not initialized.
+
+        Returns:
+            Mapping of tool name to handler
+        """
+        handlers = dict(self._HANDLERS)
+        if not self._project_tools:
+            for name in _GOOGLE_REQUIRED_TOOLS:
+                handlers[name] = _google_auth_error
+        return handlers
+
+    def _load_init_snapshot(self):
+        """Seed the read cache from the snapshot left by a previous process.
+
+        The snapshot is ignored when the config file has changed since it
+        was written, and entries older than the cache TTL are skipped.
+        """
+        try:
+            with open(_INIT_SNAPSHOT_PATH, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if snapshot.get("config") != _config_fingerprint():
+            return
+
+        elapsed = time.time() - snapshot.get("saved_at", 0.0)
+        now = time.monotonic()
+        for entry in snapshot.get("list_projects", []):
+            age = entry["age"] + elapsed
+            if 0 <= age < _READ_CACHE_TTL:
+                key = ("list_projects", entry["args"])
+                self._read_cache[key] = (now - age, json.loads(entry["response"]))
+
+    def _save_init_snapshot(self):
+        """Persist the cached list_projects responses for the next process."""
+        now = time.monotonic()
+        entries = [
+            {
+                "args": key[1],
+                "age": now - stored_at,
+                "response": _encode_result(response),
+            }
+            for key, (stored_at, response) in self._read_cache.items()
+            if key[0] == "list_projects" and now - stored_at < _READ_CACHE_TTL
+        ]
+        if not entries:
+            return
+
+        snapshot = {
+            "config": _config_fingerprint(),
+            "saved_at": time.time(),
+            "list_projects": entries,
+        }
+        try:
+            os.makedirs(_INIT_SNAPSHOT_PATH.parent, exist_ok=True)
+            tmp_path = f"{_INIT_SNAPSHOT_PATH}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, _INIT_SNAPSHOT_PATH)
+        except OSError as e:
+            logger.debug(f"Failed to save init snapshot: {e}")
+
+    async def _keep_token_fresh(self):
+        """Refresh the Google token shortly before it expires.
+
+        Runs for the lifetime of the server so that tool calls never pay
+        for a token refresh themselves. The refresh runs on the tool
+        executor because the credentials are shared with the Google
+        clients used there.
+        """
+        creds = self._credentials
+        loop = asyncio.get_running_loop()
+        while True:
+            if creds.expiry is None:
+                return
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            delay = (creds.expiry - now).total_seconds() - _TOKEN_REFRESH_MARGIN
+            await asyncio.sleep(max(delay, 0))
+            try:
+                await loop.run_in_executor(self._executor, self._refresh_credentials)
+            except Exception as e:
+                logger.warning(f"Failed to refresh Google token: {e}")
+                await asyncio.sleep(_TOKEN_REFRESH_RETRY)
+
+    def _refresh_credentials(self):
+        """Refresh the Google credentials and save the new token."""
+        self._credentials.refresh(Request())
+        if self._token_path:
+            _save_token(self._credentials, self._token_path)
+        logger.info("Refreshed Google token")
+
     def _load_google_credentials(self):
         """Load Google OAuth credentials."""
         # Use paths from config.toml, with environment variable override
-        config_dir = Path(os.environ.get("PRISMIND_CONFIG", "config.toml")).parent
+        config_dir = Path(_CONFIG_PATH).parent
 
         # Resolve credentials path
         credentials_path = os.environ.get("GOOGLE_CREDENTIALS_PATH")
@@ -1334,23 +1751,25 @@ class PrismindServer:
         logger.info(f"Looking for credentials at: {credentials_path}")
         logger.info(f"Looking for token at: {token_path}")
 
-        try:
-            from google.oauth2.credentials import Credentials
-            from google.auth.transport.requests import Request
-            from google_auth_oauthlib.flow import InstalledAppFlow
-
-            SCOPES = [
-                "https://www.googleapis.com/auth/documents",
-                "https://www.googleapis.com/auth/drive",
-                "https://www.googleapis.com/auth/spreadsheets",
-            ]
+        # Skip the OAuth setup entirely when there is nothing to load
+        if not os.path.exists(credentials_path) and not os.path.exists(token_path):
+            logger.warning(
+                f"Google credentials not found at {credentials_path}. "
+                "Google API features will be disabled."
+            )
+            return None
 
+        try:
             creds = None
 
             # Load existing token
-            if os.path.exists(token_path):
+            try:
+                token_mtime_ns = os.stat(token_path).st_mtime_ns
+            except FileNotFoundError:
+                token_mtime_ns = None
+            if token_mtime_ns is not None:
                 logger.info(f"Found existing token at {token_path}")
-                creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+                creds = _load_token_credentials(token_path, token_mtime_ns)
             
             # Refresh or get new credentials
             if not creds or not creds.valid:
@@ -1363,8 +1782,11 @@ class PrismindServer:
                         "OAuth requires browser authentication. "
                         "If running as MCP server, run 'python -c \"from spirrow_prismind.server import PrismindServer; import asyncio; asyncio.run(PrismindServer()._ensure_initialized())\"' first to authenticate."
                     )
+                    # google_auth_oauthlib is only needed for the browser flow
+                    from google_auth_oauthlib.flow import InstalledAppFlow
+
                     flow = InstalledAppFlow.from_client_secrets_file(
-                        credentials_path, SCOPES
+                        credentials_path, list(_GOOGLE_SCOPES)
                     )
                     # Set timeout for OAuth flow (60 seconds)
                     creds = flow.run_local_server(port=0, timeout_seconds=60)
@@ -1377,10 +1799,9 @@ class PrismindServer:
                     return None
                 
                 # Save the credentials for next run
-                os.makedirs(os.path.dirname(token_path), exist_ok=True)
-                with open(token_path, "w") as token:
-                    token.write(creds.to_json())
+                _save_token(creds, token_path)
             
+            self._token_path = token_path
             return creds
             
         except Exception as e:
@@ -1393,930 +1814,779 @@ class PrismindServer:
         arguments: dict,
     ) -> list[TextContent]:
         """Handle a tool call."""
+        # The tool tables are keyed by interned literals; interning the
+        # incoming name lets every lookup below match by identity.
+        name = sys.intern(name)
         await self._ensure_initialized()
         
+        if fastjsonschema is not None and name in _TOOL_SCHEMAS:
+            try:
+                _get_tool_validator(name)(arguments)
+            except fastjsonschema.JsonSchemaException as e:
+                return [TextContent(
+                    type="text", text=_encode_error(f"Input validation error: {e.message}"),
+                )]
+        
         try:
             result = await self._dispatch_tool(name, arguments)
-            return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, default=str))]
+            if result is _GOOGLE_AUTH_ERROR:
+                return [TextContent(type="text", text=_GOOGLE_AUTH_ERROR_TEXT)]
+            if isinstance(result, _SplitResult):
+                return [
+                    TextContent(type="text", text=_encode_result(result.response)),
+                    TextContent(type="text", text=result.body),
+                ]
+            return [TextContent(type="text", text=_encode_result(result))]
         except Exception as e:
             logger.exception(f"Tool call failed: {name}")
-            return [TextContent(type="text", text=json.dumps({
-                "success": False,
-                "error": str(e),
-            }, ensure_ascii=False))]
-
-    async def _dispatch_tool(self, name: str, args: dict) -> dict:
-        """Dispatch tool call to appropriate handler."""
-
-        # Setup tools - always available (before full initialization)
-        if name == "get_setup_status":
-            if not self._setup_tools:
-                config_path = os.environ.get("PRISMIND_CONFIG", "config.toml")
-                self._setup_tools = SetupTools(config_path)
-
-            result = self._setup_tools.get_setup_status()
-            return {
-                "success": result.success,
-                "ready": result.ready,
-                "required_settings": [
-                    {
-                        "name": s.name,
-                        "required": s.required,
-                        "configured": s.configured,
-                        "current_value": s.current_value,
-                        "default_value": s.default_value,
-                        "description": s.description,
-                        "benefit": s.benefit,
-                    }
-                    for s in result.required_settings
-                ],
-                "optional_settings": [
-                    {
-                        "name": s.name,
-                        "required": s.required,
-                        "configured": s.configured,
-                        "current_value": s.current_value,
-                        "default_value": s.default_value,
-                        "description": s.description,
-                        "benefit": s.benefit,
-                    }
-                    for s in result.optional_settings
-                ],
-                "config_file_path": result.config_file_path,
-                "config_file_exists": result.config_file_exists,
-                "message": result.message,
-            }
-
-        elif name == "configure":
-            if not self._setup_tools:
-                config_path = os.environ.get("PRISMIND_CONFIG", "config.toml")
-                self._setup_tools = SetupTools(config_path)
+            return [TextContent(type="text", text=_encode_error(str(e)))]
 
-            result = self._setup_tools.configure(
-                setting=args["setting"],
-                value=args["value"],
-            )
-            return {
-                "success": result.success,
-                "setting_name": result.setting_name,
-                "old_value": result.old_value,
-                "new_value": result.new_value,
-                "validation_errors": result.validation_errors,
-                "message": result.message,
-            }
-
-        elif name == "check_services_status":
-            if not self._setup_tools:
-                config_path = os.environ.get("PRISMIND_CONFIG", "config.toml")
-                self._setup_tools = SetupTools(config_path)
-
-            detailed = args.get("detailed", False)
-            result = self._setup_tools.check_services_status(detailed=detailed)
-            services_data = []
-            for s in result.services:
-                service_dict = {
-                    "name": s.name,
-                    "available": s.available,
-                    "url": s.url,
-                    "message": s.message,
-                }
-                if detailed:
-                    service_dict["protocol"] = s.protocol
-                    service_dict["latency_ms"] = s.latency_ms
-                    service_dict["version"] = s.version
-                    service_dict["last_checked"] = s.last_checked
-                services_data.append(service_dict)
-
-            return {
-                "success": result.success,
-                "services": services_data,
-                "all_available": result.all_required_available,
-                "message": result.message,
-            }
+    async def _dispatch_tool(self, name: str, args: dict) -> Any:
+        """Dispatch tool call to appropriate handler.
 
-        elif name == "get_connection_info":
-            if not self._setup_tools:
-                config_path = os.environ.get("PRISMIND_CONFIG", "config.toml")
-                self._setup_tools = SetupTools(config_path)
-
-            result = self._setup_tools.get_connection_info()
-            response = {
-                "success": result.success,
-                "message": result.message,
-            }
-            if result.memory_server:
-                response["memory_server"] = {
-                    "name": result.memory_server.name,
-                    "url": result.memory_server.url,
-                    "protocol": result.memory_server.protocol,
-                    "status": result.memory_server.status,
-                    "latency_ms": result.memory_server.latency_ms,
-                    "version": result.memory_server.version,
-                    "last_checked": result.memory_server.last_checked,
-                }
-            if result.rag_server:
-                response["rag_server"] = {
-                    "name": result.rag_server.name,
-                    "url": result.rag_server.url,
-                    "protocol": result.rag_server.protocol,
-                    "status": result.rag_server.status,
-                    "latency_ms": result.rag_server.latency_ms,
-                    "version": result.rag_server.version,
-                    "collection": result.rag_server.collection,
-                    "last_checked": result.rag_server.last_checked,
-                }
-            if result.google:
-                response["google"] = {
-                    "authenticated": result.google.authenticated,
-                    "user": result.google.user,
-                    "scopes": result.google.scopes,
-                }
-            return response
-
-        elif name == "export_server_config":
-            if not self._setup_tools:
-                config_path = os.environ.get("PRISMIND_CONFIG", "config.toml")
-                self._setup_tools = SetupTools(config_path)
-
-            result = self._setup_tools.export_server_config()
-            return {
-                "success": result.success,
-                "config": result.config,
-                "message": result.message,
-            }
-
-        elif name == "import_server_config":
-            if not self._setup_tools:
-                config_path = os.environ.get("PRISMIND_CONFIG", "config.toml")
-                self._setup_tools = SetupTools(config_path)
-
-            result = self._setup_tools.import_server_config(
-                config=args["config"],
+        Handlers return either a response dict or, when the response is
+        exactly the result dataclass's fields, the result object itself;
+        ``_encode_result`` serializes both.
+        """
+        handler = self._handlers.get(name)
+        if handler is None:
+            return {"success": False, "error": f"Unknown tool: {name}"}
+        if handler is _google_auth_error:
+            return _GOOGLE_AUTH_ERROR
+        if name not in _READ_ONLY_TOOLS:
+            self._read_cache.clear()
+            self._read_cache_generation += 1
+            return await self._run_handler(handler, args)
+        if name not in _COALESCED_TOOLS:
+            return await self._run_handler(handler, args)
+
+        key = (name, json.dumps(args, sort_keys=True, default=str))
+        if name not in _CACHED_TOOLS:
+            return await self._dispatch_coalesced(key, handler, args)
+
+        cached = self._read_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _READ_CACHE_TTL:
+            return cached[1]
+        generation = self._read_cache_generation
+        result = await self._dispatch_coalesced(key, handler, args)
+        if (
+            generation == self._read_cache_generation
+            and (
+                result.get("success") if isinstance(result, dict)
+                else getattr(result, "success", False)
             )
-            return {
-                "success": result.success,
-                "imported_settings": result.imported_settings,
-                "skipped_settings": result.skipped_settings,
-                "validation_errors": result.validation_errors,
-                "message": result.message,
-            }
-
-        # Check if required tools are initialized
-        google_required_tools = [
-            "start_session", "end_session", "save_session", "update_session_progress",
-            "list_sessions", "delete_session", "update_summary",
-            "setup_project", "switch_project", "list_projects",
-            "update_project", "delete_project", "sync_projects_from_drive",
-            "get_document", "create_document", "update_document",
-            "delete_document", "list_documents",
-            "list_document_types", "register_document_type", "delete_document_type",
-            "find_similar_document_type",
-            "search_catalog", "sync_catalog",
-            "get_progress", "update_task_status", "add_task",
-            "get_task", "delete_task", "update_task",
-        ]
-
-        if name in google_required_tools and not self._project_tools:
-            return {
-                "success": False,
-                "error": "Google認証が完了していません。token.jsonが存在するか確認し、サーバーを再起動してください。",
-            }
+        ):
+            if len(self._read_cache) >= _READ_CACHE_MAX_ENTRIES:
+                self._read_cache.clear()
+            self._read_cache[key] = (time.monotonic(), result)
+        return result
 
-        # Session Management
-        if name == "start_session":
-            result = self._session_tools.start_session(
-                project=args.get("project"),
-            )
-            return {
-                "success": True,
-                "project": result.project,
-                "project_name": result.project_name,
-                "current_phase": result.current_phase,
-                "current_task": result.current_task,
-                "last_completed": result.last_completed,
-                "blockers": result.blockers,
-                "recommended_docs": [
-                    {"name": d.name, "doc_id": d.doc_id, "reason": d.reason}
-                    for d in result.recommended_docs
-                ],
-                "notes": result.notes,
-                "last_summary": result.last_summary,
-                "next_action": result.next_action,
-            }
-        
-        elif name == "end_session":
-            result = self._session_tools.end_session(
-                summary=args.get("summary"),
-                next_action=args.get("next_action"),
-                blockers=args.get("blockers"),
-                notes=args.get("notes"),
-                project=args.get("project"),
-            )
-            return {
-                "success": result.success,
-                "session_duration": str(result.session_duration),
-                "saved_to": result.saved_to,
-                "message": result.message,
-            }
+    async def _run_handler(
+        self,
+        handler: Callable[["PrismindServer", dict], Any],
+        args: dict,
+    ) -> Any:
+        """Run a synchronous tool handler on the tool executor thread.
 
-        elif name == "save_session":
-            result = self._session_tools.save_session(
-                summary=args.get("summary"),
-                next_action=args.get("next_action"),
-                blockers=args.get("blockers"),
-                notes=args.get("notes"),
-                current_phase=args.get("current_phase"),
-                current_task=args.get("current_task"),
-                project=args.get("project"),
-            )
-            return {
-                "success": result.success,
-                "saved_to": result.saved_to,
-                "message": result.message,
-            }
+        Args:
+            handler: Handler to run
+            args: Tool arguments
 
-        elif name == "update_session_progress":
-            result = self._session_tools.update_progress(
-                current_phase=args.get("current_phase"),
-                current_task=args.get("current_task"),
-                completed_task=args.get("completed_task"),
-                blockers=args.get("blockers"),
-                project=args.get("project"),
-            )
-            return {
-                "success": result.success,
-                "saved_to": result.saved_to,
-                "message": result.message,
-            }
+        Returns:
+            The handler result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, handler, self, args)
 
-        elif name == "list_sessions":
-            result = self._session_tools.list_sessions(
-                project=args.get("project"),
-                user=args.get("user"),
-            )
-            return {
-                "success": result.success,
-                "sessions": [
-                    {
-                        "project": s.project,
-                        "user": s.user,
-                        "current_phase": s.current_phase,
-                        "current_task": s.current_task,
-                        "last_completed": s.last_completed,
-                        "blockers": s.blockers,
-                        "last_summary": s.last_summary,
-                        "next_action": s.next_action,
-                        "updated_at": s.updated_at.isoformat() if s.updated_at else None,
-                    }
-                    for s in result.sessions
-                ],
-                "total_count": result.total_count,
-                "message": result.message,
-            }
+    async def _dispatch_coalesced(
+        self,
+        key: tuple[str, str],
+        handler: Callable[["PrismindServer", dict], Any],
+        args: dict,
+    ) -> Any:
+        """Run a read-only handler, sharing the result with identical concurrent calls.
 
-        elif name == "delete_session":
-            result = self._session_tools.delete_session(
-                project=args["project"],
-                user=args.get("user"),
-            )
-            return {
-                "success": result.success,
-                "project": result.project,
-                "user": result.user,
-                "message": result.message,
-            }
+        Args:
+            key: Tool name and canonical (sorted JSON) arguments
+            handler: Handler to run when no identical call is in flight
+            args: Tool arguments
 
-        # Project Management
-        elif name == "setup_project":
-            result = self._project_tools.setup_project(
-                project=args["project"],
-                name=args["name"],
-                spreadsheet_id=args.get("spreadsheet_id"),
-                root_folder_id=args.get("root_folder_id"),
-                description=args.get("description", ""),
-                create_sheets=args.get("create_sheets", True),
-                create_folders=args.get("create_folders", True),
-                force=args.get("force", False),
-            )
-            return {
-                "success": result.success,
-                "project_id": result.project_id,
-                "name": result.name,
-                "spreadsheet_id": result.spreadsheet_id,
-                "root_folder_id": result.root_folder_id,
-                "sheets_created": result.sheets_created,
-                "folders_created": result.folders_created,
-                "requires_confirmation": result.requires_confirmation,
-                "duplicate_id": result.duplicate_id,
-                "duplicate_name": result.duplicate_name,
-                "similar_projects": [
-                    {
-                        "project_id": sp.project_id,
-                        "name": sp.name,
-                        "similarity": sp.similarity_percent,
-                    }
-                    for sp in result.similar_projects
-                ],
-                "message": result.message,
-            }
-        
-        elif name == "switch_project":
-            result = self._project_tools.switch_project(
-                project=args["project"],
-            )
-            return {
-                "success": result.success,
-                "project_id": result.project_id,
-                "name": result.name,
-                "message": result.message,
-            }
-        
-        elif name == "list_projects":
-            result = self._project_tools.list_projects()
-            return {
-                "success": result.success,
-                "projects": [
-                    {
-                        "project_id": p.project_id,
-                        "name": p.name,
-                        "description": p.description,
-                        "updated_at": p.updated_at.isoformat(),
-                        "status": p.status,
-                    }
-                    for p in result.projects
-                ],
-                "current_project": result.current_project,
-                "message": result.message,
-            }
-        
-        elif name == "update_project":
-            result = self._project_tools.update_project(
-                project=args["project"],
-                name=args.get("name"),
-                description=args.get("description"),
-                spreadsheet_id=args.get("spreadsheet_id"),
-                root_folder_id=args.get("root_folder_id"),
-                status=args.get("status"),
-                categories=args.get("categories"),
-                phases=args.get("phases"),
-                template=args.get("template"),
-            )
-            return {
-                "success": result.success,
-                "project_id": result.project_id,
-                "updated_fields": result.updated_fields,
-                "message": result.message,
-            }
-        
-        elif name == "delete_project":
-            result = self._project_tools.delete_project(
-                project=args["project"],
-                confirm=args.get("confirm", False),
-                delete_drive_folder=args.get("delete_drive_folder", False),
-            )
-            return {
-                "success": result.success,
-                "project_id": result.project_id,
-                "message": result.message,
-                "drive_folder_deleted": result.drive_folder_deleted,
-            }
+        Returns:
+            The handler result
+        """
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._run_handler(handler, args))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so that one cancelled caller does not cancel the shared call
+        return await asyncio.shield(pending)
+
+    # Setup tools - always available (before full initialization)
+    def _h_get_setup_status(self, args: dict) -> Any:
+        """Handle get_setup_status."""
+        result = self._setup_tools.get_setup_status()
+        return result.to_dict()
+
+    def _h_configure(self, args: dict) -> Any:
+        """Handle configure."""
+        result = self._setup_tools.configure(
+            setting=args["setting"],
+            value=args["value"],
+        )
+        return result
+
+    def _h_check_services_status(self, args: dict) -> Any:
+        """Handle check_services_status."""
+        detailed = args.get("detailed", False)
+        result = self._setup_tools.check_services_status(detailed=detailed)
+        return result.to_dict(detailed=detailed)
+
+    def _h_get_connection_info(self, args: dict) -> Any:
+        """Handle get_connection_info."""
+        result = self._setup_tools.get_connection_info()
+        return result.to_dict()
+
+    def _h_export_server_config(self, args: dict) -> Any:
+        """Handle export_server_config."""
+        result = self._setup_tools.export_server_config()
+        return result
+
+    def _h_import_server_config(self, args: dict) -> Any:
+        """Handle import_server_config."""
+        result = self._setup_tools.import_server_config(
+            config=args["config"],
+        )
+        return result
 
-        elif name == "sync_projects_from_drive":
-            result = self._project_tools.sync_projects_from_drive(
-                dry_run=args.get("dry_run", False),
-            )
-            return {
-                "success": result.success,
-                "added": result.added,
-                "removed": result.removed,
-                "unchanged": result.unchanged,
-                "errors": result.errors,
-                "message": result.message,
-            }
+    # Session Management
+    def _h_start_session(self, args: dict) -> Any:
+        """Handle start_session."""
+        result = self._session_tools.start_session(
+            project=args.get("project"),
+        )
+        return {
+            "success": True,
+            "project": result.project,
+            "project_name": result.project_name,
+            "current_phase": result.current_phase,
+            "current_task": result.current_task,
+            "last_completed": result.last_completed,
+            "blockers": result.blockers,
+            "recommended_docs": [
+                {"name": d.name, "doc_id": d.doc_id, "reason": d.reason}
+                for d in result.recommended_docs
+            ],
+            "notes": result.notes,
+            "last_summary": result.last_summary,
+            "next_action": result.next_action,
+        }
+
+    def _h_end_session(self, args: dict) -> Any:
+        """Handle end_session."""
+        result = self._session_tools.end_session(
+            summary=args.get("summary"),
+            next_action=args.get("next_action"),
+            blockers=args.get("blockers"),
+            notes=args.get("notes"),
+            project=args.get("project"),
+        )
+        return {
+            "success": result.success,
+            "session_duration": str(result.session_duration),
+            "saved_to": result.saved_to,
+            "message": result.message,
+        }
+
+    def _h_save_session(self, args: dict) -> Any:
+        """Handle save_session."""
+        result = self._session_tools.save_session(
+            summary=args.get("summary"),
+            next_action=args.get("next_action"),
+            blockers=args.get("blockers"),
+            notes=args.get("notes"),
+            current_phase=args.get("current_phase"),
+            current_task=args.get("current_task"),
+            project=args.get("project"),
+        )
+        return result
+
+    def _h_update_session_progress(self, args: dict) -> Any:
+        """Handle update_session_progress."""
+        result = self._session_tools.update_progress(
+            current_phase=args.get("current_phase"),
+            current_task=args.get("current_task"),
+            completed_task=args.get("completed_task"),
+            blockers=args.get("blockers"),
+            project=args.get("project"),
+        )
+        return result
 
-        # Document Operations
-        elif name == "get_document":
-            result = self._document_tools.get_document(
-                query=args.get("query"),
-                doc_id=args.get("doc_id"),
-                doc_type=args.get("doc_type"),
-                phase_task=args.get("phase_task"),
-                project=args.get("project"),
-            )
-            
-            response = {
-                "found": result.found,
-                "message": result.message,
-            }
-            
-            if result.document:
-                response["document"] = {
-                    "doc_id": result.document.doc_id,
-                    "name": result.document.name,
-                    "doc_type": result.document.doc_type,
-                    "content": result.document.content,
-                    "source": result.document.source,
-                    "metadata": result.document.metadata,
+    def _h_list_sessions(self, args: dict) -> Any:
+        """Handle list_sessions."""
+        result = self._session_tools.list_sessions(
+            project=args.get("project"),
+            user=args.get("user"),
+        )
+        return {
+            "success": result.success,
+            "sessions": [
+                {
+                    "project": s.project,
+                    "user": s.user,
+                    "current_phase": s.current_phase,
+                    "current_task": s.current_task,
+                    "last_completed": s.last_completed,
+                    "blockers": s.blockers,
+                    "last_summary": s.last_summary,
+                    "next_action": s.next_action,
+                    "updated_at": s.updated_at.isoformat() if s.updated_at else None,
                 }
-            
-            if result.candidates:
-                response["candidates"] = [
-                    {"name": c.name, "doc_id": c.doc_id, "reason": c.reason}
-                    for c in result.candidates
-                ]
-            
-            return response
-        
-        elif name == "create_document":
-            result = self._document_tools.create_document(
-                name=args["name"],
-                doc_type=args["doc_type"],
-                content=args["content"],
-                phase_task=args["phase_task"],
-                feature=args.get("feature"),
-                keywords=args.get("keywords"),
-                project=args.get("project"),
-            )
-            return {
-                "success": result.success,
-                "doc_id": result.doc_id,
-                "name": result.name,
-                "doc_url": result.doc_url,
-                "source": result.source,
-                "catalog_registered": result.catalog_registered,
-                "message": result.message,
-            }
-        
-        elif name == "update_document":
-            # Build metadata dict for extended fields
-            metadata = {}
-            if args.get("doc_type"):
-                metadata["doc_type"] = args["doc_type"]
-            if args.get("phase_task"):
-                metadata["phase_task"] = args["phase_task"]
-            if args.get("feature"):
-                metadata["feature"] = args["feature"]
-
-            result = self._document_tools.update_document(
-                doc_id=args["doc_id"],
-                content=args.get("content"),
-                append=args.get("append", False),
-                metadata=metadata if metadata else None,
-                project=args.get("project"),
-            )
-            return {
-                "success": result.success,
-                "doc_id": result.doc_id,
-                "updated_fields": result.updated_fields,
-                "message": result.message,
-            }
-
-        elif name == "delete_document":
-            result = self._document_tools.delete_document(
-                doc_id=args["doc_id"],
-                project=args["project"],
-                delete_drive_file=args.get("delete_drive_file", False),
-                soft_delete=args.get("soft_delete", True),
-            )
-            return {
-                "success": result.success,
-                "doc_id": result.doc_id,
-                "project": result.project,
-                "catalog_deleted": result.catalog_deleted,
-                "sheet_row_deleted": result.sheet_row_deleted,
-                "drive_file_deleted": result.drive_file_deleted,
-                "knowledge_deleted_count": result.knowledge_deleted_count,
-                "message": result.message,
-            }
-
-        elif name == "list_documents":
-            result = self._document_tools.list_documents(
-                project=args.get("project"),
-                doc_type=args.get("doc_type"),
-                phase_task=args.get("phase_task"),
-                feature=args.get("feature"),
-                limit=args.get("limit", 50),
-                offset=args.get("offset", 0),
-                sort_by=args.get("sort_by", "updated_at"),
-                sort_order=args.get("sort_order", "desc"),
-            )
-            return {
-                "success": result.success,
-                "documents": [
-                    {
-                        "doc_id": d.doc_id,
-                        "name": d.name,
-                        "doc_type": d.doc_type,
-                        "phase_task": d.phase_task,
-                        "feature": d.feature,
-                        "source": d.source,
-                        "url": d.url,
-                        "updated_at": d.updated_at,
-                    }
-                    for d in result.documents
-                ],
-                "total_count": result.total_count,
-                "offset": result.offset,
-                "limit": result.limit,
-                "message": result.message,
-            }
-
-        # Document Type Management
-        elif name == "list_document_types":
-            result = self._document_tools.list_document_types()
-            return {
-                "success": result.success,
-                "document_types": [
-                    {
-                        "type_id": dt.type_id,
-                        "name": dt.name,
-                        "folder_name": dt.folder_name,
-                        "template_doc_id": dt.template_doc_id,
-                        "description": dt.description,
-                        "fields": dt.fields,
-                        "is_global": dt.is_global,
-                    }
-                    for dt in result.document_types
-                ],
-                "message": result.message,
-            }
+                for s in result.sessions
+            ],
+            "total_count": result.total_count,
+            "message": result.message,
+        }
+
+    def _h_delete_session(self, args: dict) -> Any:
+        """Handle delete_session."""
+        result = self._session_tools.delete_session(
+            project=args["project"],
+            user=args.get("user"),
+        )
+        return result
 
-        elif name == "register_document_type":
-            result = self._document_tools.register_document_type(
-                type_id=args["type_id"],
-                name=args["name"],
-                folder_name=args["folder_name"],
-                scope=args.get("scope", "global"),
-                template_doc_id=args.get("template_doc_id"),
-                description=args.get("description"),
-                fields=args.get("fields"),
-                create_folder=args.get("create_folder", True),
-            )
-            return {
-                "success": result.success,
-                "type_id": result.type_id,
-                "name": result.name,
-                "folder_created": result.folder_created,
-                "message": result.message,
-            }
+    # Project Management
+    def _h_setup_project(self, args: dict) -> Any:
+        """Handle setup_project."""
+        result = self._project_tools.setup_project(
+            project=args["project"],
+            name=args["name"],
+            spreadsheet_id=args.get("spreadsheet_id"),
+            root_folder_id=args.get("root_folder_id"),
+            description=args.get("description", ""),
+            create_sheets=args.get("create_sheets", True),
+            create_folders=args.get("create_folders", True),
+            force=args.get("force", False),
+        )
+        return {
+            "success": result.success,
+            "project_id": result.project_id,
+            "name": result.name,
+            "spreadsheet_id": result.spreadsheet_id,
+            "root_folder_id": result.root_folder_id,
+            "sheets_created": result.sheets_created,
+            "folders_created": result.folders_created,
+            "requires_confirmation": result.requires_confirmation,
+            "duplicate_id": result.duplicate_id,
+            "duplicate_name": result.duplicate_name,
+            "similar_projects": [
+                {
+                    "project_id": sp.project_id,
+                    "name": sp.name,
+                    "similarity": sp.similarity_percent,
+                }
+                for sp in result.similar_projects
+            ],
+            "message": result.message,
+        }
+
+    def _h_switch_project(self, args: dict) -> Any:
+        """Handle switch_project."""
+        result = self._project_tools.switch_project(
+            project=args["project"],
+        )
+        return result
+
+    def _h_list_projects(self, args: dict) -> Any:
+        """Handle list_projects."""
+        result = self._project_tools.list_projects()
+        return result
+
+    def _h_update_project(self, args: dict) -> Any:
+        """Handle update_project."""
+        result = self._project_tools.update_project(
+            project=args["project"],
+            name=args.get("name"),
+            description=args.get("description"),
+            spreadsheet_id=args.get("spreadsheet_id"),
+            root_folder_id=args.get("root_folder_id"),
+            status=args.get("status"),
+            categories=args.get("categories"),
+            phases=args.get("phases"),
+            template=args.get("template"),
+        )
+        return result
+
+    def _h_delete_project(self, args: dict) -> Any:
+        """Handle delete_project."""
+        result = self._project_tools.delete_project(
+            project=args["project"],
+            confirm=args.get("confirm", False),
+            delete_drive_folder=args.get("delete_drive_folder", False),
+        )
+        return result
 
-        elif name == "delete_document_type":
-            result = self._document_tools.delete_document_type(
-                type_id=args["type_id"],
-                scope=args.get("scope", "global"),
-            )
-            return {
-                "success": result.success,
-                "type_id": result.type_id,
-                "message": result.message,
-            }
+    def _h_sync_projects_from_drive(self, args: dict) -> Any:
+        """Handle sync_projects_from_drive."""
+        result = self._project_tools.sync_projects_from_drive(
+            dry_run=args.get("dry_run", False),
+        )
+        return result
 
-        elif name == "find_similar_document_type":
-            result = self._document_tools.find_similar_document_type(
-                type_query=args["type_query"],
-                threshold=args.get("threshold", 0.75),
-            )
-            return result
-
-        # Catalog Operations
-        elif name == "search_catalog":
-            result = self._catalog_tools.search_catalog(
-                query=args.get("query"),
-                doc_type=args.get("doc_type"),
-                phase_task=args.get("phase_task"),
-                feature=args.get("feature"),
-                limit=args.get("limit", 10),
-            )
-            return {
-                "success": result.success,
-                "total_count": result.total_count,
-                "documents": [
-                    {
-                        "doc_id": d.doc_id,
-                        "name": d.name,
-                        "doc_type": d.doc_type,
-                        "phase_task": d.phase_task,
-                        "feature": d.feature,
-                        "source": d.source,
-                    }
-                    for d in result.documents
-                ],
-                "message": result.message,
-            }
-        
-        elif name == "sync_catalog":
-            result = self._catalog_tools.sync_catalog(
-                project=args.get("project"),
-            )
-            return {
-                "success": result.success,
-                "synced_count": result.synced_count,
-                "message": result.message,
-            }
-        
-        # Knowledge Operations
-        elif name == "add_knowledge":
-            result = self._knowledge_tools.add_knowledge(
-                content=args["content"],
-                category=args["category"],
-                project=args.get("project"),
-                tags=args.get("tags"),
-                source=args.get("source"),
-            )
-            return {
-                "success": result.success,
-                "knowledge_id": result.knowledge_id,
-                "tags": result.tags,
-                "message": result.message,
-            }
-        
-        elif name == "search_knowledge":
-            result = self._knowledge_tools.search_knowledge(
-                query=args["query"],
-                category=args.get("category"),
-                project=args.get("project"),
-                tags=args.get("tags"),
-                include_general=args.get("include_general", True),
-                limit=args.get("limit", 5),
-            )
-            return {
-                "success": result.success,
-                "total_count": result.total_count,
-                "knowledge": [
-                    {
-                        "knowledge_id": k.knowledge_id,
-                        "content": k.content,
-                        "category": k.category,
-                        "project": k.project,
-                        "tags": k.tags,
-                        "source": k.source,
-                        "relevance_score": k.relevance_score,
-                    }
-                    for k in result.knowledge
-                ],
-                "message": result.message,
-            }
+    # Document Operations
+    def _h_get_document(self, args: dict) -> Any:
+        """Handle get_document."""
+        result = self._document_tools.get_document(
+            query=args.get("query"),
+            doc_id=args.get("doc_id"),
+            doc_type=args.get("doc_type"),
+            phase_task=args.get("phase_task"),
+            project=args.get("project"),
+            include_content=args.get("include_content", True),
+        )
 
-        elif name == "update_knowledge":
-            result = self._knowledge_tools.update_knowledge(
-                knowledge_id=args["knowledge_id"],
-                content=args.get("content"),
-                category=args.get("category"),
-                tags=args.get("tags"),
-                source=args.get("source"),
-            )
-            return {
-                "success": result.success,
-                "knowledge_id": result.knowledge_id,
-                "updated_fields": result.updated_fields,
-                "message": result.message,
+        response = {
+            "found": result.found,
+            "message": result.message,
+        }
+
+        if result.document:
+            response["document"] = {
+                "doc_id": result.document.doc_id,
+                "name": result.document.name,
+                "doc_type": result.document.doc_type,
+                "content": result.document.content,
+                "source": result.document.source,
+                "metadata": result.document.metadata,
             }
 
-        elif name == "delete_knowledge":
-            result = self._knowledge_tools.delete_knowledge(
-                knowledge_id=args.get("knowledge_id", ""),
-                project=args.get("project"),
-                user=user,
-            )
-            return {
-                "success": result.success,
-                "knowledge_id": result.knowledge_id,
-                "project": result.project,
-                "rag_deleted": result.rag_deleted,
-                "cache_cleared": result.cache_cleared,
-                "message": result.message,
-            }
+        if result.candidates:
+            response["candidates"] = [
+                {"name": c.name, "doc_id": c.doc_id, "reason": c.reason}
+                for c in result.candidates
+            ]
 
-        # Progress Management
-        elif name == "get_progress":
-            if not self._progress_tools:
-                return {"success": False, "error": "Progress tools not initialized"}
-            result = self._progress_tools.get_progress(
-                project=args.get("project"),
-                phase=args.get("phase"),
-            )
-            return {
-                "success": result.success,
-                "project": result.project,
-                "current_phase": result.current_phase,
-                "phases": [
-                    {
-                        "phase": p.phase,
-                        "status": p.status,
-                        "tasks": [
-                            {
-                                "task_id": t.task_id,
-                                "name": t.name,
-                                "status": t.status,
-                                "blockers": t.blockers,
-                                "completed_at": t.completed_at.isoformat() if t.completed_at else None,
-                                "notes": t.notes,
-                            }
-                            for t in p.tasks
-                        ],
-                    }
-                    for p in result.phases
-                ],
-                "message": result.message,
-            }
+        content = result.document.content if result.document else ""
+        if content and len(content) > _LARGE_CONTENT_THRESHOLD:
+            # Keep the body out of the JSON so it is not escaped and copied
+            # into one giant string together with the metadata
+            del response["document"]["content"]
+            response["document"]["content_in_next_block"] = True
+            return _SplitResult(response=response, body=content)
+
+        return response
+
+    def _h_create_document(self, args: dict) -> Any:
+        """Handle create_document."""
+        result = self._document_tools.create_document(
+            name=args["name"],
+            doc_type=args["doc_type"],
+            content=args["content"],
+            phase_task=args["phase_task"],
+            feature=args.get("feature"),
+            keywords=args.get("keywords"),
+            project=args.get("project"),
+        )
+        return _create_document_response(result)
+
+    def _h_create_documents(self, args: dict) -> Any:
+        """Handle create_documents."""
+        results = self._document_tools.bulk_create_documents(
+            documents=[
+                {
+                    "name": doc["name"],
+                    "doc_type": doc["doc_type"],
+                    "content": doc["content"],
+                    "phase_task": doc["phase_task"],
+                    "feature": doc.get("feature"),
+                    "keywords": doc.get("keywords"),
+                }
+                for doc in args["documents"]
+            ],
+            project=args.get("project"),
+        )
+        return {
+            "success": bool(results) and all(result.success for result in results),
+            "documents": [_create_document_response(result) for result in results],
+        }
+
+    def _h_update_document(self, args: dict) -> Any:
+        """Handle update_document."""
+        # Build metadata dict for extended fields
+        metadata = {}
+        if args.get("doc_type"):
+            metadata["doc_type"] = args["doc_type"]
+        if args.get("phase_task"):
+            metadata["phase_task"] = args["phase_task"]
+        if args.get("feature"):
+            metadata["feature"] = args["feature"]
+
+        result = self._document_tools.update_document(
+            doc_id=args["doc_id"],
+            content=args.get("content"),
+            append=args.get("append", False),
+            metadata=metadata if metadata else None,
+            project=args.get("project"),
+        )
+        return result
+
+    def _h_delete_document(self, args: dict) -> Any:
+        """Handle delete_document."""
+        result = self._document_tools.delete_document(
+            doc_id=args["doc_id"],
+            project=args["project"],
+            delete_drive_file=args.get("delete_drive_file", False),
+            soft_delete=args.get("soft_delete", True),
+        )
+        return result
+
+    def _h_list_documents(self, args: dict) -> Any:
+        """Handle list_documents."""
+        result = self._document_tools.list_documents(
+            project=args.get("project"),
+            doc_type=args.get("doc_type"),
+            phase_task=args.get("phase_task"),
+            feature=args.get("feature"),
+            limit=args.get("limit", 50),
+            offset=args.get("offset", 0),
+            sort_by=args.get("sort_by", "updated_at"),
+            sort_order=args.get("sort_order", "desc"),
+        )
+        return {
+            "success": result.success,
+            "documents": [
+                {
+                    "doc_id": d.doc_id,
+                    "name": d.name,
+                    "doc_type": d.doc_type,
+                    "phase_task": d.phase_task,
+                    "feature": d.feature,
+                    "source": d.source,
+                    "url": d.url,
+                    "updated_at": d.updated_at,
+                }
+                for d in result.documents
+            ],
+            "total_count": result.total_count,
+            "offset": result.offset,
+            "limit": result.limit,
+            "message": result.message,
+        }
 
-        elif name == "update_task_status":
-            if not self._progress_tools:
-                return {"success": False, "error": "Progress tools not initialized"}
-            result = self._progress_tools.update_task_status(
-                task_id=args["task_id"],
-                status=args["status"],
-                phase=args.get("phase"),
-                blockers=args.get("blockers"),
-                notes=args.get("notes"),
-                project=args.get("project"),
-            )
-            return {
-                "success": result.success,
-                "project": result.project,
-                "task_id": result.task_id,
-                "updated_fields": result.updated_fields,
-                "message": result.message,
-            }
+    # Document Type Management
+    def _h_list_document_types(self, args: dict) -> Any:
+        """Handle list_document_types."""
+        result = self._document_tools.list_document_types()
+        return result.to_dict()
+
+    def _h_register_document_type(self, args: dict) -> Any:
+        """Handle register_document_type."""
+        result = self._document_tools.register_document_type(
+            type_id=args["type_id"],
+            name=args["name"],
+            folder_name=args["folder_name"],
+            scope=args.get("scope", "global"),
+            template_doc_id=args.get("template_doc_id"),
+            description=args.get("description"),
+            fields=args.get("fields"),
+            create_folder=args.get("create_folder", True),
+        )
+        return result
 
-        elif name == "add_task":
-            if not self._progress_tools:
-                return {"success": False, "error": "Progress tools not initialized"}
-            result = self._progress_tools.add_task(
-                phase=args["phase"],
-                task_id=args["task_id"],
-                name=args["name"],
-                description=args.get("description", ""),
-                project=args.get("project"),
-            )
-            return {
-                "success": result.success,
-                "project": result.project,
-                "task_id": result.task_id,
-                "updated_fields": result.updated_fields,
-                "message": result.message,
-            }
+    def _h_delete_document_type(self, args: dict) -> Any:
+        """Handle delete_document_type."""
+        result = self._document_tools.delete_document_type(
+            type_id=args["type_id"],
+            scope=args.get("scope", "global"),
+        )
+        return result
 
-        elif name == "complete_task":
-            if not self._progress_tools:
-                return {"success": False, "error": "Progress tools not initialized"}
-            result = self._progress_tools.complete_task(
-                task_id=args["task_id"],
-                phase=args.get("phase"),
-                notes=args.get("notes"),
-                project=args.get("project"),
-            )
-            return {
-                "success": result.success,
-                "project": result.project,
-                "task_id": result.task_id,
-                "updated_fields": result.updated_fields,
-                "message": result.message,
-            }
+    def _h_find_similar_document_type(self, args: dict) -> Any:
+        """Handle find_similar_document_type."""
+        result = self._document_tools.find_similar_document_type(
+            type_query=args["type_query"],
+            threshold=args.get("threshold", 0.75),
+        )
+        return result
 
-        elif name == "start_task":
-            if not self._progress_tools:
-                return {"success": False, "error": "Progress tools not initialized"}
-            result = self._progress_tools.start_task(
-                task_id=args["task_id"],
-                phase=args.get("phase"),
-                project=args.get("project"),
-            )
-            return {
-                "success": result.success,
-                "project": result.project,
-                "task_id": result.task_id,
-                "updated_fields": result.updated_fields,
-                "message": result.message,
-            }
+    # Catalog Operations
+    def _h_search_catalog(self, args: dict) -> Any:
+        """Handle search_catalog."""
+        result = self._catalog_tools.search_catalog(
+            query=args.get("query"),
+            doc_type=args.get("doc_type"),
+            phase_task=args.get("phase_task"),
+            phase_tasks=args.get("phase_tasks"),
+            feature=args.get("feature"),
+            limit=args.get("limit", 10),
+        )
+        return result.to_dict()
 
-        elif name == "block_task":
-            if not self._progress_tools:
-                return {"success": False, "error": "Progress tools not initialized"}
-            result = self._progress_tools.block_task(
-                task_id=args["task_id"],
-                blockers=args["blockers"],
-                phase=args.get("phase"),
-                project=args.get("project"),
-            )
-            return {
-                "success": result.success,
-                "project": result.project,
-                "task_id": result.task_id,
-                "updated_fields": result.updated_fields,
-                "message": result.message,
-            }
+    def _h_sync_catalog(self, args: dict) -> Any:
+        """Handle sync_catalog."""
+        result = self._catalog_tools.sync_catalog(
+            project=args.get("project"),
+        )
+        return result
 
-        elif name == "get_task":
-            if not self._progress_tools:
-                return {"success": False, "error": "Progress tools not initialized"}
-            result = self._progress_tools.get_task(
-                task_id=args["task_id"],
-                phase=args.get("phase"),
-                project=args.get("project"),
-            )
-            task_dict = None
-            if result.task:
-                task_dict = {
-                    "task_id": result.task.task_id,
-                    "name": result.task.name,
-                    "status": result.task.status,
-                    "blockers": result.task.blockers,
-                    "completed_at": result.task.completed_at.isoformat() if result.task.completed_at else None,
-                    "notes": result.task.notes,
-                    "priority": result.task.priority,
-                    "category": result.task.category,
-                    "blocked_by": result.task.blocked_by,
+    # Knowledge Operations
+    def _h_add_knowledge(self, args: dict) -> Any:
+        """Handle add_knowledge."""
+        result = self._knowledge_tools.add_knowledge(
+            content=args["content"],
+            category=args["category"],
+            project=args.get("project"),
+            tags=args.get("tags"),
+            source=args.get("source"),
+        )
+        return result
+
+    def _h_search_knowledge(self, args: dict) -> Any:
+        """Handle search_knowledge."""
+        result = self._knowledge_tools.search_knowledge(
+            query=args["query"],
+            category=args.get("category"),
+            project=args.get("project"),
+            tags=args.get("tags"),
+            include_general=args.get("include_general", True),
+            limit=args.get("limit", 5),
+        )
+        return {
+            "success": result.success,
+            "total_count": result.total_count,
+            "knowledge": [
+                {
+                    "knowledge_id": k.knowledge_id,
+                    "content": k.content,
+                    "category": k.category,
+                    "project": k.project,
+                    "tags": k.tags,
+                    "source": k.source,
+                    "relevance_score": k.relevance_score,
                 }
-            return {
-                "success": result.success,
-                "task": task_dict,
-                "phase": result.phase,
-                "project": result.project,
-                "message": result.message,
-            }
-
-        elif name == "delete_task":
-            if not self._progress_tools:
-                return {"success": False, "error": "Progress tools not initialized"}
-            result = self._progress_tools.delete_task(
-                task_id=args["task_id"],
-                phase=args.get("phase"),
-                project=args.get("project"),
-            )
-            return {
-                "success": result.success,
-                "task_id": result.task_id,
-                "phase": result.phase,
-                "project": result.project,
-                "dependent_tasks_updated": result.dependent_tasks_updated,
-                "message": result.message,
-            }
-
-        elif name == "update_task":
-            if not self._progress_tools:
-                return {"success": False, "error": "Progress tools not initialized"}
-            result = self._progress_tools.update_task(
-                task_id=args["task_id"],
-                phase=args.get("phase"),
-                name=args.get("name"),
-                description=args.get("description"),
-                status=args.get("status"),
-                priority=args.get("priority"),
-                category=args.get("category"),
-                blocked_by=args.get("blocked_by"),
-                blockers=args.get("blockers"),
-                new_phase=args.get("new_phase"),
-                project=args.get("project"),
-            )
-            return {
-                "success": result.success,
-                "task_id": result.task_id,
-                "project": result.project,
-                "updated_fields": result.updated_fields,
-                "phase_moved": result.phase_moved,
-                "old_phase": result.old_phase,
-                "new_phase": result.new_phase,
-                "message": result.message,
-            }
+                for k in result.knowledge
+            ],
+            "message": result.message,
+        }
+
+    def _h_update_knowledge(self, args: dict) -> Any:
+        """Handle update_knowledge."""
+        result = self._knowledge_tools.update_knowledge(
+            knowledge_id=args["knowledge_id"],
+            content=args.get("content"),
+            category=args.get("category"),
+            tags=args.get("tags"),
+            source=args.get("source"),
+        )
+        return result
+
+    def _h_delete_knowledge(self, args: dict) -> Any:
+        """Handle delete_knowledge."""
+        result = self._knowledge_tools.delete_knowledge(
+            knowledge_id=args.get("knowledge_id", ""),
+            project=args.get("project"),
+            user=args.get("user"),
+        )
+        return result
 
-        # Summary Operations
-        elif name == "update_summary":
-            if not self._session_tools:
-                return {"success": False, "error": "Session tools not initialized"}
-            result = self._session_tools.update_summary(
-                project=args.get("project"),
-                description=args.get("description"),
-                current_phase=args.get("current_phase"),
-                completed_tasks=args.get("completed_tasks"),
-                total_tasks=args.get("total_tasks"),
-                custom_fields=args.get("custom_fields"),
-            )
-            return {
-                "success": result.success,
-                "project": result.project,
-                "updated_fields": result.updated_fields,
-                "message": result.message,
-            }
+    # Progress Management
+    def _h_get_progress(self, args: dict) -> Any:
+        """Handle get_progress."""
+        if not self._progress_tools:
+            return {"success": False, "error": "Progress tools not initialized"}
+        result = self._progress_tools.get_progress(
+            project=args.get("project"),
+            phase=args.get("phase"),
+        )
+        return result.to_dict()
+
+    def _h_update_task_status(self, args: dict) -> Any:
+        """Handle update_task_status."""
+        if not self._progress_tools:
+            return {"success": False, "error": "Progress tools not initialized"}
+        result = self._progress_tools.update_task_status(
+            task_id=args["task_id"],
+            status=args["status"],
+            phase=args.get("phase"),
+            blockers=args.get("blockers"),
+            notes=args.get("notes"),
+            project=args.get("project"),
+        )
+        return result
+
+    def _h_add_task(self, args: dict) -> Any:
+        """Handle add_task."""
+        if not self._progress_tools:
+            return {"success": False, "error": "Progress tools not initialized"}
+        result = self._progress_tools.add_task(
+            phase=args["phase"],
+            task_id=args["task_id"],
+            name=args["name"],
+            description=args.get("description", ""),
+            project=args.get("project"),
+        )
+        return result
+
+    def _h_complete_task(self, args: dict) -> Any:
+        """Handle complete_task."""
+        if not self._progress_tools:
+            return {"success": False, "error": "Progress tools not initialized"}
+        result = self._progress_tools.complete_task(
+            task_id=args["task_id"],
+            phase=args.get("phase"),
+            notes=args.get("notes"),
+            project=args.get("project"),
+        )
+        return result
+
+    def _h_start_task(self, args: dict) -> Any:
+        """Handle start_task."""
+        if not self._progress_tools:
+            return {"success": False, "error": "Progress tools not initialized"}
+        result = self._progress_tools.start_task(
+            task_id=args["task_id"],
+            phase=args.get("phase"),
+            project=args.get("project"),
+        )
+        return result
+
+    def _h_block_task(self, args: dict) -> Any:
+        """Handle block_task."""
+        if not self._progress_tools:
+            return {"success": False, "error": "Progress tools not initialized"}
+        result = self._progress_tools.block_task(
+            task_id=args["task_id"],
+            blockers=args["blockers"],
+            phase=args.get("phase"),
+            project=args.get("project"),
+        )
+        return result
+
+    def _h_get_task(self, args: dict) -> Any:
+        """Handle get_task."""
+        if not self._progress_tools:
+            return {"success": False, "error": "Progress tools not initialized"}
+        result = self._progress_tools.get_task(
+            task_id=args["task_id"],
+            phase=args.get("phase"),
+            project=args.get("project"),
+        )
+        return result.to_dict()
+
+    def _h_delete_task(self, args: dict) -> Any:
+        """Handle delete_task."""
+        if not self._progress_tools:
+            return {"success": False, "error": "Progress tools not initialized"}
+        result = self._progress_tools.delete_task(
+            task_id=args["task_id"],
+            phase=args.get("phase"),
+            project=args.get("project"),
+        )
+        return result
+
+    def _h_update_task(self, args: dict) -> Any:
+        """Handle update_task."""
+        if not self._progress_tools:
+            return {"success": False, "error": "Progress tools not initialized"}
+        result = self._progress_tools.update_task(
+            task_id=args["task_id"],
+            phase=args.get("phase"),
+            name=args.get("name"),
+            description=args.get("description"),
+            status=args.get("status"),
+            priority=args.get("priority"),
+            category=args.get("category"),
+            blocked_by=args.get("blocked_by"),
+            blockers=args.get("blockers"),
+            new_phase=args.get("new_phase"),
+            project=args.get("project"),
+        )
+        return result
 
-        else:
-            return {"success": False, "error": f"Unknown tool: {name}"}
+    # Summary Operations
+    def _h_update_summary(self, args: dict) -> Any:
+        """Handle update_summary."""
+        if not self._session_tools:
+            return {"success": False, "error": "Session tools not initialized"}
+        result = self._session_tools.update_summary(
+            project=args.get("project"),
+            description=args.get("description"),
+            current_phase=args.get("current_phase"),
+            completed_tasks=args.get("completed_tasks"),
+            total_tasks=args.get("total_tasks"),
+            custom_fields=args.get("custom_fields"),
+        )
+        return result
+
+    _HANDLERS: dict[str, Callable[["PrismindServer", dict], Any]] = {
+        "get_setup_status": _h_get_setup_status,
+        "configure": _h_configure,
+        "check_services_status": _h_check_services_status,
+        "get_connection_info": _h_get_connection_info,
+        "export_server_config": _h_export_server_config,
+        "import_server_config": _h_import_server_config,
+        "start_session": _h_start_session,
+        "end_session": _h_end_session,
+        "save_session": _h_save_session,
+        "update_session_progress": _h_update_session_progress,
+        "list_sessions": _h_list_sessions,
+        "delete_session": _h_delete_session,
+        "setup_project": _h_setup_project,
+        "switch_project": _h_switch_project,
+        "list_projects": _h_list_projects,
+        "update_project": _h_update_project,
+        "delete_project": _h_delete_project,
+        "sync_projects_from_drive": _h_sync_projects_from_drive,
+        "get_document": _h_get_document,
+        "create_document": _h_create_document,
+        "create_documents": _h_create_documents,
+        "update_document": _h_update_document,
+        "delete_document": _h_delete_document,
+        "list_documents": _h_list_documents,
+        "list_document_types": _h_list_document_types,
+        "register_document_type": _h_register_document_type,
+        "delete_document_type": _h_delete_document_type,
+        "find_similar_document_type": _h_find_similar_document_type,
+        "search_catalog": _h_search_catalog,
+        "sync_catalog": _h_sync_catalog,
+        "add_knowledge": _h_add_knowledge,
+        "search_knowledge": _h_search_knowledge,
+        "update_knowledge": _h_update_knowledge,
+        "delete_knowledge": _h_delete_knowledge,
+        "get_progress": _h_get_progress,
+        "update_task_status": _h_update_task_status,
+        "add_task": _h_add_task,
+        "complete_task": _h_complete_task,
+        "start_task": _h_start_task,
+        "block_task": _h_block_task,
+        "get_task": _h_get_task,
+        "delete_task": _h_delete_task,
+        "update_task": _h_update_task,
+        "update_summary": _h_update_summary,
+    }
 
     async def run(self):
         """Run the server."""
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options(),
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options(),
+                )
+        finally:
+            self._save_init_snapshot()
+            if self._refresh_task is not None:
+                self._refresh_task.cancel()
+            self._executor.shutdown(wait=False)
+            RAG_EXECUTOR.shutdown(wait=False)
 
 
 def main():
     """Entry point."""
     # Load config first to setup logging correctly
-    config_path = os.environ.get("PRISMIND_CONFIG", "config.toml")
-    config = load_config(Path(config_path))
+    config = load_config(Path(_CONFIG_PATH))
     config.setup_logging()
 
     server = PrismindServer()
@@ -1,15 +1,45 @@
 """Catalog management tools for Spirrow-Prismind."""
 
+import functools
+import hashlib
 import logging
 from datetime import datetime
 from typing import Optional
 
-from ..integrations import GoogleSheetsClient, RAGClient
+from ..integrations import RAG_EXECUTOR, GoogleSheetsClient, RAGClient
 from ..models import CatalogEntry, SearchCatalogResult, SyncCatalogResult
 from .project_tools import ProjectTools
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of catalog entries sent to the RAG server per request
+SYNC_BATCH_SIZE = 500
+
+# First-column titles that mark a catalog sheet header row
+_CATALOG_HEADER_NAMES = frozenset({"ドキュメント名", "名前", "Name"})
+
+# Values of the 13 catalog sheet columns when a row is too short to have them
+_CATALOG_ROW_DEFAULTS = ("",) * 12 + ("active",)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_updated_at(value: str) -> Optional[datetime]:
+    """Parse a stored updated_at timestamp.
+
+    Catalog searches see the same timestamps over and over, so parsed
+    values are cached.
+
+    Args:
+        value: ISO 8601 timestamp
+
+    Returns:
+        Parsed datetime, or None if the value is not ISO 8601
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
 
 class CatalogTools:
     """Tools for catalog management."""
@@ -43,6 +73,7 @@ class CatalogTools:
         feature: Optional[str] = None,
         reference_timing: Optional[str] = None,
         status: str = "active",
+        phase_tasks: Optional[list[str]] = None,
         limit: int = 10,
         user: Optional[str] = None,
     ) -> SearchCatalogResult:
@@ -56,6 +87,8 @@ class CatalogTools:
             feature: Filter by feature
             reference_timing: Filter by reference timing
             status: Filter by status (active/archived/all)
+            phase_tasks: Filter by any of several phase-tasks in a single
+                query (used when phase_task is not set)
             limit: Maximum results
             user: User ID
             
@@ -68,6 +101,12 @@ class CatalogTools:
         if project is None:
             project = self.project_tools.get_current_project_id(user)
         
+        # Entries without a status are active, which the vector store cannot
+        # express, so only other statuses are filtered there. "active" is
+        # checked below and needs a few extra results to filter from.
+        status_filter = status if status not in ("active", "all") else None
+        n_results = limit * 2 if status == "active" else limit
+        
         # Build search
         if query:
             # Semantic search with filters
@@ -76,7 +115,11 @@ class CatalogTools:
                 project=project,
                 doc_type=doc_type,
                 phase_task=phase_task,
-                n_results=limit * 2,  # Get more for filtering
+                phase_tasks=phase_tasks,
+                feature=feature,
+                reference_timing=reference_timing,
+                status=status_filter,
+                n_results=n_results,
             )
         else:
             # Metadata-only search
@@ -88,10 +131,18 @@ class CatalogTools:
                 where["doc_type"] = {"$eq": doc_type}
             if phase_task:
                 where["phase_task"] = {"$eq": phase_task}
+            elif phase_tasks:
+                where["phase_task"] = {"$in": list(phase_tasks)}
+            if feature:
+                where["feature"] = {"$eq": feature}
+            if reference_timing:
+                where["reference_timing"] = {"$eq": reference_timing}
+            if status_filter:
+                where["status"] = {"$eq": status_filter}
             
             result = self.rag.search_by_metadata(
                 where=where,
-                n_results=limit * 2,
+                n_results=n_results,
             )
         
         if not result.success:
@@ -104,27 +155,16 @@ class CatalogTools:
         
         # Convert to CatalogEntry and filter
         documents = []
+        now = datetime.now()
         for doc in result.documents:
             meta = doc.metadata
             
-            # Apply additional filters
-            if feature and meta.get("feature") != feature:
-                continue
-            
-            if reference_timing and meta.get("reference_timing") != reference_timing:
+            if status == "active" and meta.get("status", "active") != "active":
                 continue
             
-            if status != "all":
-                doc_status = meta.get("status", "active")
-                if doc_status != status:
-                    continue
-            
             # Parse updated_at
             updated_at_str = meta.get("updated_at", "")
-            try:
-                updated_at = datetime.fromisoformat(updated_at_str) if updated_at_str else datetime.now()
-            except ValueError:
-                updated_at = datetime.now()
+            updated_at = (_parse_updated_at(updated_at_str) if updated_at_str else None) or now
             
             documents.append(CatalogEntry(
                 doc_id=meta.get("doc_id", ""),
@@ -185,20 +225,26 @@ class CatalogTools:
             )
         
         try:
-            # Check if catalog sheet exists
-            if not self.sheets.sheet_exists(config.spreadsheet_id, config.sheets.catalog):
-                return SyncCatalogResult(
-                    success=False,
-                    synced_count=0,
-                    message=f"目録シート '{config.sheets.catalog}' が見つかりません。プロジェクト設定を確認してください。",
-                )
-
-            # Read from Google Sheets
+            # Fetch the hashes of the entries already in RAG (so unchanged rows
+            # are not re-embedded) while the sheet is being read
+            hashes_future = RAG_EXECUTOR.submit(self.rag.get_catalog_hashes, project)
+            
+            # Read from Google Sheets. Whether the catalog sheet exists is only
+            # checked when the read fails, saving a round trip on success.
             range_name = f"{config.sheets.catalog}!A:M"
-            result = self.sheets.read_range(
-                spreadsheet_id=config.spreadsheet_id,
-                range_name=range_name,
-            )
+            try:
+                result = self.sheets.read_range(
+                    spreadsheet_id=config.spreadsheet_id,
+                    range_name=range_name,
+                )
+            except Exception:
+                if not self.sheets.sheet_exists(config.spreadsheet_id, config.sheets.catalog):
+                    return SyncCatalogResult(
+                        success=False,
+                        synced_count=0,
+                        message=f"目録シート '{config.sheets.catalog}' が見つかりません。プロジェクト設定を確認してください。",
+                    )
+                raise
 
             rows = result.get("values", [])
 
@@ -210,53 +256,56 @@ class CatalogTools:
                 )
             
             # Skip header row if present
-            start_row = 0
-            if rows and rows[0] and rows[0][0] in ["ドキュメント名", "名前", "Name"]:
-                start_row = 1
+            start_row = 1 if rows[0] and rows[0][0] in _CATALOG_HEADER_NAMES else 0
             
-            # Clear existing catalog entries in RAG
-            deleted_count = self.rag.delete_catalog_entries_by_project(project)
-            logger.info(f"Deleted {deleted_count} existing catalog entries for project {project}")
+            existing_hashes = hashes_future.result()
             
-            # Add new entries
-            synced_count = 0
+            # Collect changed entries
+            sync_time = datetime.now().isoformat()
+            entries = {}
+            seen_ids = set()
             for row in rows[start_row:]:
                 if len(row) < 4:  # Minimum required columns
                     continue
                 
-                # Parse row
+                # Parse row (the Sheets API omits trailing empty cells, so pad it)
                 # Expected columns: ドキュメント名, 保存先, ID, 種別, プロジェクト, フェーズタスク, フィーチャー, 参照タイミング, 関連ドキュメント, キーワード, 更新日, 作成者, ステータス
-                name = row[0] if len(row) > 0 else ""
-                source = row[1] if len(row) > 1 else ""
-                doc_id = row[2] if len(row) > 2 else ""
-                doc_type = row[3] if len(row) > 3 else ""
-                # row[4] is project, skip as we're using the parameter
-                phase_task = row[5] if len(row) > 5 else ""
-                feature = row[6] if len(row) > 6 else ""
-                reference_timing = row[7] if len(row) > 7 else ""
-                related_docs = row[8] if len(row) > 8 else ""
-                keywords_str = row[9] if len(row) > 9 else ""
-                updated_at = row[10] if len(row) > 10 else ""
-                creator = row[11] if len(row) > 11 else ""
-                status = row[12] if len(row) > 12 else "active"
+                # The project column is skipped as we're using the parameter
+                (
+                    name, source, doc_id, doc_type, _, phase_task, feature,
+                    reference_timing, related_docs, keywords_str, updated_at, creator, status,
+                ) = (*row[:13], *_CATALOG_ROW_DEFAULTS[len(row):])
                 
                 if not name or not doc_id:
                     continue
                 
+                seen_ids.add(doc_id)
+                row_hash = hashlib.blake2b(
+                    "\x1f".join(str(cell) for cell in row[:13]).encode(),
+                    digest_size=16,
+                ).hexdigest()
+                if existing_hashes.get(doc_id) == row_hash:
+                    entries.pop(doc_id, None)
+                    continue
+                
                 # Parse keywords
                 keywords = [k.strip() for k in keywords_str.split(",") if k.strip()]
                 
                 # Parse related docs
                 related_doc_list = [d.strip() for d in related_docs.split(",") if d.strip()]
                 
-                # Add to RAG
-                self.rag.add_catalog_entry(
-                    doc_id=doc_id,
-                    name=name,
-                    doc_type=doc_type,
-                    project=project,
-                    phase_task=phase_task,
-                    metadata={
+                # Store updated_at as ISO 8601 so searches always parse it;
+                # other formats fall back to the sync time
+                parsed_updated_at = _parse_updated_at(updated_at) if updated_at else None
+                updated_at = parsed_updated_at.isoformat() if parsed_updated_at else sync_time
+                
+                entries[doc_id] = {
+                    "doc_id": doc_id,
+                    "name": name,
+                    "doc_type": doc_type,
+                    "project": project,
+                    "phase_task": phase_task,
+                    "metadata": {
                         "feature": feature,
                         "keywords": keywords,
                         "reference_timing": reference_timing,
@@ -265,15 +314,47 @@ class CatalogTools:
                         "updated_at": updated_at,
                         "creator": creator,
                         "status": status,
+                        "row_hash": row_hash,
                     },
-                )
-                
-                synced_count += 1
+                }
+            
+            # Upsert changed entries in batches
+            changed = list(entries.values())
+            failed_count = 0
+            warnings = []
+            for i in range(0, len(changed), SYNC_BATCH_SIZE):
+                batch = changed[i:i + SYNC_BATCH_SIZE]
+                upsert_result = self.rag.upsert_catalog_entries(batch)
+                if not upsert_result.success:
+                    failed_count += len(batch)
+                    logger.error(f"Failed to upsert catalog entries: {upsert_result.message}")
+            if failed_count:
+                warnings.append(f"{failed_count} 件の登録に失敗しました")
             
+            # Remove entries whose rows are gone from the sheet
+            removed_ids = [doc_id for doc_id in existing_hashes if doc_id not in seen_ids]
+            if removed_ids:
+                delete_result = self.rag.delete_catalog_entries(project, removed_ids)
+                if not delete_result.success:
+                    logger.error(f"Failed to delete catalog entries: {delete_result.message}")
+                    warnings.append(
+                        f"削除された {len(removed_ids)} 件のエントリを除去できませんでした: "
+                        f"{delete_result.message}"
+                    )
+            logger.info(
+                f"Catalog sync for project {project}: {len(changed)} changed, "
+                f"{len(removed_ids)} removed"
+            )
+            
+            synced_count = len(seen_ids) - failed_count
+            message = f"{synced_count} 件の目録エントリを同期しました。"
+            if warnings:
+                message += f" ({' / '.join(warnings)})"
+
             return SyncCatalogResult(
-                success=True,
+                success=not warnings,
                 synced_count=synced_count,
-                message=f"{synced_count} 件の目録エントリを同期しました。",
+                message=message,
             )
             
         except Exception as e:
@@ -1,14 +1,20 @@
 """Document operation tools for Spirrow-Prismind."""
 
 import logging
-from datetime import datetime
+import re
+import time
+from concurrent.futures import Future
+from datetime import date, datetime
 from typing import Optional
 
 from ..integrations import (
+    RAG_EXECUTOR,
     GoogleDocsClient,
     GoogleDriveClient,
     GoogleSheetsClient,
     RAGClient,
+    RAGDocument,
+    RAGOperationResult,
 )
 from ..models import (
     CatalogEntry,
@@ -26,10 +32,30 @@ from ..models import (
     UpdateDocumentResult,
 )
 from .global_document_types import GlobalDocumentTypeStorage
-from .project_tools import ProjectTools
+from .project_tools import LOOKUP_CACHE_TTL, ProjectTools
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of catalog entries kept by the doc_id lookup cache
+CATALOG_ENTRY_CACHE_SIZE = 1024
+
+# Markdown heading line (leading "#"s, optionally indented); group 1 is the title
+_HEADING_RE = re.compile(r"^[^\S\n]*#+(.*)$", re.MULTILINE)
+
+# Keyword candidate: a whitespace-delimited word of at least two characters
+_KEYWORD_RE = re.compile(r"\S{2,}")
+
+# First row number of an A1 range such as "'目録'!A42:M44"
+_RANGE_START_ROW_RE = re.compile(r"![A-Z]+(\d+)")
+
+# Valid document type ID: ASCII letters, digits and underscores
+_TYPE_ID_RE = re.compile(r"[A-Za-z0-9_]+")
+
+
+def _document_not_found(message: str) -> DocumentResult:
+    """Build the DocumentResult for a lookup that found nothing."""
+    return DocumentResult(found=False, message=message)
+
 
 class DocumentTools:
     """Tools for document operations."""
@@ -60,6 +86,29 @@ class DocumentTools:
         self.project_tools = project_tools
         self.user_name = user_name
 
+        # Merged document type lists: (user, project_id) -> (built_at, types,
+        # index by type_id and name). Registering, deleting or saving a type clears it.
+        self._document_types_cache: dict[
+            tuple[str, Optional[str]],
+            tuple[float, list[DocumentType], dict[str, DocumentType]],
+        ] = {}
+
+        # Catalog rows queued by create_document(batch=True), keyed by
+        # (spreadsheet_id, range), and the matching RAG catalog entries.
+        # flush_catalog() writes each group with one request.
+        self._pending_catalog_rows: dict[tuple[str, str], list[list[str]]] = {}
+        self._pending_rag_entries: list[dict] = []
+
+        # RAG catalog entries by doc_id: doc_id -> (fetched_at, entry). Only
+        # accessed from tasks on the single RAG worker (RAG_EXECUTOR), so it
+        # needs no lock; writes here pop their entry there as well.
+        self._catalog_entry_cache: dict[str, tuple[float, RAGDocument]] = {}
+
+        # Sheets catalog row numbers: (spreadsheet_id, sheet) -> {doc_id: row}.
+        # Rows can move (deletes, manual edits), so a hit is only a hint that
+        # is checked against the row's ID cell before use.
+        self._catalog_row_index: dict[tuple[str, str], dict[str, int]] = {}
+
     def get_document(
         self,
         query: Optional[str] = None,
@@ -68,6 +117,7 @@ class DocumentTools:
         phase_task: Optional[str] = None,
         project: Optional[str] = None,
         user: Optional[str] = None,
+        include_content: bool = True,
     ) -> DocumentResult:
         """Get a document by search or direct ID.
 
@@ -78,6 +128,8 @@ class DocumentTools:
             phase_task: Phase-task filter (e.g., "P4-T01")
             project: Project ID (uses current project if omitted)
             user: User ID
+            include_content: If False, return the catalog reference only and
+                skip reading the document body from Google Docs
 
         Returns:
             DocumentResult
@@ -86,16 +138,11 @@ class DocumentTools:
 
         # If doc_id is specified, get directly
         if doc_id:
-            return self._get_document_by_id(doc_id)
+            return self._get_document_by_id(doc_id, include_content=include_content)
 
         # Otherwise, search catalog
         if not query:
-            return DocumentResult(
-                found=False,
-                document=None,
-                candidates=[],
-                message="検索クエリまたはドキュメントIDを指定してください。",
-            )
+            return _document_not_found("検索クエリまたはドキュメントIDを指定してください。")
 
         # Determine project: explicit > current project
         project_id = project or self.project_tools.get_current_project_id(user)
@@ -110,17 +157,16 @@ class DocumentTools:
         )
         
         if not result.success or not result.documents:
-            return DocumentResult(
-                found=False,
-                document=None,
-                candidates=[],
-                message=f"'{query}' に一致するドキュメントが見つかりません。",
-            )
+            return _document_not_found(f"'{query}' に一致するドキュメントが見つかりません。")
         
-        # If single result, fetch it
+        # If single result, fetch it (its catalog entry is the search hit)
         if len(result.documents) == 1:
-            meta = result.documents[0].metadata
-            return self._get_document_by_id(meta.get("doc_id", ""))
+            entry = result.documents[0]
+            return self._get_document_by_id(
+                entry.metadata.get("doc_id", ""),
+                include_content=include_content,
+                catalog_entry=entry,
+            )
         
         # Multiple results - return candidates
         candidates = []
@@ -139,29 +185,58 @@ class DocumentTools:
             message=f"{len(candidates)} 件の候補が見つかりました。doc_id を指定して取得してください。",
         )
 
-    def _get_document_by_id(self, doc_id: str) -> DocumentResult:
+    def _get_document_by_id(
+        self,
+        doc_id: str,
+        include_content: bool = True,
+        catalog_entry: Optional[RAGDocument] = None,
+    ) -> DocumentResult:
         """Get a document by its Google Docs ID.
         
         Args:
             doc_id: Google Docs document ID
+            include_content: If False, build the result from the catalog entry
+                without reading Google Docs (falls back to Docs if uncataloged)
+            catalog_entry: Catalog entry already at hand (skips the RAG lookup)
             
         Returns:
             DocumentResult
         """
         try:
+            if catalog_entry is None and not include_content:
+                catalog_entry = RAG_EXECUTOR.submit(self._find_catalog_entry, doc_id).result()
+
+            if catalog_entry is not None and not include_content:
+                metadata = catalog_entry.metadata
+                document = Document(
+                    doc_id=doc_id,
+                    name=metadata.get("name", ""),
+                    doc_type=metadata.get("doc_type", ""),
+                    content="",
+                    source="Google Docs",
+                    metadata={
+                        "url": metadata.get("url", ""),
+                        "phase_task": metadata.get("phase_task", ""),
+                        "feature": metadata.get("feature", ""),
+                        "updated_at": metadata.get("updated_at", ""),
+                    },
+                )
+                return DocumentResult(found=True, document=document, message="")
+
+            # Get catalog entry from RAG for metadata while Docs is being read
+            catalog_future = None
+            if catalog_entry is None:
+                catalog_future = RAG_EXECUTOR.submit(self._find_catalog_entry, doc_id)
+            
             # Get from Google Docs
             doc_content = self.docs.get_document(doc_id)
-            
-            # Get catalog entry from RAG for metadata
-            catalog_result = self.rag.search_by_metadata(
-                where={"doc_id": {"$eq": doc_id}},
-                n_results=1,
-            )
+            if catalog_future is not None:
+                catalog_entry = catalog_future.result()
             
             metadata = {}
             doc_type = ""
-            if catalog_result.success and catalog_result.documents:
-                metadata = catalog_result.documents[0].metadata
+            if catalog_entry is not None:
+                metadata = catalog_entry.metadata
                 doc_type = metadata.get("doc_type", "")
             
             document = Document(
@@ -186,12 +261,7 @@ class DocumentTools:
             )
         except Exception as e:
             logger.error(f"Failed to get document '{doc_id}': {e}")
-            return DocumentResult(
-                found=False,
-                document=None,
-                candidates=[],
-                message=f"ドキュメントの取得に失敗しました: {e}",
-            )
+            return _document_not_found(f"ドキュメントの取得に失敗しました: {e}")
 
     def create_document(
         self,
@@ -205,6 +275,7 @@ class DocumentTools:
         related_docs: Optional[list[str]] = None,
         project: Optional[str] = None,
         user: Optional[str] = None,
+        batch: bool = False,
     ) -> CreateDocumentResult:
         """Create a new document and register in catalog.
 
@@ -219,6 +290,8 @@ class DocumentTools:
             related_docs: Related document IDs
             project: Project ID (uses current project if omitted)
             user: User ID
+            batch: If True, queue the Sheets catalog row and RAG entry until
+                flush_catalog() instead of writing them now
 
         Returns:
             CreateDocumentResult
@@ -264,6 +337,7 @@ class DocumentTools:
         try:
             # Step 2: Get folder ID from cached folder_ids (avoids name search)
             target_folder_id = doc_type_obj.get_folder_id(config.project_id)
+            save_type_future = None
 
             if not target_folder_id:
                 # Folder ID not cached - create/find folder and cache the ID
@@ -281,12 +355,12 @@ class DocumentTools:
                         if created:
                             logger.info(f"Created folder path '{folder_path}' in project folder")
 
-                        # Cache the folder ID for future use (auto-migration)
+                        # Cache the folder ID for future use (auto-migration).
+                        # Saving it touches no Google API, so it runs on the
+                        # RAG worker while the document is being created.
                         doc_type_obj.set_folder_id(config.project_id, target_folder_id)
-                        self._save_document_type(doc_type_obj)
-                        logger.info(
-                            f"Cached folder ID for doc_type '{doc_type_obj.type_id}' "
-                            f"in project '{config.project_id}'"
+                        save_type_future = RAG_EXECUTOR.submit(
+                            self._save_document_type, doc_type_obj
                         )
                 else:
                     # No folder path - use project root
@@ -300,35 +374,48 @@ class DocumentTools:
             doc_id = file_info.file_id
             doc_url = file_info.web_view_link or f"https://docs.google.com/document/d/{doc_id}/edit"
 
-            # Step 4: Add content using Docs API
-            if content:
-                # Add heading first
-                heading_text = name + "\n"
-                self.docs.insert_text(doc_id, heading_text, index=1)
-                # Apply heading style
-                self.docs.service.documents().batchUpdate(
-                    documentId=doc_id,
-                    body={"requests": [{
-                        "updateParagraphStyle": {
-                            "range": {"startIndex": 1, "endIndex": 1 + len(heading_text)},
-                            "paragraphStyle": {"namedStyleType": "HEADING_1"},
-                            "fields": "namedStyleType",
-                        }
-                    }]},
-                ).execute()
-                # Add content after heading
-                self.docs.insert_text(doc_id, content, index=1 + len(heading_text))
-
-            # Step 5: Auto-generate keywords if not provided
+            # Step 4: Auto-generate keywords if not provided
             if keywords is None:
                 keywords = self._generate_keywords(name, content, feature)
 
-            # Step 6: Register in catalog (Sheets)
+            # Step 5: Add heading and content using Docs API (one request).
+            # Blank content leaves the new document empty, with no Docs request.
+            if content and not content.isspace():
+                self.docs.insert_heading_and_text(doc_id, name, content)
+
+            # Step 6: Register in RAG cache once the document is written, so a
+            # failed create leaves no searchable entry. It runs while the Sheets
+            # request below is in flight.
+            rag_entry = {
+                "doc_id": doc_id,
+                "name": name,
+                "doc_type": doc_type_obj.name,
+                "project": config.project_id,
+                "phase_task": phase_task,
+                "metadata": {
+                    "feature": feature or "",
+                    "keywords": keywords,
+                    "reference_timing": reference_timing or "",
+                    "related_docs": related_docs or [],
+                    "source": "Google Docs",
+                    "url": doc_url,
+                },
+            }
+            rag_future = None
+            if batch:
+                self._pending_rag_entries.append(rag_entry)
+            else:
+                rag_future = RAG_EXECUTOR.submit(self.rag.add_catalog_entry, **rag_entry)
+
+            # Step 7: Register in catalog (Sheets)
             catalog_registered = False
             catalog_warning = ""
             try:
-                # Check if catalog sheet exists
-                if not self.sheets.sheet_exists(config.spreadsheet_id, config.sheets.catalog):
+                # Check if catalog sheet exists (already known when rows for it are queued)
+                queued = batch and (
+                    config.spreadsheet_id, f"{config.sheets.catalog}!A:M"
+                ) in self._pending_catalog_rows
+                if not queued and not self.sheets.sheet_exists(config.spreadsheet_id, config.sheets.catalog):
                     catalog_warning = f"目録シート '{config.sheets.catalog}' が見つかりません。RAGのみに登録しました。"
                     logger.warning(catalog_warning)
                 else:
@@ -341,28 +428,19 @@ class DocumentTools:
                         feature=feature,
                         keywords=keywords,
                         reference_timing=reference_timing,
+                        batch=batch,
                     )
                     catalog_registered = True
             except Exception as e:
                 logger.error(f"Failed to register in Sheets catalog: {e}")
                 catalog_warning = f"目録シートへの登録に失敗しました: {e}"
 
-            # Step 7: Register in RAG cache
-            self.rag.add_catalog_entry(
-                doc_id=doc_id,
-                name=name,
-                doc_type=doc_type_obj.name,
-                project=config.project_id,
-                phase_task=phase_task,
-                metadata={
-                    "feature": feature or "",
-                    "keywords": keywords,
-                    "reference_timing": reference_timing or "",
-                    "related_docs": related_docs or [],
-                    "source": "Google Docs",
-                    "url": doc_url,
-                },
-            )
+            # Wait for the RAG registration started in Step 6
+            if rag_future is not None:
+                rag_future.result()
+
+            if save_type_future is not None:
+                self._wait_for_type_save(save_type_future, doc_type_obj, config.project_id)
 
             message = f"ドキュメント '{name}' を作成しました。"
             if catalog_warning:
@@ -418,8 +496,25 @@ class DocumentTools:
         """
         user = user or self.user_name
         updated_fields = []
+        now = datetime.now()
 
         try:
+            # Project config is only needed for metadata changes (folder move,
+            # Sheets catalog row). Explicit project > current project
+            config = None
+            if metadata:
+                if project:
+                    config = self.project_tools.get_project_config(project=project, user=user)
+                else:
+                    config = self.project_tools.get_project_config(user=user)
+
+            # Look up the catalog entry in RAG while Docs/Drive are being updated
+            catalog_future = None
+            if metadata or content is not None:
+                catalog_future = RAG_EXECUTOR.submit(
+                    self._find_catalog_entry, doc_id, take=True
+                )
+
             # Update content if provided
             if content is not None:
                 if append:
@@ -429,6 +524,7 @@ class DocumentTools:
                 updated_fields.append("content")
 
             # Handle doc_type change - move file to new folder
+            save_type_future = None
             if metadata and "doc_type" in metadata:
                 new_doc_type = metadata["doc_type"]
                 doc_type_obj = self.get_document_type(new_doc_type, user=user)
@@ -441,11 +537,6 @@ class DocumentTools:
                         message=f"ドキュメントタイプ '{new_doc_type}' は登録されていません。",
                     )
 
-                # Determine project config: explicit project > current project
-                if project:
-                    config = self.project_tools.get_project_config(project=project, user=user)
-                else:
-                    config = self.project_tools.get_project_config(user=user)
                 if config and config.root_folder_id and doc_type_obj.folder_name:
                     try:
                         # Try to get cached folder ID first
@@ -459,9 +550,11 @@ class DocumentTools:
                             )
                             if folder_info:
                                 target_folder_id = folder_info.file_id
-                                # Cache the folder ID
+                                # Cache the folder ID while the file is moved
                                 doc_type_obj.set_folder_id(config.project_id, target_folder_id)
-                                self._save_document_type(doc_type_obj)
+                                save_type_future = RAG_EXECUTOR.submit(
+                                    self._save_document_type, doc_type_obj
+                                )
 
                         if target_folder_id:
                             # Move the document to the target folder
@@ -476,54 +569,43 @@ class DocumentTools:
                 # Update doc_type in metadata (will be stored in the display name)
                 metadata["doc_type"] = doc_type_obj.name
 
-            # Update catalog metadata in RAG
-            if metadata:
+            # Update catalog metadata in RAG. Metadata changes and the
+            # updated_at bump for content changes share one fetch and one write.
+            if catalog_future is not None:
                 # Get existing catalog entry
-                catalog_result = self.rag.search_by_metadata(
-                    where={"doc_id": {"$eq": doc_id}},
-                    n_results=1,
-                )
-
-                if catalog_result.success and catalog_result.documents:
-                    existing = catalog_result.documents[0]
-                    updated_meta = {**existing.metadata, **metadata}
-                    updated_meta["updated_at"] = datetime.now().isoformat()
-
-                    # Re-add (update) the catalog entry
-                    self.rag.update_document(
+                existing = catalog_future.result()
+
+                if existing is not None:
+                    # The entry was fetched for this update and is not cached,
+                    # so it is ours to modify; merge into it in place
+                    updated_meta = existing.metadata
+                    if metadata:
+                        updated_meta.update(metadata)
+                    updated_meta["updated_at"] = now.isoformat()
+
+                    # Re-add (update) the catalog entry, alongside the Sheets update
+                    rag_future = RAG_EXECUTOR.submit(
+                        self.rag.update_document,
                         doc_id=existing.doc_id,
                         metadata=updated_meta,
                     )
 
-                    updated_fields.extend(metadata.keys())
-
-                    # Update Sheets catalog if doc_type, phase_task, or feature changed
-                    # Determine project config: explicit project > current project
-                    if project:
-                        config = self.project_tools.get_project_config(project=project, user=user)
-                    else:
-                        config = self.project_tools.get_project_config(user=user)
-                    if config and config.spreadsheet_id:
-                        self._update_sheets_catalog_row(
-                            config=config,
-                            doc_id=doc_id,
-                            updates=metadata,
-                        )
+                    if metadata:
+                        updated_fields.extend(metadata.keys())
 
-            # Always update the updated_at timestamp
-            if content is not None:
-                catalog_result = self.rag.search_by_metadata(
-                    where={"doc_id": {"$eq": doc_id}},
-                    n_results=1,
-                )
+                        # Update Sheets catalog if doc_type, phase_task, or feature changed
+                        if config and config.spreadsheet_id:
+                            self._update_sheets_catalog_row(
+                                config=config,
+                                doc_id=doc_id,
+                                updates=metadata,
+                                updated_at=now,
+                            )
 
-                if catalog_result.success and catalog_result.documents:
-                    existing = catalog_result.documents[0]
-                    existing.metadata["updated_at"] = datetime.now().isoformat()
-                    self.rag.update_document(
-                        doc_id=existing.doc_id,
-                        metadata=existing.metadata,
-                    )
+                    rag_future.result()
+
+            if save_type_future is not None:
+                self._wait_for_type_save(save_type_future, doc_type_obj, config.project_id)
 
             return UpdateDocumentResult(
                 success=True,
@@ -541,11 +623,101 @@ class DocumentTools:
                 message=f"ドキュメントの更新に失敗しました: {e}",
             )
 
+    def _find_catalog_entry(self, doc_id: str, take: bool = False) -> Optional[RAGDocument]:
+        """Get a document's RAG catalog entry, reusing a recent lookup.
+
+        Args:
+            doc_id: Document ID
+            take: If True, drop any cached entry and fetch a fresh one the
+                caller may modify (for read-modify-write updates)
+
+        Returns:
+            Catalog entry if found, None otherwise
+        """
+        if take:
+            self._catalog_entry_cache.pop(doc_id, None)
+        else:
+            cached = self._catalog_entry_cache.get(doc_id)
+            if cached is not None and time.monotonic() - cached[0] < LOOKUP_CACHE_TTL:
+                return cached[1]
+
+        result = self.rag.search_by_metadata(
+            where={"doc_id": {"$eq": doc_id}},
+            n_results=1,
+        )
+        if not (result.success and result.documents):
+            return None
+
+        entry = result.documents[0]
+        if not take:
+            cache = self._catalog_entry_cache
+            cache.pop(doc_id, None)
+            if len(cache) >= CATALOG_ENTRY_CACHE_SIZE:
+                # Evict the oldest lookup
+                cache.pop(next(iter(cache)), None)
+            cache[doc_id] = (time.monotonic(), entry)
+        return entry
+
+    def _delete_catalog_entry(self, doc_id: str, project: str) -> RAGOperationResult:
+        """Delete a document's RAG catalog entry and forget its cached lookup.
+
+        Runs on the RAG worker, which owns the catalog entry cache.
+
+        Args:
+            doc_id: Document ID
+            project: Project ID
+
+        Returns:
+            RAGOperationResult
+        """
+        self._catalog_entry_cache.pop(doc_id, None)
+        return self.rag.delete_catalog_entry(doc_id, project)
+
+    def _locate_catalog_row(self, config, doc_id: str) -> Optional[tuple[int, list]]:
+        """Find a document's row in the Sheets catalog.
+
+        A row number remembered from an earlier read is tried first by reading
+        just that row. If it no longer holds the document, the whole catalog
+        is read once and the row index rebuilt from it.
+
+        Args:
+            config: Project config
+            doc_id: Document ID
+
+        Returns:
+            Tuple of (1-based row number, row values) if found, None otherwise
+        """
+        sheet = config.sheets.catalog
+        key = (config.spreadsheet_id, sheet)
+
+        row_number = self._catalog_row_index.get(key, {}).get(doc_id)
+        if row_number:
+            values = self.sheets.get_sheet_values(
+                config.spreadsheet_id, f"{sheet}!A{row_number}:M{row_number}"
+            )
+            # Column C (index 2) holds the doc_id
+            if values and len(values[0]) > 2 and values[0][2] == doc_id:
+                return row_number, values[0]
+
+        values = self.sheets.get_sheet_values(config.spreadsheet_id, f"{sheet}!A:M")
+        index: dict[str, int] = {}
+        for number, row in enumerate(values, start=1):
+            if len(row) > 2 and row[2]:
+                # The first row wins if a document is listed twice
+                index.setdefault(row[2], number)
+        self._catalog_row_index[key] = index
+
+        row_number = index.get(doc_id)
+        if row_number is None:
+            return None
+        return row_number, values[row_number - 1]
+
     def _update_sheets_catalog_row(
         self,
         config,
         doc_id: str,
         updates: dict,
+        updated_at: Optional[datetime] = None,
     ):
         """Update specific fields in the Sheets catalog row.
 
@@ -553,30 +725,16 @@ class DocumentTools:
             config: Project config
             doc_id: Document ID
             updates: Fields to update (doc_type, phase_task, feature)
+            updated_at: Update time to record (defaults to now)
         """
         try:
-            # Find the row by doc_id (column C, index 2)
-            row_number = self.sheets.find_row_by_value(
-                spreadsheet_id=config.spreadsheet_id,
-                sheet_name=config.sheets.catalog,
-                column_index=2,  # ID column
-                value=doc_id,
-            )
-
-            if not row_number:
+            found = self._locate_catalog_row(config, doc_id)
+            if found is None:
                 logger.warning(f"Document '{doc_id}' not found in Sheets catalog")
                 return
+            row_number, current = found
 
-            # Get current row data
-            range_name = f"{config.sheets.catalog}!A{row_number}:M{row_number}"
-            current_values = self.sheets.get_sheet_values(
-                config.spreadsheet_id, range_name
-            )
-
-            if not current_values or not current_values[0]:
-                return
-
-            row = list(current_values[0])
+            row = list(current)
             # Extend row if needed
             while len(row) < 13:
                 row.append("")
@@ -594,7 +752,7 @@ class DocumentTools:
                 row[6] = updates["feature"]
 
             # Update the updated_at field
-            row[10] = datetime.now().strftime("%Y-%m-%d")
+            row[10] = (updated_at.date() if updated_at else date.today()).isoformat()
 
             # Write back
             self.sheets.update_row(
@@ -623,12 +781,8 @@ class DocumentTools:
         Returns:
             List of keywords
         """
-        keywords = []
-        
         # Add words from name
-        for word in name.split():
-            if len(word) >= 2:
-                keywords.append(word)
+        keywords = _KEYWORD_RE.findall(name)
         
         # Add feature
         if feature:
@@ -637,24 +791,20 @@ class DocumentTools:
         # Simple keyword extraction from content
         # In production, this could use more sophisticated NLP
         important_words = []
-        for line in content.split("\n"):
-            line = line.strip()
-            if line.startswith("#") or line.startswith("##"):
-                # Headings are likely important
-                words = line.lstrip("#").strip().split()
-                important_words.extend(w for w in words if len(w) >= 2)
+        for match in _HEADING_RE.finditer(content):
+            # Headings are likely important
+            important_words.extend(_KEYWORD_RE.findall(match.group(1)))
+            if len(important_words) >= 10:
+                break
         
         keywords.extend(important_words[:10])  # Limit
         
-        # Deduplicate
-        seen = set()
-        unique_keywords = []
+        # Deduplicate case-insensitively, keeping the first spelling
+        unique_keywords: dict[str, str] = {}
         for kw in keywords:
-            if kw.lower() not in seen:
-                seen.add(kw.lower())
-                unique_keywords.append(kw)
+            unique_keywords.setdefault(kw.lower(), kw)
         
-        return unique_keywords[:20]  # Limit total
+        return list(unique_keywords.values())[:20]  # Limit total
 
     def _register_in_sheets_catalog(
         self,
@@ -666,6 +816,7 @@ class DocumentTools:
         feature: Optional[str],
         keywords: list[str],
         reference_timing: Optional[str],
+        batch: bool = False,
     ):
         """Register document in Google Sheets catalog.
         
@@ -678,6 +829,7 @@ class DocumentTools:
             feature: Feature name
             keywords: Keywords
             reference_timing: Reference timing
+            batch: If True, queue the row for flush_catalog()
         """
         # Prepare row data
         row = [
@@ -691,17 +843,136 @@ class DocumentTools:
             reference_timing or "",         # 参照タイミング
             "",                             # 関連ドキュメント
             ", ".join(keywords),            # キーワード
-            datetime.now().strftime("%Y-%m-%d"),  # 更新日
+            date.today().isoformat(),       # 更新日
             "",                             # 作成者
             "active",                       # ステータス
         ]
         
+        range_name = f"{config.sheets.catalog}!A:M"
+        if batch:
+            self._pending_catalog_rows.setdefault(
+                (config.spreadsheet_id, range_name), []
+            ).append(row)
+            return
+
         # Append to catalog sheet
-        self.sheets.append_rows(
+        response = self.sheets.append_rows(
             spreadsheet_id=config.spreadsheet_id,
-            range_name=f"{config.sheets.catalog}!A:M",
+            range_name=range_name,
             values=[row],
         )
+        self._remember_catalog_rows(config.spreadsheet_id, [row], response)
+
+    def _remember_catalog_rows(
+        self,
+        spreadsheet_id: str,
+        rows: list[list],
+        response: dict,
+    ) -> None:
+        """Record the row numbers of appended catalog rows in the row index.
+
+        The append response names the range that was written, so a later
+        update of these documents can read their row directly instead of
+        scanning the catalog.
+
+        Args:
+            spreadsheet_id: Spreadsheet ID
+            rows: Rows that were appended, in order
+            response: Sheets API append response
+        """
+        updated_range = response.get("updates", {}).get("updatedRange", "")
+        match = _RANGE_START_ROW_RE.search(updated_range)
+        if not match:
+            return
+        sheet = updated_range[:match.start()].strip("'")
+        index = self._catalog_row_index.setdefault((spreadsheet_id, sheet), {})
+        for number, row in enumerate(rows, start=int(match.group(1))):
+            # An earlier row listing the same document keeps precedence
+            index.setdefault(row[2], number)
+
+    def flush_catalog(self) -> dict[str, str]:
+        """Write catalog rows and RAG entries queued by create_document(batch=True).
+
+        Rows for the same catalog sheet are written with a single append, and
+        all RAG entries with a single upsert running alongside the appends.
+        The queues are emptied even if a write fails; nothing is retried, so
+        the caller decides what to do about the reported failures.
+
+        Returns:
+            Failure message by doc_id for each document whose Sheets row or
+            RAG entry could not be written (empty if everything was written)
+        """
+        rag_entries, self._pending_rag_entries = self._pending_rag_entries, []
+        pending_rows, self._pending_catalog_rows = self._pending_catalog_rows, {}
+
+        rag_future = None
+        if rag_entries:
+            rag_future = RAG_EXECUTOR.submit(self.rag.upsert_catalog_entries, rag_entries)
+
+        failures: dict[str, list[str]] = {}
+        for (spreadsheet_id, range_name), rows in pending_rows.items():
+            try:
+                response = self.sheets.append_rows(
+                    spreadsheet_id=spreadsheet_id,
+                    range_name=range_name,
+                    values=rows,
+                )
+            except Exception as e:
+                logger.error(f"Failed to flush {len(rows)} catalog rows to '{range_name}': {e}")
+                for row in rows:
+                    # Column C (index 2) holds the doc_id
+                    failures.setdefault(row[2], []).append(f"目録シートへの登録に失敗しました: {e}")
+                continue
+            self._remember_catalog_rows(spreadsheet_id, rows, response)
+
+        if rag_future is not None:
+            try:
+                result = rag_future.result()
+                error = None if result.success else result.message
+            except Exception as e:
+                error = str(e)
+            if error:
+                logger.error(f"Failed to flush {len(rag_entries)} RAG catalog entries: {error}")
+                for entry in rag_entries:
+                    failures.setdefault(entry["doc_id"], []).append(
+                        f"RAGへの登録に失敗しました: {error}"
+                    )
+
+        return {doc_id: " / ".join(messages) for doc_id, messages in failures.items()}
+
+    def bulk_create_documents(
+        self,
+        documents: list[dict],
+        project: Optional[str] = None,
+        user: Optional[str] = None,
+    ) -> list[CreateDocumentResult]:
+        """Create several documents and register them in the catalog together.
+
+        Each document is created as in create_document, but the Sheets catalog
+        rows and RAG entries are written by one flush at the end. Documents
+        whose catalog writes fail in that flush report catalog_registered=False
+        with the reason in their message.
+
+        Args:
+            documents: Keyword arguments of create_document for each document
+                (name, doc_type, content, phase_task, ...; not project or user)
+            project: Project ID (uses current project if omitted)
+            user: User ID
+
+        Returns:
+            CreateDocumentResult for each document, in order
+        """
+        results = [
+            self.create_document(**document, project=project, user=user, batch=True)
+            for document in documents
+        ]
+        failures = self.flush_catalog()
+        for result in results:
+            catalog_warning = failures.get(result.doc_id) if result.success else None
+            if catalog_warning:
+                result.catalog_registered = False
+                result.message += f" ({catalog_warning})"
+        return results
 
     def list_document_types(
         self,
@@ -718,7 +989,32 @@ class DocumentTools:
         Returns:
             ListDocumentTypesResult
         """
-        user = user or self.user_name
+        all_types, _ = self._get_document_types(user or self.user_name)
+
+        return ListDocumentTypesResult(
+            success=True,
+            document_types=all_types,
+            message=f"{len(all_types)} 件のドキュメントタイプが利用可能です。",
+        )
+
+    def _get_document_types(
+        self,
+        user: str,
+    ) -> tuple[list[DocumentType], dict[str, DocumentType]]:
+        """Get the merged document types and their lookup index (cached).
+
+        Args:
+            user: User ID
+
+        Returns:
+            Tuple of (merged types, index by type_id and name)
+        """
+        config = self.project_tools.get_project_config(user=user)
+
+        cache_key = (user, config.project_id if config else None)
+        cached = self._document_types_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < LOOKUP_CACHE_TTL:
+            return cached[1], cached[2]
 
         # Step 1: Get global types (with RAG client for semantic search)
         global_storage = GlobalDocumentTypeStorage(rag_client=self.rag)
@@ -730,7 +1026,6 @@ class DocumentTools:
             all_types_dict[doc_type.type_id] = doc_type
 
         # Step 2: Get project-specific types (these can override global)
-        config = self.project_tools.get_project_config(user=user)
         if config and config.document_types:
             for type_data in config.document_types:
                 doc_type = DocumentType.from_dict(type_data)
@@ -738,11 +1033,14 @@ class DocumentTools:
 
         all_types = list(all_types_dict.values())
 
-        return ListDocumentTypesResult(
-            success=True,
-            document_types=all_types,
-            message=f"{len(all_types)} 件のドキュメントタイプが利用可能です。",
-        )
+        # Index by type_id and name; the first type in list order wins a key
+        index: dict[str, DocumentType] = {}
+        for doc_type in all_types:
+            index.setdefault(doc_type.type_id, doc_type)
+            index.setdefault(doc_type.name, doc_type)
+
+        self._document_types_cache[cache_key] = (time.monotonic(), all_types, index)
+        return all_types, index
 
     def register_document_type(
         self,
@@ -775,7 +1073,7 @@ class DocumentTools:
         user = user or self.user_name
 
         # Validate type_id (ASCII alphanumeric and underscore only)
-        if not type_id or not all(c.isascii() and (c.isalnum() or c == "_") for c in type_id):
+        if not _TYPE_ID_RE.fullmatch(type_id or ""):
             return RegisterDocumentTypeResult(
                 success=False,
                 type_id=type_id,
@@ -822,6 +1120,7 @@ class DocumentTools:
                 )
 
             logger.info(f"Registered global document type '{type_id}' ({name})")
+            self._document_types_cache.clear()
 
             # Note: Global types don't create folders (no project context)
             # Folders are created on-demand when creating documents
@@ -877,23 +1176,13 @@ class DocumentTools:
 
             # Save updated config
             try:
-                config_data = {
-                    "spreadsheet_id": config.spreadsheet_id,
-                    "root_folder_id": config.root_folder_id,
-                    "sheets": config.sheets.to_dict() if config.sheets else {},
-                    "drive": config.drive.to_dict() if config.drive else {},
-                    "docs": config.docs.to_dict() if config.docs else {},
-                    "options": config.options.to_dict() if config.options else {},
-                    "document_types": config.document_types,
-                    "created_at": config.created_at.isoformat() if config.created_at else "",
-                }
-                self.project_tools._save_project_config_with_fallback(
-                    project_id=config.project_id,
-                    name=config.name,
-                    description=config.description,
-                    config_data=config_data,
+                success, warning = self.project_tools.update_project_config_field(
+                    config.project_id, "document_types", config.document_types
                 )
+                if not success:
+                    raise RuntimeError(warning)
                 logger.info(f"Registered project document type '{type_id}' ({name})")
+                self._document_types_cache.clear()
 
                 return RegisterDocumentTypeResult(
                     success=True,
@@ -956,6 +1245,7 @@ class DocumentTools:
                 )
 
             logger.info(f"Deleted global document type '{type_id}'")
+            self._document_types_cache.clear()
 
             return DeleteDocumentTypeResult(
                 success=True,
@@ -989,23 +1279,13 @@ class DocumentTools:
 
             # Save updated config
             try:
-                config_data = {
-                    "spreadsheet_id": config.spreadsheet_id,
-                    "root_folder_id": config.root_folder_id,
-                    "sheets": config.sheets.to_dict() if config.sheets else {},
-                    "drive": config.drive.to_dict() if config.drive else {},
-                    "docs": config.docs.to_dict() if config.docs else {},
-                    "options": config.options.to_dict() if config.options else {},
-                    "document_types": config.document_types,
-                    "created_at": config.created_at.isoformat() if config.created_at else "",
-                }
-                self.project_tools._save_project_config_with_fallback(
-                    project_id=config.project_id,
-                    name=config.name,
-                    description=config.description,
-                    config_data=config_data,
+                success, warning = self.project_tools.update_project_config_field(
+                    config.project_id, "document_types", config.document_types
                 )
+                if not success:
+                    raise RuntimeError(warning)
                 logger.info(f"Deleted project document type '{type_id}'")
+                self._document_types_cache.clear()
 
                 return DeleteDocumentTypeResult(
                     success=True,
@@ -1034,15 +1314,34 @@ class DocumentTools:
         Returns:
             DocumentType if found, None otherwise
         """
-        result = self.list_document_types(user=user)
-        if not result.success:
-            return None
+        _, index = self._get_document_types(user or self.user_name)
+        return index.get(type_id_or_name)
 
-        for doc_type in result.document_types:
-            if doc_type.type_id == type_id_or_name or doc_type.name == type_id_or_name:
-                return doc_type
+    def _wait_for_type_save(
+        self,
+        future: Future,
+        doc_type: DocumentType,
+        project_id: str,
+    ) -> None:
+        """Wait for a background _save_document_type of a cached folder ID.
 
-        return None
+        The folder ID cache is an optimization, so a failed save is only logged.
+
+        Args:
+            future: Future of the _save_document_type call
+            doc_type: Document type whose folder ID was cached
+            project_id: Project the folder ID belongs to
+        """
+        try:
+            saved = future.result()
+        except Exception as e:
+            logger.warning(f"Failed to cache folder ID for '{doc_type.type_id}': {e}")
+        else:
+            if saved:
+                logger.info(
+                    f"Cached folder ID for doc_type '{doc_type.type_id}' "
+                    f"in project '{project_id}'"
+                )
 
     def _save_document_type(self, doc_type: DocumentType) -> bool:
         """Save a document type (update folder_ids, etc.).
@@ -1055,6 +1354,8 @@ class DocumentTools:
         Returns:
             True if saved successfully, False otherwise
         """
+        self._document_types_cache.clear()
+
         if doc_type.is_global:
             # Update global storage
             global_storage = GlobalDocumentTypeStorage(rag_client=self.rag)
@@ -1076,22 +1377,11 @@ class DocumentTools:
 
             # Save updated config
             try:
-                config_data = {
-                    "spreadsheet_id": config.spreadsheet_id,
-                    "root_folder_id": config.root_folder_id,
-                    "sheets": config.sheets.to_dict() if config.sheets else {},
-                    "drive": config.drive.to_dict() if config.drive else {},
-                    "docs": config.docs.to_dict() if config.docs else {},
-                    "options": config.options.to_dict() if config.options else {},
-                    "document_types": config.document_types,
-                    "created_at": config.created_at.isoformat() if config.created_at else "",
-                }
-                self.project_tools._save_project_config_with_fallback(
-                    project_id=config.project_id,
-                    name=config.name,
-                    description=config.description,
-                    config_data=config_data,
+                success, warning = self.project_tools.update_project_config_field(
+                    config.project_id, "document_types", config.document_types
                 )
+                if not success:
+                    raise RuntimeError(warning)
                 return True
             except Exception as e:
                 logger.error(f"Failed to save document type to project config: {e}")
@@ -1228,7 +1518,9 @@ class DocumentTools:
 
         try:
             # Step 2: Delete RAG catalog entry
-            rag_result = self.rag.delete_catalog_entry(doc_id, project)
+            rag_result = RAG_EXECUTOR.submit(
+                self._delete_catalog_entry, doc_id, project
+            ).result()
             catalog_deleted = rag_result.success
 
             # Step 3: Delete from Google Sheets catalog
@@ -1249,6 +1541,10 @@ class DocumentTools:
                             row_number=row_number,
                         )
                         sheet_row_deleted = True
+                        # Rows below have moved up
+                        self._catalog_row_index.pop(
+                            (config.spreadsheet_id, config.sheets.catalog), None
+                        )
                 except Exception as e:
                     logger.warning(f"Failed to delete Sheets row for '{doc_id}': {e}")
 
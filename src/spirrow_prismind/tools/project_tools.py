@@ -3,10 +3,11 @@
 import json
 import logging
 import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from ..integrations import (
     GoogleDriveClient,
@@ -32,6 +33,10 @@ from ..models import (
 
 logger = logging.getLogger(__name__)
 
+# How long current-project and project-config lookups from the Memory/RAG
+# servers are reused before asking the server again (seconds)
+LOOKUP_CACHE_TTL = 30.0
+
 
 class ProjectTools:
     """Tools for managing projects."""
@@ -67,6 +72,11 @@ class ProjectTools:
         self.user_name = user_name
         self.projects_folder_id = projects_folder_id
 
+        # Short-lived caches of server lookups: key -> (fetched_at, value).
+        # Writes made through this class invalidate them.
+        self._current_project_cache: dict[str, tuple[float, Optional[str]]] = {}
+        self._project_config_cache: dict[str, tuple[float, RAGDocument]] = {}
+
         # Initialize fallback storage file path
         self._init_fallback_storage()
 
@@ -134,9 +144,13 @@ class ProjectTools:
 
         # Try RAG if not found in fallback
         if self.rag.is_available:
+            cached = self._project_config_cache.get(project)
+            if cached is not None and time.monotonic() - cached[0] < LOOKUP_CACHE_TTL:
+                return cached[1]
             try:
                 result = self.rag.get_project_config(project)
                 if result:
+                    self._project_config_cache[project] = (time.monotonic(), result)
                     return result
             except Exception as e:
                 logger.warning(f"RAG get failed for project '{project}': {e}")
@@ -159,6 +173,7 @@ class ProjectTools:
             info about fallback usage even on success.
         """
         rag_error: Optional[str] = None
+        self._project_config_cache.pop(project_id, None)
 
         # Try RAG first if available
         if self.rag.is_available:
@@ -202,6 +217,72 @@ class ProjectTools:
             return True, "RAGサーバーが利用できないため、ローカルストレージに保存しました"
         return True, ""
 
+    def update_project_config_field(
+        self,
+        project_id: str,
+        field_name: str,
+        value: Any,
+    ) -> tuple[bool, str]:
+        """Update a single field of a saved project config.
+
+        Unlike _save_project_config_with_fallback, the RAG entry is updated
+        with a metadata-only request, so the project text is not re-embedded.
+        The fallback entry, when present, is patched in place.
+
+        Args:
+            project_id: Project identifier
+            field_name: Config field to update (e.g. "document_types")
+            value: New value of the field
+
+        Returns:
+            Tuple of (success, warning_message)
+        """
+        cached = self._project_config_cache.pop(project_id, None)
+        updated_at = datetime.now().isoformat()
+        fallback = ProjectTools._fallback_projects.get(project_id)
+        rag_error: Optional[str] = None
+        rag_doc: Optional[RAGDocument] = None
+
+        if self.rag.is_available:
+            try:
+                if cached is not None and time.monotonic() - cached[0] < LOOKUP_CACHE_TTL:
+                    rag_doc = cached[1]
+                else:
+                    rag_doc = self.rag.get_project_config(project_id)
+                if rag_doc is not None:
+                    result = self.rag.update_document(
+                        doc_id=rag_doc.doc_id,
+                        metadata={**rag_doc.metadata, field_name: value, "updated_at": updated_at},
+                    )
+                    if result.success:
+                        if fallback is None:
+                            return True, ""
+                    else:
+                        rag_error = result.message
+            except Exception as e:
+                rag_error = str(e)
+
+            if rag_error:
+                logger.warning(
+                    f"RAG update failed for project '{project_id}': {rag_error}. "
+                    "Falling back to file storage."
+                )
+
+        if fallback is None:
+            if rag_doc is None:
+                return False, f"プロジェクト '{project_id}' の設定が見つかりません。"
+            fallback = {k: v for k, v in rag_doc.metadata.items() if k != "type"}
+            ProjectTools._fallback_projects[project_id] = fallback
+
+        # Fallback storage is preferred on reads, so keep it current
+        fallback[field_name] = value
+        fallback["updated_at"] = updated_at
+        self._save_fallback_data()
+
+        if rag_error:
+            return True, f"RAGサーバーへの保存に失敗しましたが、ローカルストレージに保存しました（RAGエラー: {rag_error}）"
+        return True, ""
+
     def _list_projects_with_fallback(self) -> list[RAGDocument]:
         """List projects from RAG and fallback storage.
 
@@ -248,6 +329,7 @@ class ProjectTools:
         fallback deletion.
         """
         deleted = False
+        self._project_config_cache.pop(project, None)
 
         # Try RAG if available
         if self.rag.is_available:
@@ -273,9 +355,13 @@ class ProjectTools:
         """
         # Try Memory server first if available
         if self.memory.is_available:
+            cached = self._current_project_cache.get(user)
+            if cached is not None and time.monotonic() - cached[0] < LOOKUP_CACHE_TTL:
+                return cached[1]
             try:
                 current = self.memory.get_current_project(user)
                 if current and current.project_id:
+                    self._current_project_cache[user] = (time.monotonic(), current.project_id)
                     return current.project_id
             except Exception as e:
                 logger.warning(f"Memory get_current_project failed: {e}. Trying fallback storage.")
@@ -289,6 +375,7 @@ class ProjectTools:
         Memory server is optional - always saves to fallback as backup.
         """
         success = True
+        self.invalidate_current_project(user)
 
         # Try Memory server if available
         if self.memory.is_available:
@@ -305,6 +392,17 @@ class ProjectTools:
 
         return success
 
+    def invalidate_current_project(self, user: str):
+        """Forget the cached current project of a user.
+
+        Call this after changing the current project without going through
+        this class.
+
+        Args:
+            user: User ID
+        """
+        self._current_project_cache.pop(user, None)
+
     # ===== Main Methods =====
 
     def setup_project(
@@ -511,45 +609,27 @@ class ProjectTools:
                 logger.error(f"Failed to initialize sheets: {e}")
                 # Continue anyway - sheets might already exist
 
-            # Write Summary template
+            # Write Summary, Progress (headers + initial task) and Catalog
+            # (headers only) templates in a single request
             try:
-                summary_data = create_summary_template(
-                    project_name=name,
-                    description=description,
-                    created_by=user,
-                )
-                self.sheets.update_sheet_values(
-                    spreadsheet_id=spreadsheet_id,
-                    range_name=f"{config.sheets.summary}!A1",
-                    values=summary_data,
-                )
-                logger.info(f"Wrote Summary template to {config.sheets.summary}")
-            except Exception as e:
-                logger.error(f"Failed to write Summary template: {e}")
-
-            # Write Progress template (headers + initial task)
-            try:
-                progress_data = create_progress_template()
-                self.sheets.update_sheet_values(
+                self.sheets.batch_update_sheet_values(
                     spreadsheet_id=spreadsheet_id,
-                    range_name=f"{config.sheets.progress}!A1",
-                    values=progress_data,
+                    data={
+                        f"{config.sheets.summary}!A1": create_summary_template(
+                            project_name=name,
+                            description=description,
+                            created_by=user,
+                        ),
+                        f"{config.sheets.progress}!A1": create_progress_template(),
+                        f"{config.sheets.catalog}!A1": create_catalog_template(),
+                    },
                 )
-                logger.info(f"Wrote Progress template to {config.sheets.progress}")
-            except Exception as e:
-                logger.error(f"Failed to write Progress template: {e}")
-
-            # Write Catalog template (headers only)
-            try:
-                catalog_data = create_catalog_template()
-                self.sheets.update_sheet_values(
-                    spreadsheet_id=spreadsheet_id,
-                    range_name=f"{config.sheets.catalog}!A1",
-                    values=catalog_data,
+                logger.info(
+                    f"Wrote sheet templates to {config.sheets.summary}, "
+                    f"{config.sheets.progress} and {config.sheets.catalog}"
                 )
-                logger.info(f"Wrote Catalog template to {config.sheets.catalog}")
             except Exception as e:
-                logger.error(f"Failed to write Catalog template: {e}")
+                logger.error(f"Failed to write sheet templates: {e}")
         
         # Step 7: Create folders if requested
         # Note: Default folders are no longer created. Document type folders are
@@ -662,6 +742,7 @@ class ProjectTools:
         project_docs = self._list_projects_with_fallback()
 
         projects = []
+        now = datetime.now()
         for doc in project_docs:
             meta = doc.metadata
 
@@ -670,9 +751,9 @@ class ProjectTools:
                 try:
                     updated_at = datetime.fromisoformat(updated_at_str)
                 except ValueError:
-                    updated_at = datetime.now()
+                    updated_at = now
             else:
-                updated_at = datetime.now()
+                updated_at = now
 
             projects.append(ProjectSummary(
                 project_id=meta.get("project_id", ""),
@@ -1082,6 +1163,7 @@ class ProjectTools:
         for project_id in to_remove:
             try:
                 # Remove from RAG
+                self._project_config_cache.pop(project_id, None)
                 if self.rag.is_available:
                     self.rag.delete_project_config(project_id)
 
@@ -140,6 +140,7 @@ class SessionTools:
         
         # Set as current project
         self.memory.set_current_project(user, project)
+        self.project_tools.invalidate_current_project(user)
         
         # Build context
         if session_state:
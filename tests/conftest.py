@@ -58,7 +58,9 @@ def mock_sheets_client():
     mock = MagicMock()
     mock.get_sheet_values.return_value = []
     mock.update_sheet_values.return_value = None
+    mock.batch_update_sheet_values.return_value = None
     mock.create_sheet.return_value = None
+    mock.append_rows.return_value = {}
     return mock
 
 
@@ -83,6 +83,22 @@ class MockRAGClient(RAGClient):
             message="Document added successfully",
         )
 
+    def upsert_documents(
+        self,
+        doc_ids: list[str],
+        contents: list[str],
+        metadatas: list[dict[str, Any]],
+        collection: Optional[str] = None,
+    ) -> RAGOperationResult:
+        """Add or replace several documents in the in-memory store."""
+        for doc_id, content, metadata in zip(doc_ids, contents, metadatas):
+            self.add_document(doc_id, content, metadata, collection)
+
+        return RAGOperationResult(
+            success=True,
+            message=f"{len(doc_ids)} documents upserted successfully",
+        )
+
     def update_document(
         self,
         doc_id: str,
@@ -444,12 +460,26 @@ class MockRAGClient(RAGClient):
 
         return self.add_document(catalog_id, content, full_metadata)
 
+    def upsert_catalog_entries(self, entries: list[dict[str, Any]]) -> RAGOperationResult:
+        """Add or replace several catalog entries."""
+        for entry in entries:
+            self.add_catalog_entry(**entry)
+
+        return RAGOperationResult(
+            success=True,
+            message=f"{len(entries)} documents upserted successfully",
+        )
+
     def search_catalog(
         self,
         query: str,
         project: Optional[str] = None,
         doc_type: Optional[str] = None,
         phase_task: Optional[str] = None,
+        phase_tasks: Optional[list[str]] = None,
+        feature: Optional[str] = None,
+        reference_timing: Optional[str] = None,
+        status: Optional[str] = None,
         n_results: int = 10,
     ) -> RAGSearchResult:
         """Search the catalog."""
@@ -463,6 +493,17 @@ class MockRAGClient(RAGClient):
 
         if phase_task:
             where["phase_task"] = {"$eq": phase_task}
+        elif phase_tasks:
+            where["phase_task"] = {"$in": list(phase_tasks)}
+
+        if feature:
+            where["feature"] = {"$eq": feature}
+
+        if reference_timing:
+            where["reference_timing"] = {"$eq": reference_timing}
+
+        if status:
+            where["status"] = {"$eq": status}
 
         return self.search(
             query=query,
@@ -470,6 +511,30 @@ class MockRAGClient(RAGClient):
             where=where,
         )
 
+    def get_catalog_hashes(self, project: str) -> dict[str, str]:
+        """Get the sync hashes of a project's catalog entries."""
+        result = self.search_by_metadata(
+            where={
+                "type": {"$eq": "catalog"},
+                "project": {"$eq": project},
+            },
+            n_results=1000,
+        )
+        return {
+            doc.metadata.get("doc_id", ""): doc.metadata.get("row_hash", "")
+            for doc in result.documents
+        }
+
+    def delete_catalog_entries(self, project: str, doc_ids: list[str]) -> RAGOperationResult:
+        """Delete several catalog entries of a project."""
+        for doc_id in doc_ids:
+            self.delete_document(f"catalog:{project}:{doc_id}")
+
+        return RAGOperationResult(
+            success=True,
+            message=f"{len(doc_ids)} documents deleted successfully",
+        )
+
     def delete_catalog_entries_by_project(self, project: str) -> int:
         """Delete all catalog entries for a project."""
         result = self.search_by_metadata(
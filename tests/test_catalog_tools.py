@@ -2,6 +2,9 @@
 
 import pytest
 from datetime import datetime
+from unittest.mock import patch
+
+from spirrow_prismind.integrations import RAGOperationResult
 
 
 class TestSearchCatalog:
@@ -163,6 +166,74 @@ class TestSearchCatalog:
             if doc.project == "status_proj":
                 assert doc.doc_id == "active_doc"
 
+    def test_search_catalog_multiple_phase_tasks(self, catalog_tools, mock_rag_client, project_tools):
+        """Test several phase-tasks are matched with a single query."""
+        project_tools.setup_project(
+            project="multi_pt",
+            name="Multi PT",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+
+        for i, phase_task in enumerate(["P1-T01", "P1-T02", "P2-T01"]):
+            mock_rag_client.add_catalog_entry(
+                doc_id=f"mpt_doc{i}",
+                name=f"Doc {i}",
+                doc_type="設計書",
+                project="multi_pt",
+                phase_task=phase_task,
+                metadata={},
+            )
+
+        with patch.object(
+            mock_rag_client, "search_by_metadata", wraps=mock_rag_client.search_by_metadata
+        ) as search:
+            result = catalog_tools.search_catalog(phase_tasks=["P1-T01", "P2-T01"])
+
+        search.assert_called_once()
+        assert sorted(doc.phase_task for doc in result.documents) == ["P1-T01", "P2-T01"]
+
+    def test_search_catalog_filters_in_query(self, catalog_tools, mock_rag_client, project_tools):
+        """Test feature and non-default status filters are sent to the RAG query."""
+        project_tools.setup_project(
+            project="filter_proj",
+            name="Filter Project",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+
+        mock_rag_client.add_catalog_entry(
+            doc_id="login_doc",
+            name="Login Design",
+            doc_type="設計書",
+            project="filter_proj",
+            phase_task="P1-T01",
+            metadata={"feature": "login", "status": "archived"},
+        )
+        mock_rag_client.add_catalog_entry(
+            doc_id="shop_doc",
+            name="Shop Design",
+            doc_type="設計書",
+            project="filter_proj",
+            phase_task="P1-T02",
+            metadata={"feature": "shop", "status": "archived"},
+        )
+
+        with patch.object(
+            mock_rag_client, "search_by_metadata", wraps=mock_rag_client.search_by_metadata
+        ) as search:
+            result = catalog_tools.search_catalog(feature="login", status="archived", limit=5)
+
+        where = search.call_args.kwargs["where"]
+        assert where["feature"] == {"$eq": "login"}
+        assert where["status"] == {"$eq": "archived"}
+        assert search.call_args.kwargs["n_results"] == 5
+        assert [doc.doc_id for doc in result.documents] == ["login_doc"]
+
 
 class TestSyncCatalog:
     """Tests for sync_catalog method."""
@@ -223,6 +294,158 @@ class TestSyncCatalog:
 
         assert result.success is True
         assert result.synced_count == 2
+        mock_sheets_client.sheet_exists.assert_not_called()
+
+    def test_sync_catalog_upserts_entries_in_one_request(
+        self, catalog_tools, mock_sheets_client, mock_rag_client, project_tools
+    ):
+        """Test sync sends all rows to the RAG server in a single batch."""
+        project_tools.setup_project(
+            project="sync_batch",
+            name="Sync Batch",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+
+        mock_sheets_client.read_range.return_value = {
+            "values": [
+                ["Doc 1", "Google Docs", "doc1", "設計書", "sync_batch", "P1-T01"],
+                ["Doc 2", "Google Docs", "doc2", "設計書", "sync_batch", "P1-T02"],
+                ["", "Google Docs", "doc3", "設計書", "sync_batch", "P1-T03"],  # No name
+            ]
+        }
+
+        with patch.object(
+            mock_rag_client, "upsert_catalog_entries", wraps=mock_rag_client.upsert_catalog_entries
+        ) as upsert_entries:
+            result = catalog_tools.sync_catalog(project="sync_batch")
+
+        assert result.synced_count == 2
+        upsert_entries.assert_called_once()
+        assert [e["doc_id"] for e in upsert_entries.call_args.args[0]] == ["doc1", "doc2"]
+        assert mock_rag_client.get_catalog_entry("doc1", "sync_batch") is not None
+
+    def test_sync_catalog_only_writes_changed_rows(
+        self, catalog_tools, mock_sheets_client, mock_rag_client, project_tools
+    ):
+        """Test a re-sync skips unchanged rows and removes deleted ones."""
+        project_tools.setup_project(
+            project="sync_diff",
+            name="Sync Diff",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+
+        mock_sheets_client.read_range.return_value = {
+            "values": [
+                ["Doc 1", "Google Docs", "doc1", "設計書", "sync_diff", "P1-T01"],
+                ["Doc 2", "Google Docs", "doc2", "設計書", "sync_diff", "P1-T02"],
+                ["Doc 3", "Google Docs", "doc3", "設計書", "sync_diff", "P1-T03"],
+            ]
+        }
+        catalog_tools.sync_catalog(project="sync_diff")
+
+        mock_sheets_client.read_range.return_value = {
+            "values": [
+                ["Doc 1", "Google Docs", "doc1", "設計書", "sync_diff", "P1-T01"],
+                ["Doc 2 (rev)", "Google Docs", "doc2", "設計書", "sync_diff", "P1-T02"],
+            ]
+        }
+        with patch.object(
+            mock_rag_client, "upsert_catalog_entries", wraps=mock_rag_client.upsert_catalog_entries
+        ) as upsert_entries:
+            result = catalog_tools.sync_catalog(project="sync_diff")
+
+        assert result.success is True
+        assert result.synced_count == 2
+        assert [e["doc_id"] for e in upsert_entries.call_args.args[0]] == ["doc2"]
+        assert mock_rag_client.get_catalog_entry("doc2", "sync_diff").metadata["name"] == "Doc 2 (rev)"
+        assert mock_rag_client.get_catalog_entry("doc3", "sync_diff") is None
+
+    def test_sync_catalog_reports_failed_delete(
+        self, catalog_tools, mock_sheets_client, mock_rag_client, project_tools
+    ):
+        """Test a failed delete of removed rows is reported."""
+        project_tools.setup_project(
+            project="sync_delete",
+            name="Sync Delete",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+
+        mock_sheets_client.read_range.return_value = {
+            "values": [
+                ["Doc 1", "Google Docs", "doc1", "設計書", "sync_delete", "P1-T01"],
+                ["Doc 2", "Google Docs", "doc2", "設計書", "sync_delete", "P1-T02"],
+            ]
+        }
+        catalog_tools.sync_catalog(project="sync_delete")
+
+        mock_sheets_client.read_range.return_value = {
+            "values": [
+                ["Doc 1", "Google Docs", "doc1", "設計書", "sync_delete", "P1-T01"],
+            ]
+        }
+        failed = RAGOperationResult(success=False, message="timeout")
+        with patch.object(mock_rag_client, "delete_catalog_entries", return_value=failed):
+            result = catalog_tools.sync_catalog(project="sync_delete")
+
+        assert result.success is False
+        assert result.synced_count == 1
+        assert "timeout" in result.message
+
+    def test_sync_catalog_normalizes_updated_at(
+        self, catalog_tools, mock_sheets_client, mock_rag_client, project_tools
+    ):
+        """Test sync stores updated_at as ISO 8601."""
+        project_tools.setup_project(
+            project="sync_dates",
+            name="Sync Dates",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+
+        empty = [""] * 4
+        mock_sheets_client.read_range.return_value = {
+            "values": [
+                ["Doc 1", "Google Docs", "doc1", "設計書", "sync_dates", "P1-T01", *empty, "2024-01-15T10:00:00"],
+                ["Doc 2", "Google Docs", "doc2", "設計書", "sync_dates", "P1-T02", *empty, "2024/01/15"],
+            ]
+        }
+
+        catalog_tools.sync_catalog(project="sync_dates")
+
+        doc1 = mock_rag_client.get_catalog_entry("doc1", "sync_dates")
+        doc2 = mock_rag_client.get_catalog_entry("doc2", "sync_dates")
+        assert doc1.metadata["updated_at"] == "2024-01-15T10:00:00"
+        assert datetime.fromisoformat(doc2.metadata["updated_at"]).date() == datetime.now().date()
+
+    def test_sync_catalog_missing_sheet(self, catalog_tools, mock_sheets_client, project_tools):
+        """Test sync reports a missing catalog sheet when the read fails."""
+        project_tools.setup_project(
+            project="sync_missing",
+            name="Sync Missing",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+
+        mock_sheets_client.read_range.side_effect = RuntimeError("Unable to parse range")
+        mock_sheets_client.sheet_exists.return_value = False
+
+        result = catalog_tools.sync_catalog(project="sync_missing")
+
+        assert result.success is False
+        assert "目録シート" in result.message
 
 
 class TestGetDocumentByPhaseTask:
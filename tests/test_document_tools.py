@@ -1,9 +1,11 @@
 """Tests for DocumentTools."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from dataclasses import dataclass
 
+from spirrow_prismind.integrations import RAG_EXECUTOR
+
 
 @dataclass
 class MockDocInfo:
@@ -58,6 +60,41 @@ class TestGetDocument:
         assert result.document.name == "Test Document"
         mock_docs_client.get_document.assert_called_once_with("doc123")
 
+    def test_get_document_by_id_reuses_catalog_lookup(
+        self, document_tools, mock_docs_client, mock_rag_client
+    ):
+        """Test repeated reads reuse the catalog entry until it is updated."""
+        mock_docs_client.get_document.return_value = MockDocInfo(
+            doc_id="cached_doc",
+            title="Cached Document",
+            url="https://docs.google.com/cached_doc",
+            body_text="Body",
+        )
+        mock_rag_client.add_catalog_entry(
+            doc_id="cached_doc",
+            name="Cached Document",
+            doc_type="設計書",
+            project="cache_proj",
+            phase_task="P1-T01",
+            metadata={"feature": "old"},
+        )
+
+        with patch.object(
+            mock_rag_client, "search_by_metadata", wraps=mock_rag_client.search_by_metadata
+        ) as search:
+            document_tools.get_document(doc_id="cached_doc")
+            result = document_tools.get_document(doc_id="cached_doc")
+            assert result.document.metadata["feature"] == "old"
+            assert search.call_count == 1
+
+            # Updates never work on a cached copy, and drop it
+            document_tools.update_document(doc_id="cached_doc", metadata={"feature": "new"})
+            assert search.call_count == 2
+
+            result = document_tools.get_document(doc_id="cached_doc")
+            assert result.document.metadata["feature"] == "new"
+            assert search.call_count == 3
+
     def test_get_document_by_query_single_result(
         self, document_tools, mock_rag_client, mock_docs_client, project_tools
     ):
@@ -95,6 +132,44 @@ class TestGetDocument:
         assert result.found is True
         assert result.document.doc_id == "found_doc"
 
+    def test_get_document_reference_only(
+        self, document_tools, mock_rag_client, mock_docs_client, project_tools
+    ):
+        """Test include_content=False answers from the catalog without Docs."""
+        project_tools.setup_project(
+            project="ref_proj",
+            name="Ref Project",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+        mock_rag_client.add_catalog_entry(
+            doc_id="ref_doc",
+            name="Reference Document",
+            doc_type="設計書",
+            project="ref_proj",
+            phase_task="P1-T01",
+            metadata={"url": "https://docs.google.com/ref_doc"},
+        )
+
+        with patch.object(
+            mock_rag_client, "search_by_metadata", wraps=mock_rag_client.search_by_metadata
+        ) as search:
+            result = document_tools.get_document(
+                query="Reference Document", include_content=False
+            )
+
+        assert result.found is True
+        assert result.document.doc_id == "ref_doc"
+        assert result.document.name == "Reference Document"
+        assert result.document.doc_type == "設計書"
+        assert result.document.content == ""
+        assert result.document.metadata["url"] == "https://docs.google.com/ref_doc"
+        mock_docs_client.get_document.assert_not_called()
+        # The search hit already is the catalog entry
+        search.assert_not_called()
+
     def test_get_document_by_query_multiple_results(
         self, document_tools, mock_rag_client, project_tools
     ):
@@ -215,9 +290,7 @@ class TestCreateDocument:
             name="New Document",
             web_view_link="https://docs.google.com/document/d/new_doc_id/edit",
         )
-        # Mock for insert_text and batchUpdate
-        mock_docs_client.insert_text.return_value = True
-        mock_docs_client.service.documents.return_value.batchUpdate.return_value.execute.return_value = {}
+        mock_docs_client.insert_heading_and_text.return_value = True
 
         result = document_tools.create_document(
             name="New Document",
@@ -244,6 +317,242 @@ class TestCreateDocument:
             name="New Document",
             parent_id="design_folder_id",
         )
+        # Heading and content are written in one Docs request
+        mock_docs_client.insert_heading_and_text.assert_called_once_with(
+            "new_doc_id", "New Document", "# New Document\n\nContent here"
+        )
+
+    def test_create_document_blank_content_skips_docs(
+        self, document_tools, mock_docs_client, mock_drive_client, project_tools,
+        setup_standard_global_types,
+    ):
+        """Test that blank content creates an empty document without a Docs request."""
+        project_tools.setup_project(
+            project="blank_proj",
+            name="Blank Project",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+        mock_drive_client.ensure_folder_path.return_value = (
+            MockFileInfo(file_id="design_folder_id", name="設計書"),
+            False,
+        )
+        mock_drive_client.create_document.return_value = MockFileInfo(
+            file_id="blank_doc_id",
+            name="Blank Document",
+            web_view_link="https://docs.google.com/document/d/blank_doc_id/edit",
+        )
+
+        result = document_tools.create_document(
+            name="Blank Document",
+            doc_type="設計書",
+            content="  \n",
+            phase_task="P1-T01",
+        )
+
+        assert result.success is True
+        assert result.doc_id == "blank_doc_id"
+        mock_docs_client.insert_heading_and_text.assert_not_called()
+
+    def test_create_document_docs_failure_skips_rag(
+        self, document_tools, mock_docs_client, mock_drive_client, mock_rag_client,
+        project_tools, setup_standard_global_types,
+    ):
+        """Test that a failed content write leaves no RAG catalog entry."""
+        project_tools.setup_project(
+            project="fail_proj",
+            name="Fail Project",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+        mock_drive_client.ensure_folder_path.return_value = (
+            MockFileInfo(file_id="design_folder_id", name="設計書"),
+            False,
+        )
+        mock_drive_client.create_document.return_value = MockFileInfo(
+            file_id="failed_doc_id",
+            name="Failed Document",
+            web_view_link="https://docs.google.com/document/d/failed_doc_id/edit",
+        )
+        mock_docs_client.insert_heading_and_text.side_effect = RuntimeError("Docs error")
+
+        result = document_tools.create_document(
+            name="Failed Document",
+            doc_type="設計書",
+            content="Some content",
+            phase_task="P1-T01",
+        )
+
+        assert result.success is False
+        # Let anything already submitted to the single RAG worker finish
+        RAG_EXECUTOR.submit(lambda: None).result()
+        search = mock_rag_client.search_catalog(query="Failed Document", project="fail_proj")
+        assert search.documents == []
+
+    def test_create_document_batch_flushes_catalog_once(
+        self, document_tools, mock_drive_client, mock_sheets_client, project_tools,
+        setup_standard_global_types,
+    ):
+        """Test batched creates queue catalog rows until flush_catalog."""
+        project_tools.setup_project(
+            project="batch_proj",
+            name="Batch Project",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+        mock_drive_client.ensure_folder_path.return_value = (
+            MockFileInfo(file_id="design_folder_id", name="設計書"),
+            False,
+        )
+        mock_sheets_client.sheet_exists.return_value = True
+
+        for i in range(3):
+            mock_drive_client.create_document.return_value = MockFileInfo(
+                file_id=f"batch_doc_{i}",
+                name=f"Batch Doc {i}",
+            )
+            result = document_tools.create_document(
+                name=f"Batch Doc {i}",
+                doc_type="設計書",
+                content="",
+                phase_task="P1-T01",
+                keywords=[],
+                batch=True,
+            )
+            assert result.success is True
+            assert result.catalog_registered is True
+
+        mock_sheets_client.append_rows.assert_not_called()
+        mock_sheets_client.sheet_exists.assert_called_once()
+
+        assert document_tools.flush_catalog() == {}
+        mock_sheets_client.append_rows.assert_called_once()
+        rows = mock_sheets_client.append_rows.call_args.kwargs["values"]
+        assert [row[2] for row in rows] == ["batch_doc_0", "batch_doc_1", "batch_doc_2"]
+
+        # Nothing left to flush
+        mock_sheets_client.append_rows.reset_mock()
+        assert document_tools.flush_catalog() == {}
+        mock_sheets_client.append_rows.assert_not_called()
+
+    def test_flush_catalog_reports_failures_without_requeue(
+        self, document_tools, mock_drive_client, mock_sheets_client, mock_rag_client,
+        project_tools, setup_standard_global_types,
+    ):
+        """Test that failed catalog writes are reported and dropped from the queue."""
+        project_tools.setup_project(
+            project="flush_fail_proj",
+            name="Flush Fail Project",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+        mock_drive_client.ensure_folder_path.return_value = (
+            MockFileInfo(file_id="design_folder_id", name="設計書"),
+            False,
+        )
+        mock_drive_client.create_document.return_value = MockFileInfo(
+            file_id="flush_doc", name="Flush Doc"
+        )
+        mock_sheets_client.sheet_exists.return_value = True
+        mock_sheets_client.append_rows.side_effect = RuntimeError("Sheets error")
+
+        document_tools.create_document(
+            name="Flush Doc",
+            doc_type="設計書",
+            content="",
+            phase_task="P1-T01",
+            keywords=[],
+            batch=True,
+        )
+        failures = document_tools.flush_catalog()
+
+        assert list(failures) == ["flush_doc"]
+        assert "目録シートへの登録に失敗しました" in failures["flush_doc"]
+        # The RAG entry was still written; the failed row is not retried later
+        assert mock_rag_client.get_catalog_entry("flush_doc", "flush_fail_proj") is not None
+        mock_sheets_client.append_rows.reset_mock()
+        assert document_tools.flush_catalog() == {}
+        mock_sheets_client.append_rows.assert_not_called()
+
+    def test_bulk_create_documents_one_write_per_store(
+        self, document_tools, mock_drive_client, mock_sheets_client, mock_rag_client,
+        project_tools, setup_standard_global_types,
+    ):
+        """Test bulk creation writes Sheets and RAG catalogs once each."""
+        project_tools.setup_project(
+            project="bulk_proj",
+            name="Bulk Project",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+        mock_drive_client.ensure_folder_path.return_value = (
+            MockFileInfo(file_id="design_folder_id", name="設計書"),
+            False,
+        )
+        mock_drive_client.create_document.side_effect = [
+            MockFileInfo(file_id="bulk_doc_1", name="Bulk Doc 1"),
+            MockFileInfo(file_id="bulk_doc_2", name="Bulk Doc 2"),
+        ]
+        mock_sheets_client.sheet_exists.return_value = True
+
+        with patch.object(
+            mock_rag_client, "upsert_catalog_entries", wraps=mock_rag_client.upsert_catalog_entries
+        ) as upsert:
+            results = document_tools.bulk_create_documents([
+                {"name": "Bulk Doc 1", "doc_type": "設計書", "content": "", "phase_task": "P1-T01"},
+                {"name": "Bulk Doc 2", "doc_type": "設計書", "content": "", "phase_task": "P1-T02"},
+            ])
+
+        assert [r.doc_id for r in results] == ["bulk_doc_1", "bulk_doc_2"]
+        assert all(r.success for r in results)
+        upsert.assert_called_once()
+        assert [e["doc_id"] for e in upsert.call_args.args[0]] == ["bulk_doc_1", "bulk_doc_2"]
+        mock_sheets_client.append_rows.assert_called_once()
+        assert mock_rag_client.get_catalog_entry("bulk_doc_2", "bulk_proj") is not None
+
+    def test_bulk_create_documents_reports_catalog_failure(
+        self, document_tools, mock_drive_client, mock_sheets_client,
+        project_tools, setup_standard_global_types,
+    ):
+        """Test that a failed catalog flush is reflected in each affected result."""
+        project_tools.setup_project(
+            project="bulk_fail_proj",
+            name="Bulk Fail Project",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+        mock_drive_client.ensure_folder_path.return_value = (
+            MockFileInfo(file_id="design_folder_id", name="設計書"),
+            False,
+        )
+        mock_drive_client.create_document.side_effect = [
+            MockFileInfo(file_id="bulk_fail_1", name="Bulk Fail 1"),
+            MockFileInfo(file_id="bulk_fail_2", name="Bulk Fail 2"),
+        ]
+        mock_sheets_client.sheet_exists.return_value = True
+        mock_sheets_client.append_rows.side_effect = RuntimeError("Sheets error")
+
+        results = document_tools.bulk_create_documents([
+            {"name": "Bulk Fail 1", "doc_type": "設計書", "content": "", "phase_task": "P1-T01"},
+            {"name": "Bulk Fail 2", "doc_type": "設計書", "content": "", "phase_task": "P1-T02"},
+        ])
+
+        assert all(r.success for r in results)
+        assert not any(r.catalog_registered for r in results)
+        assert all("目録シートへの登録に失敗しました" in r.message for r in results)
+        assert document_tools._pending_catalog_rows == {}
 
     def test_create_document_with_nested_folder_path(
         self, document_tools, mock_docs_client, mock_drive_client, mock_rag_client, project_tools
@@ -301,8 +610,7 @@ class TestCreateDocument:
             name="Detailed Design Doc",
             web_view_link="https://docs.google.com/document/d/nested_doc_id/edit",
         )
-        mock_docs_client.insert_text.return_value = True
-        mock_docs_client.service.documents.return_value.batchUpdate.return_value.execute.return_value = {}
+        mock_docs_client.insert_heading_and_text.return_value = True
 
         result = document_tools.create_document(
             name="Detailed Design Doc",
@@ -388,6 +696,46 @@ class TestUpdateDocument:
         assert result.success is True
         mock_docs_client.append_text.assert_called_once()
 
+    def test_update_document_content_and_metadata_one_rag_round_trip(
+        self, document_tools, mock_docs_client, mock_rag_client, project_tools
+    ):
+        """Test content and metadata updates share one catalog fetch and write."""
+        project_tools.setup_project(
+            project="combined_proj",
+            name="Combined Project",
+            spreadsheet_id="",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+
+        mock_rag_client.add_catalog_entry(
+            doc_id="combined_doc",
+            name="Combined Doc",
+            doc_type="設計書",
+            project="combined_proj",
+            phase_task="P1-T01",
+            metadata={"feature": "old"},
+        )
+
+        with patch.object(
+            mock_rag_client, "search_by_metadata", wraps=mock_rag_client.search_by_metadata
+        ) as search, patch.object(
+            mock_rag_client, "update_document", wraps=mock_rag_client.update_document
+        ) as update:
+            result = document_tools.update_document(
+                doc_id="combined_doc",
+                content="New content",
+                metadata={"feature": "new"},
+            )
+
+        assert result.success is True
+        assert result.updated_fields == ["content", "feature"]
+        search.assert_called_once()
+        update.assert_called_once()
+        assert update.call_args.kwargs["metadata"]["feature"] == "new"
+        assert "updated_at" in update.call_args.kwargs["metadata"]
+
 
 class TestGenerateKeywords:
     """Tests for _generate_keywords method."""
@@ -737,12 +1085,15 @@ class TestUpdateDocumentExtended:
             metadata={"source": "Google Docs"},
         )
 
-        # Mock Sheets operations
-        mock_sheets_client.find_row_by_value.return_value = 3
-        mock_sheets_client.get_sheet_values.return_value = [[
-            "Change Phase Doc", "Google Docs", "change_phase_doc",
-            "設計書", "update_phase_proj", "P1-T01", "", "", "", "", "", "", ""
-        ]]
+        # Mock Sheets operations: header, another document, then ours in row 3
+        mock_sheets_client.get_sheet_values.return_value = [
+            ["ドキュメント名", "保存先", "ID"],
+            ["Other Doc", "Google Docs", "other_doc"],
+            [
+                "Change Phase Doc", "Google Docs", "change_phase_doc",
+                "設計書", "update_phase_proj", "P1-T01", "", "", "", "", "", "", ""
+            ],
+        ]
         mock_sheets_client.update_row.return_value = {}
 
         result = document_tools.update_document(
@@ -752,6 +1103,63 @@ class TestUpdateDocumentExtended:
 
         assert result.success is True
         assert "phase_task" in result.updated_fields
+        # The catalog is read once and the row found in that read is rewritten
+        mock_sheets_client.get_sheet_values.assert_called_once()
+        mock_sheets_client.find_row_by_value.assert_not_called()
+        update = mock_sheets_client.update_row.call_args.kwargs
+        assert update["row_number"] == 3
+        assert update["values"][2] == "change_phase_doc"
+        assert update["values"][5] == "P2-T01"
+
+        # The next update reads only the remembered row
+        mock_sheets_client.get_sheet_values.reset_mock()
+        mock_sheets_client.get_sheet_values.return_value = [[
+            "Change Phase Doc", "Google Docs", "change_phase_doc",
+            "設計書", "update_phase_proj", "P2-T01", "", "", "", "", "", "", ""
+        ]]
+        document_tools.update_document(
+            doc_id="change_phase_doc",
+            metadata={"feature": "Feature B"},
+        )
+        mock_sheets_client.get_sheet_values.assert_called_once_with("sheet1", "目録!A3:M3")
+        update = mock_sheets_client.update_row.call_args.kwargs
+        assert update["row_number"] == 3
+        assert update["values"][6] == "Feature B"
+
+    def test_appended_catalog_row_is_remembered(
+        self, document_tools, mock_sheets_client, project_tools
+    ):
+        """Test that a row appended to the catalog is located without a scan."""
+        project_tools.setup_project(
+            project="append_proj",
+            name="Append Project",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+        config = project_tools.get_project_config()
+        mock_sheets_client.append_rows.return_value = {
+            "updates": {"updatedRange": "'目録'!A7:M7"}
+        }
+
+        document_tools._register_in_sheets_catalog(
+            config=config,
+            doc_id="appended_doc",
+            name="Appended Doc",
+            doc_type="設計書",
+            phase_task="P1-T01",
+            feature=None,
+            keywords=["Appended"],
+            reference_timing=None,
+        )
+
+        row = mock_sheets_client.append_rows.call_args.kwargs["values"][0]
+        mock_sheets_client.get_sheet_values.return_value = [row]
+        found = document_tools._locate_catalog_row(config, "appended_doc")
+
+        assert found == (7, row)
+        mock_sheets_client.get_sheet_values.assert_called_once_with("sheet1", "目録!A7:M7")
 
 
 class TestListDocumentTypes:
@@ -871,3 +1279,57 @@ class TestListDocumentTypes:
 
         # Cleanup
         GlobalDocumentTypeStorage.reset_instance()
+
+    def test_get_document_type_by_id_or_name(self, document_tools, tmp_path):
+        """Test get_document_type resolves both type_id and display name."""
+        from spirrow_prismind.tools.global_document_types import GlobalDocumentTypeStorage
+        from spirrow_prismind.models.document import DocumentType
+
+        GlobalDocumentTypeStorage.reset_instance()
+        storage = GlobalDocumentTypeStorage(tmp_path / ".prismind_global_doc_types.json")
+        storage.register(DocumentType(
+            type_id="design",
+            name="設計書",
+            folder_name="設計",
+            is_global=True,
+        ))
+
+        assert document_tools.get_document_type("design").type_id == "design"
+        assert document_tools.get_document_type("設計書").type_id == "design"
+        assert document_tools.get_document_type("unknown") is None
+
+        # Cleanup
+        GlobalDocumentTypeStorage.reset_instance()
+
+    def test_list_document_types_is_cached_until_register(self, document_tools, tmp_path):
+        """Test the merged type list is reused until a type is registered."""
+        from spirrow_prismind.tools.global_document_types import GlobalDocumentTypeStorage
+        from spirrow_prismind.models.document import DocumentType
+
+        GlobalDocumentTypeStorage.reset_instance()
+        storage = GlobalDocumentTypeStorage(tmp_path / ".prismind_global_doc_types.json")
+
+        assert document_tools.list_document_types().document_types == []
+
+        # Changes made behind DocumentTools' back are not seen while cached
+        storage.register(DocumentType(
+            type_id="design",
+            name="Design Document",
+            folder_name="Design",
+            is_global=True,
+        ))
+        assert document_tools.list_document_types().document_types == []
+
+        # Registering through DocumentTools invalidates the cache
+        result = document_tools.register_document_type(
+            type_id="meeting_notes",
+            name="議事録",
+            folder_name="議事録",
+        )
+        assert result.success is True
+
+        type_ids = {dt.type_id for dt in document_tools.list_document_types().document_types}
+        assert type_ids == {"design", "meeting_notes"}
+
+        # Cleanup
+        GlobalDocumentTypeStorage.reset_instance()
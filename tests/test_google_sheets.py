@@ -3,7 +3,11 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
+from googleapiclient.errors import HttpError
+from httplib2 import Response
+
 from spirrow_prismind.integrations.google_sheets import GoogleSheetsClient
+from spirrow_prismind.integrations.retry import GOOGLE_API_RETRIES, is_rate_limit_error
 
 
 class TestGoogleSheetsClient:
@@ -70,9 +74,13 @@ class TestGoogleSheetsClientSheetOperations:
 
         client = GoogleSheetsClient.__new__(GoogleSheetsClient)
         client._service = mock_service
+        client._sheet_names = {"spreadsheet123": (0.0, frozenset({"Sheet1"}))}
 
         result = client.rename_sheet("spreadsheet123", 0, "RenamedSheet")
 
+        # Cached names are dropped so the old name is no longer reported
+        assert "spreadsheet123" not in client._sheet_names
+
         # Verify batchUpdate was called with correct parameters
         mock_service.spreadsheets().batchUpdate.assert_called()
         call_args = mock_service.spreadsheets().batchUpdate.call_args
@@ -98,6 +106,32 @@ class TestGoogleSheetsClientSheetOperations:
 
         assert sheet_id == 0
 
+    @patch("spirrow_prismind.integrations.google_sheets.build")
+    def test_sheet_exists_caches_found_names(self, mock_build):
+        """Test sheet_exists reuses fetched names but re-checks missing ones."""
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+        get = mock_service.spreadsheets().get
+        get().execute.return_value = {
+            "sheets": [
+                {"properties": {"sheetId": 0, "title": "Summary"}},
+                {"properties": {"sheetId": 1, "title": "Catalog"}},
+            ]
+        }
+        get.reset_mock()
+
+        client = GoogleSheetsClient.__new__(GoogleSheetsClient)
+        client._service = mock_service
+        client._sheet_names = {}
+
+        assert client.sheet_exists("spreadsheet123", "Catalog") is True
+        assert client.sheet_exists("spreadsheet123", "Summary") is True
+        assert get.call_count == 1
+
+        # A missing sheet may have been created since; ask again
+        assert client.sheet_exists("spreadsheet123", "Progress") is False
+        assert get.call_count == 2
+
     @patch("spirrow_prismind.integrations.google_sheets.build")
     def test_initialize_project_sheets(self, mock_build):
         """Test initializing project sheets."""
@@ -113,6 +147,7 @@ class TestGoogleSheetsClientSheetOperations:
 
         client = GoogleSheetsClient.__new__(GoogleSheetsClient)
         client._service = mock_service
+        client._sheet_names = {}
 
         sheets = client.initialize_project_sheets(
             spreadsheet_id="spreadsheet123",
@@ -122,8 +157,12 @@ class TestGoogleSheetsClientSheetOperations:
         )
 
         assert sheets == ["Summary", "Progress", "Catalog"]
-        # Verify batchUpdate was called multiple times (for rename + creates)
-        assert mock_service.spreadsheets().batchUpdate.call_count >= 3
+        # Verify rename + creates were sent as a single batchUpdate
+        body = mock_service.spreadsheets().batchUpdate.call_args.kwargs["body"]
+        assert len(body["requests"]) == 3
+        assert body["requests"][0]["updateSheetProperties"]["properties"]["title"] == "Summary"
+        assert body["requests"][1]["addSheet"]["properties"]["title"] == "Progress"
+        assert body["requests"][2]["addSheet"]["properties"]["title"] == "Catalog"
 
     @patch("spirrow_prismind.integrations.google_sheets.build")
     def test_read_range(self, mock_build):
@@ -140,6 +179,9 @@ class TestGoogleSheetsClientSheetOperations:
         result = client.read_range("spreadsheet123", "Sheet1!A1:B2")
 
         assert result["values"] == [["A1", "B1"], ["A2", "B2"]]
+        mock_service.spreadsheets().values().get().execute.assert_called_with(
+            num_retries=GOOGLE_API_RETRIES
+        )
 
     @patch("spirrow_prismind.integrations.google_sheets.build")
     def test_update_range(self, mock_build):
@@ -161,6 +203,31 @@ class TestGoogleSheetsClientSheetOperations:
 
         assert result["updatedCells"] == 4
 
+    @patch("spirrow_prismind.integrations.google_sheets.build")
+    def test_batch_update_sheet_values(self, mock_build):
+        """Test updating several ranges in one request."""
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+        mock_service.spreadsheets().values().batchUpdate().execute.return_value = {
+            "totalUpdatedCells": 3
+        }
+
+        client = GoogleSheetsClient.__new__(GoogleSheetsClient)
+        client._service = mock_service
+
+        result = client.batch_update_sheet_values(
+            "spreadsheet123",
+            {"Summary!A1": [["a"]], "Progress!A1": [["b"], ["c"]]},
+        )
+
+        assert result["totalUpdatedCells"] == 3
+        body = mock_service.spreadsheets().values().batchUpdate.call_args.kwargs["body"]
+        assert body["valueInputOption"] == "USER_ENTERED"
+        assert body["data"] == [
+            {"range": "Summary!A1", "values": [["a"]]},
+            {"range": "Progress!A1", "values": [["b"], ["c"]]},
+        ]
+
     @patch("spirrow_prismind.integrations.google_sheets.build")
     def test_append_rows(self, mock_build):
         """Test appending rows (alias for append_sheet_values)."""
@@ -181,6 +248,48 @@ class TestGoogleSheetsClientSheetOperations:
 
         assert result["updates"]["updatedRows"] == 2
 
+    @patch("spirrow_prismind.integrations.retry.time.sleep")
+    @patch("spirrow_prismind.integrations.google_sheets.build")
+    def test_append_rows_retries_only_rate_limit_errors(self, mock_build, mock_sleep):
+        """Test that an append is resent after a 429 but never after a 5xx."""
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+        append = mock_service.spreadsheets().values().append()
+        append.execute.side_effect = [
+            HttpError(Response({"status": 429}), b"{}"),
+            {"updates": {"updatedRows": 1}},
+        ]
+
+        client = GoogleSheetsClient.__new__(GoogleSheetsClient)
+        client._service = mock_service
+
+        result = client.append_rows("spreadsheet123", "Sheet1!A:B", [["A3", "B3"]])
+
+        assert result["updates"]["updatedRows"] == 1
+        assert append.execute.call_count == 2
+
+        # A 5xx may follow a committed append, so it is not resent
+        append.execute.reset_mock(side_effect=True)
+        append.execute.side_effect = HttpError(Response({"status": 503}), b"{}")
+        with pytest.raises(RuntimeError):
+            client.append_rows("spreadsheet123", "Sheet1!A:B", [["A3", "B3"]])
+        append.execute.assert_called_once_with()
+
+
+class TestRateLimitError:
+    """Test cases for is_rate_limit_error."""
+
+    def test_rate_limit_reasons(self):
+        """Test which Google API errors count as rate-limit rejections."""
+        rate_limited = b'{"error": {"code": 403, "errors": [{"reason": "userRateLimitExceeded"}]}}'
+        forbidden = b'{"error": {"code": 403, "errors": [{"reason": "forbidden"}]}}'
+
+        assert is_rate_limit_error(HttpError(Response({"status": 429}), b""))
+        assert is_rate_limit_error(HttpError(Response({"status": 403}), rate_limited))
+        assert not is_rate_limit_error(HttpError(Response({"status": 403}), forbidden))
+        assert not is_rate_limit_error(HttpError(Response({"status": 500}), b"{}"))
+        assert not is_rate_limit_error(RuntimeError("not an HTTP error"))
+
 
 class TestCatalogEntry:
     """Test cases for CatalogEntry model."""
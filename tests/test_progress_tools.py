@@ -154,6 +154,32 @@ class TestGetProgress:
         assert task.category == "bug"
         assert task.blocked_by == ["T00", "T02"]
 
+    def test_get_progress_to_dict(self, progress_tools, mock_sheets_client, project_tools):
+        """Test GetProgressResult.to_dict response shape."""
+        project_tools.setup_project(
+            project="prog_dict",
+            name="Progress Dict",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+
+        mock_sheets_client.read_range.return_value = {
+            "values": [
+                ["フェーズ", "タスクID", "タスク名", "ステータス", "ブロッカー", "完了日", "備考"],
+                ["Phase 1", "T01", "Task 1", "completed", "", "2024-01-15", ""],
+            ]
+        }
+
+        data = progress_tools.get_progress(project="prog_dict").to_dict()
+
+        assert data["success"] is True
+        assert data["project"] == "prog_dict"
+        task = data["phases"][0]["tasks"][0]
+        assert set(task) == {"task_id", "name", "status", "blockers", "completed_at", "notes"}
+        assert task["completed_at"].startswith("2024-01-15")
+
 
 class TestUpdateTaskStatus:
     """Tests for update_task_status method."""
@@ -1,6 +1,7 @@
 """Tests for ProjectTools."""
 
 import pytest
+from unittest.mock import patch
 
 
 class TestSetupProject:
@@ -33,6 +34,23 @@ class TestSetupProject:
         assert current is not None
         assert current.project_id == "test_proj"
 
+    def test_setup_project_writes_templates_in_one_request(self, project_tools, mock_sheets_client):
+        """Test that sheet templates are written with a single batch update."""
+        result = project_tools.setup_project(
+            project="tmpl_proj",
+            name="Template Project",
+            spreadsheet_id="sheet123",
+            root_folder_id="folder456",
+            create_sheets=True,
+            create_folders=False,
+        )
+
+        assert result.success is True
+        mock_sheets_client.batch_update_sheet_values.assert_called_once()
+        data = mock_sheets_client.batch_update_sheet_values.call_args.kwargs["data"]
+        assert len(data) == 3
+        mock_sheets_client.update_sheet_values.assert_not_called()
+
     def test_setup_project_duplicate_id(self, project_tools, mock_rag_client):
         """Test setup fails with duplicate project ID."""
         # First setup
@@ -200,6 +218,29 @@ class TestSwitchProject:
         current = mock_memory_client.get_current_project("test_user")
         assert current.project_id == "switch_proj"
 
+    def test_current_project_lookup_is_cached(self, project_tools, mock_memory_client):
+        """Test the current project is cached and refreshed after a switch."""
+        for project in ("cache_a", "cache_b"):
+            project_tools.setup_project(
+                project=project,
+                name=project,
+                spreadsheet_id="sheet1",
+                root_folder_id="folder1",
+                create_sheets=False,
+                create_folders=False,
+            )
+        project_tools.switch_project("cache_a")
+
+        with patch.object(
+            mock_memory_client, "get_current_project", wraps=mock_memory_client.get_current_project
+        ) as get_current:
+            assert project_tools.get_current_project_id() == "cache_a"
+            assert project_tools.get_current_project_id() == "cache_a"
+            assert get_current.call_count == 1
+
+            project_tools.switch_project("cache_b")
+            assert project_tools.get_current_project_id() == "cache_b"
+
     def test_switch_project_not_found(self, project_tools):
         """Test switch fails for non-existent project."""
         result = project_tools.switch_project("nonexistent")
@@ -301,6 +342,45 @@ class TestUpdateProject:
         assert len(result.updated_fields) == 0
         assert "更新する項目がありません" in result.message
 
+    def test_update_project_config_field_metadata_only(self, project_tools, mock_rag_client):
+        """Test a single config field is updated without re-saving the project."""
+        project_tools.setup_project(
+            project="field_proj",
+            name="Field Project",
+            spreadsheet_id="sheet1",
+            root_folder_id="folder1",
+            create_sheets=False,
+            create_folders=False,
+        )
+        doc_types = [{"type_id": "meeting_notes", "name": "議事録"}]
+
+        with patch.object(mock_rag_client, "save_project_config") as save, patch.object(
+            mock_rag_client, "update_document", wraps=mock_rag_client.update_document
+        ) as update:
+            success, warning = project_tools.update_project_config_field(
+                "field_proj", "document_types", doc_types
+            )
+
+        assert success is True
+        assert warning == ""
+        save.assert_not_called()
+        # Metadata only: the embedded project text is left alone
+        assert "content" not in update.call_args.kwargs
+
+        config = mock_rag_client.get_project_config("field_proj")
+        assert config.metadata["document_types"] == doc_types
+        assert config.metadata["spreadsheet_id"] == "sheet1"
+        assert config.metadata["name"] == "Field Project"
+
+    def test_update_project_config_field_not_found(self, project_tools):
+        """Test updating a field of an unknown project fails."""
+        success, warning = project_tools.update_project_config_field(
+            "nonexistent", "document_types", []
+        )
+
+        assert success is False
+        assert "見つかりません" in warning
+
 
 class TestDeleteProject:
     """Tests for delete_project method."""
@@ -0,0 +1,60 @@
+"""Tests for the RAG client's batched requests."""
+
+from unittest.mock import patch
+
+from spirrow_prismind.integrations.rag_client import CATALOG_PAGE_SIZE, RAGClient
+
+
+def make_client() -> RAGClient:
+    """Create a RAGClient without connecting to a server."""
+    client = RAGClient.__new__(RAGClient)
+    client.collection_name = "prismind"
+    return client
+
+
+class TestRAGClientBatches:
+    """Test cases for RAGClient batch operations."""
+
+    def test_upsert_documents_splits_update_and_add(self):
+        """Test that existing IDs are updated and new ones added, one request each."""
+        client = make_client()
+
+        with patch.object(client, "_make_request", return_value={"ids": ["doc2"]}) as request:
+            result = client.upsert_documents(
+                doc_ids=["doc1", "doc2", "doc3"],
+                contents=["one", "two", "three"],
+                metadatas=[{"n": 1}, {"n": 2}, {"n": 3}],
+            )
+
+        assert result.success is True
+        paths = [call.args[1] for call in request.call_args_list]
+        assert paths == [
+            "/api/v1/collections/prismind/get",
+            "/api/v1/collections/prismind/update",
+            "/api/v1/collections/prismind/add",
+        ]
+        assert request.call_args_list[0].kwargs["json_data"]["ids"] == ["doc1", "doc2", "doc3"]
+        assert request.call_args_list[1].kwargs["json_data"] == {
+            "ids": ["doc2"], "documents": ["two"], "metadatas": [{"n": 2}],
+        }
+        assert request.call_args_list[2].kwargs["json_data"] == {
+            "ids": ["doc1", "doc3"], "documents": ["one", "three"], "metadatas": [{"n": 1}, {"n": 3}],
+        }
+
+    def test_get_catalog_hashes_pages_through_entries(self):
+        """Test that catalog hashes are read page by page until a short page."""
+        client = make_client()
+        full_page = {
+            "metadatas": [
+                {"doc_id": f"doc{i}", "row_hash": f"h{i}"} for i in range(CATALOG_PAGE_SIZE)
+            ]
+        }
+        last_page = {"metadatas": [{"doc_id": "last", "row_hash": "hl"}]}
+
+        with patch.object(client, "_make_request", side_effect=[full_page, last_page]) as request:
+            hashes = client.get_catalog_hashes("proj")
+
+        assert len(hashes) == CATALOG_PAGE_SIZE + 1
+        assert hashes["last"] == "hl"
+        offsets = [call.kwargs["json_data"]["offset"] for call in request.call_args_list]
+        assert offsets == [0, CATALOG_PAGE_SIZE]
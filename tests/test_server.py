@@ -0,0 +1,259 @@
+"""Tests for MCP server tool handlers."""
+
+import asyncio
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from spirrow_prismind import server as server_module
+from spirrow_prismind.models import CreateDocumentResult
+from spirrow_prismind.server import (
+    PrismindServer,
+    _encode_result,
+    _get_tool_validator,
+    _json_default,
+)
+
+
+@pytest.fixture
+def server():
+    """Create an initialized server with no backend clients."""
+    server = PrismindServer()
+    server._initialized = True
+    yield server
+    server._executor.shutdown(wait=True)
+
+
+class CountingHandler:
+    """Tool handler that records its calls and returns a fixed response."""
+
+    def __init__(self, response=None):
+        self.response = {"success": True} if response is None else response
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, server, args):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(timeout=5)
+        return self.response
+
+
+@dataclass
+class ShapedResult:
+    """Result whose to_dict() differs from its fields."""
+
+    name: str
+    updated_at: datetime
+
+    def to_dict(self) -> dict:
+        return {"renamed": self.name}
+
+
+class TestEncodeResult:
+    """Test cases for tool result serialization."""
+
+    def test_dataclass_encodes_fields(self):
+        """Test that dataclasses are encoded by field, never through to_dict()."""
+        result = ShapedResult(name="a", updated_at=datetime(2026, 1, 2, 3, 4, 5))
+        expected = {"result": {"name": "a", "updated_at": "2026-01-02T03:04:05"}}
+
+        assert json.loads(_encode_result({"result": result})) == expected
+        # The stdlib fallback must produce the same output
+        assert json.loads(json.dumps({"result": result}, default=_json_default)) == expected
+
+
+class TestCreateDocumentsTool:
+    """Test cases for the create_documents tool."""
+
+    def test_rejects_empty_documents(self):
+        """Test that an empty documents array fails schema validation."""
+        fastjsonschema = pytest.importorskip("fastjsonschema")
+
+        with pytest.raises(fastjsonschema.JsonSchemaException):
+            _get_tool_validator("create_documents")({"documents": []})
+
+    def test_reports_each_document(self):
+        """Test that each document's outcome, including unknown types, is returned."""
+        server = PrismindServer.__new__(PrismindServer)
+        server._document_tools = MagicMock()
+        server._document_tools.bulk_create_documents.return_value = [
+            CreateDocumentResult(
+                success=True,
+                doc_id="doc1",
+                name="Doc 1",
+                doc_type="設計書",
+                doc_url="https://docs.google.com/document/d/doc1/edit",
+                source="Google Docs",
+                catalog_registered=True,
+                message="ドキュメント 'Doc 1' を作成しました。",
+            ),
+            CreateDocumentResult(
+                success=False,
+                name="Doc 2",
+                doc_type="unknown",
+                unknown_doc_type=True,
+                message="ドキュメントタイプ 'unknown' は登録されていません。",
+            ),
+        ]
+
+        response = server._h_create_documents({
+            "documents": [
+                {"name": "Doc 1", "doc_type": "設計書", "content": "", "phase_task": "P1-T01"},
+                {"name": "Doc 2", "doc_type": "unknown", "content": "", "phase_task": "P1-T02"},
+            ],
+            "project": "proj",
+        })
+
+        assert response["success"] is False
+        assert [doc["doc_id"] for doc in response["documents"]] == ["doc1", ""]
+        assert response["documents"][0]["catalog_registered"] is True
+        assert response["documents"][1]["unknown_doc_type"] is True
+        kwargs = server._document_tools.bulk_create_documents.call_args.kwargs
+        assert kwargs["project"] == "proj"
+        assert kwargs["documents"][1] == {
+            "name": "Doc 2",
+            "doc_type": "unknown",
+            "content": "",
+            "phase_task": "P1-T02",
+            "feature": None,
+            "keywords": None,
+        }
+
+
+class TestReadCache:
+    """Test cases for the read-only tool response cache."""
+
+    async def test_repeat_read_is_cached(self, server):
+        """Test that a repeated successful read is served from the cache."""
+        list_projects = CountingHandler({"success": True, "projects": []})
+        server._handlers["list_projects"] = list_projects
+
+        first = await server._dispatch_tool("list_projects", {})
+        second = await server._dispatch_tool("list_projects", {})
+
+        assert first == second == {"success": True, "projects": []}
+        assert list_projects.calls == 1
+
+    async def test_write_invalidates_cache(self, server):
+        """Test that a write tool clears cached reads."""
+        list_projects = CountingHandler()
+        server._handlers["list_projects"] = list_projects
+        server._handlers["add_task"] = CountingHandler()
+
+        await server._dispatch_tool("list_projects", {})
+        await server._dispatch_tool("add_task", {"name": "Task"})
+        await server._dispatch_tool("list_projects", {})
+
+        assert list_projects.calls == 2
+
+    async def test_read_started_before_write_is_not_cached(self, server):
+        """Test that a read overlapping a write does not repopulate the cache."""
+        list_projects = CountingHandler()
+        list_projects.release.clear()
+        server._handlers["list_projects"] = list_projects
+        server._handlers["add_task"] = CountingHandler()
+
+        read = asyncio.create_task(server._dispatch_tool("list_projects", {}))
+        await asyncio.to_thread(list_projects.started.wait, 5)
+        write = asyncio.create_task(server._dispatch_tool("add_task", {"name": "Task"}))
+        await asyncio.sleep(0)
+        list_projects.release.set()
+        await asyncio.gather(read, write)
+
+        assert server._read_cache == {}
+        await server._dispatch_tool("list_projects", {})
+        assert list_projects.calls == 2
+
+    async def test_failure_is_not_cached(self, server):
+        """Test that failed responses are not cached."""
+        search_catalog = CountingHandler({"success": False, "error": "RAG unavailable"})
+        server._handlers["search_catalog"] = search_catalog
+
+        await server._dispatch_tool("search_catalog", {"query": "spec"})
+        await server._dispatch_tool("search_catalog", {"query": "spec"})
+
+        assert search_catalog.calls == 2
+
+
+class TestCoalescing:
+    """Test cases for sharing identical concurrent read-only calls."""
+
+    async def test_identical_calls_share_one_handler_run(self, server):
+        """Test that identical in-flight reads run the handler once."""
+        get_task = CountingHandler({"success": True, "task_id": "T01"})
+        get_task.release.clear()
+        server._handlers["get_task"] = get_task
+
+        calls = [
+            asyncio.create_task(server._dispatch_tool("get_task", {"task_id": "T01"}))
+            for _ in range(3)
+        ]
+        await asyncio.to_thread(get_task.started.wait, 5)
+        get_task.release.set()
+        results = await asyncio.gather(*calls)
+
+        assert get_task.calls == 1
+        assert all(result is results[0] for result in results)
+        assert server._inflight == {}
+
+
+class TestInitSnapshot:
+    """Test cases for the list_projects snapshot shared across restarts."""
+
+    def test_snapshot_round_trip(self, server, tmp_path):
+        """Test that a saved snapshot seeds the cache of the next server."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("")
+        response = {"success": True, "projects": []}
+        server._read_cache[("list_projects", "{}")] = (server_module.time.monotonic(), response)
+
+        with patch.object(server_module, "_INIT_SNAPSHOT_PATH", tmp_path / "init.snapshot"), \
+                patch.object(server_module, "_CONFIG_PATH", str(config_path)):
+            server._save_init_snapshot()
+            restarted = PrismindServer()
+            restarted._load_init_snapshot()
+
+        assert restarted._read_cache[("list_projects", "{}")][1] == response
+
+    def test_snapshot_rejected_after_config_change(self, server, tmp_path):
+        """Test that the snapshot is ignored once the config file changes."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("")
+        server._read_cache[("list_projects", "{}")] = (
+            server_module.time.monotonic(), {"success": True, "projects": []},
+        )
+
+        with patch.object(server_module, "_INIT_SNAPSHOT_PATH", tmp_path / "init.snapshot"), \
+                patch.object(server_module, "_CONFIG_PATH", str(config_path)):
+            server._save_init_snapshot()
+            mtime_ns = os.stat(config_path).st_mtime_ns
+            os.utime(config_path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+            restarted = PrismindServer()
+            restarted._load_init_snapshot()
+
+        assert restarted._read_cache == {}
+
+
+class TestArgumentValidation:
+    """Test cases for tool argument validation."""
+
+    async def test_invalid_arguments_are_rejected(self, server):
+        """Test that arguments failing the schema never reach the handler."""
+        pytest.importorskip("fastjsonschema")
+        create_documents = CountingHandler()
+        server._handlers["create_documents"] = create_documents
+
+        contents = await server._handle_tool_call("create_documents", {"documents": []})
+
+        response = json.loads(contents[0].text)
+        assert response["success"] is False
+        assert response["error"].startswith("Input validation error")
+        assert create_documents.calls == 0
@@ -6,6 +6,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from spirrow_prismind.models import (
+    GetConnectionInfoResult,
+    GoogleConnectionInfo,
+    ServiceConnectionInfo,
+)
 from spirrow_prismind.tools.setup_tools import SetupTools, SETTINGS_REGISTRY
 
 
@@ -268,3 +273,30 @@ class TestSettingsRegistry:
         """Test that all settings have descriptions."""
         for key, setting in SETTINGS_REGISTRY.items():
             assert setting.get("description_ja"), f"{key} should have description_ja"
+
+
+class TestConnectionInfoToDict:
+    """Tests for GetConnectionInfoResult.to_dict response shape."""
+
+    def test_to_dict_omits_missing_sections(self):
+        """Test that unavailable sections are omitted."""
+        result = GetConnectionInfoResult(success=True, message="OK")
+
+        assert result.to_dict() == {"success": True, "message": "OK"}
+
+    def test_to_dict_includes_collection_for_rag_only(self):
+        """Test that only the RAG section carries the collection name."""
+        result = GetConnectionInfoResult(
+            success=True,
+            memory_server=ServiceConnectionInfo(name="Memory", url="http://memory"),
+            rag_server=ServiceConnectionInfo(
+                name="RAG", url="http://rag", collection="prismind"
+            ),
+            google=GoogleConnectionInfo(authenticated=True, scopes=["drive"]),
+        )
+
+        data = result.to_dict()
+
+        assert "collection" not in data["memory_server"]
+        assert data["rag_server"]["collection"] == "prismind"
+        assert data["google"] == {"authenticated": True, "user": "", "scopes": ["drive"]}
@@ -129,6 +129,29 @@ class TestServiceStatus:
 
         assert status.available is False
 
+    def test_service_status_to_dict(self):
+        """Test ServiceStatus.to_dict with and without details."""
+        status = ServiceStatus(
+            name="RAG Server",
+            available=True,
+            url="http://localhost:8000",
+            message="接続成功",
+            protocol="rest",
+            latency_ms=12.5,
+        )
+
+        assert status.to_dict() == {
+            "name": "RAG Server",
+            "available": True,
+            "url": "http://localhost:8000",
+            "message": "接続成功",
+        }
+        detailed = status.to_dict(detailed=True)
+        assert detailed["protocol"] == "rest"
+        assert detailed["latency_ms"] == 12.5
+        assert "version" in detailed
+        assert "last_checked" in detailed
+
 
 class TestCheckServicesResult:
     """Tests for CheckServicesResult dataclass."""
@@ -164,6 +187,24 @@ class TestCheckServicesResult:
         assert result.success is True
         assert result.all_required_available is False
 
+    def test_check_services_result_to_dict(self):
+        """Test CheckServicesResult.to_dict response shape."""
+        result = CheckServicesResult(
+            success=True,
+            services=[ServiceStatus(name="RAG", available=True, url="http://rag")],
+            all_required_available=True,
+            message="OK",
+        )
+
+        data = result.to_dict()
+
+        assert data["success"] is True
+        assert data["all_available"] is True
+        assert data["services"] == [
+            {"name": "RAG", "available": True, "url": "http://rag", "message": ""}
+        ]
+        assert data["message"] == "OK"
+
 
 class TestInitialProgressData:
     """Tests for INITIAL_PROGRESS_DATA constant."""